@@ -0,0 +1,216 @@
+import asyncio
+import random
+from typing import Generic, List, Sequence, TypeVar
+
+T = TypeVar('T')
+
+class AsyncBoundedBlockingQueue(Generic[T]):
+    """
+    A bounded queue for coroutines, backed by asyncio.Queue.
+
+    Offers the same put()/get() interface as BoundedBlockingQueue, but as coroutines
+    that suspend instead of blocking a thread. Waiting is an event-loop callback rather
+    than an OS condition variable, so thousands of I/O-bound consumers can share one
+    thread at a few KB each. Not thread-safe: use it from a single event loop only.
+    Shutdown uses sentinel values (None), one per consumer.
+
+    Attributes:
+        capacity (int): The maximum number of items the queue can hold.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """
+        Initialize the queue with a specific capacity.
+
+        Args:
+            capacity (int): Maximum number of items. Must be > 0.
+        """
+        if capacity <= 0:
+            raise ValueError("Capacity must be greater than 0")
+
+        self.capacity = capacity
+        self._q: "asyncio.Queue[T]" = asyncio.Queue(capacity)
+
+    async def put(self, item: T) -> None:
+        """
+        Add an item to the queue.
+        Suspends if the queue is full until space becomes available.
+
+        Args:
+            item (T): The item to add.
+        """
+        await self._q.put(item)
+
+    async def put_many(self, items: Sequence[T]) -> None:
+        """
+        Add several items to the queue, in order.
+
+        Args:
+            items (Sequence[T]): The items to add.
+        """
+        for item in items:
+            await self._q.put(item)
+
+    async def get(self) -> T:
+        """
+        Remove and return an item from the queue.
+        Suspends if the queue is empty until an item is available.
+
+        Returns:
+            T: The item removed from the queue.
+        """
+        return await self._q.get()
+
+    async def get_many(self, max_items: int) -> List[T]:
+        """
+        Remove and return up to max_items items.
+        Suspends until at least one item is available, then takes whatever else is ready.
+
+        Args:
+            max_items (int): Maximum number of items to remove. Must be > 0.
+
+        Returns:
+            List[T]: Between 1 and max_items items, in FIFO order.
+        """
+        if max_items <= 0:
+            raise ValueError("max_items must be greater than 0")
+
+        items = [await self._q.get()]
+        while len(items) < max_items and not self._q.empty():
+            items.append(self._q.get_nowait())
+        return items
+
+    def qsize(self) -> int:
+        """
+        Return the size of the queue.
+
+        Returns:
+            int: Number of items in the queue.
+        """
+        return self._q.qsize()
+
+    approx_qsize = qsize
+
+class AsyncProducer:
+    """
+    Producer coroutine worker that generates items and puts them into the queue.
+    Mirrors Producer, with asyncio.sleep() standing in for I/O-bound work.
+    """
+
+    def __init__(self, thread_id: int, queue: AsyncBoundedBlockingQueue, items_to_produce: int, delay_range: tuple[float, float] = (0.01, 0.1), verbose: bool = False) -> None:
+        """
+        Initialize the AsyncProducer.
+
+        Args:
+            thread_id (int): Identifier for the worker.
+            queue (AsyncBoundedBlockingQueue): The shared queue.
+            items_to_produce (int): Number of items to generate.
+            delay_range (tuple): Min and max delay in seconds between items.
+            verbose (bool): Print progress for every item.
+        """
+        self.name = f"Producer-{thread_id}"
+        self.thread_id = thread_id
+        self.queue = queue
+        self.items_to_produce = items_to_produce
+        self.delay_range = delay_range
+        self.verbose = verbose
+
+    async def run(self) -> None:
+        """
+        Generate the configured number of items and put them into the queue.
+        """
+        if self.verbose:
+            print(f"[{self.name}] Started.")
+        uniform = random.Random().uniform
+        low, high = self.delay_range
+        for i in range(1, self.items_to_produce + 1):
+            item = f"Item-{self.thread_id}-{i}"
+
+            # Simulate I/O-bound work
+            await asyncio.sleep(uniform(low, high))
+
+            await self.queue.put(item)
+            if self.verbose:
+                print(f"[{self.name}] Put {item} into queue (Size: {self.queue.qsize()})")
+
+        if self.verbose:
+            print(f"[{self.name}] Finished producing {self.items_to_produce} items.")
+
+class AsyncConsumer:
+    """
+    Consumer coroutine worker that retrieves items from the queue and processes them.
+    Stops when it receives a sentinel value (None).
+    """
+
+    def __init__(self, thread_id: int, queue: AsyncBoundedBlockingQueue, delay_range: tuple[float, float] = (0.05, 0.2), verbose: bool = False) -> None:
+        """
+        Initialize the AsyncConsumer.
+
+        Args:
+            thread_id (int): Identifier for the worker.
+            queue (AsyncBoundedBlockingQueue): The shared queue.
+            delay_range (tuple): Min and max delay in seconds for processing.
+            verbose (bool): Print progress for every item.
+        """
+        self.name = f"Consumer-{thread_id}"
+        self.thread_id = thread_id
+        self.queue = queue
+        self.delay_range = delay_range
+        self.verbose = verbose
+        self.consumed_count = 0
+
+    async def run(self) -> None:
+        """
+        Retrieve and process items until a sentinel value (None) is retrieved.
+        """
+        if self.verbose:
+            print(f"[{self.name}] Started.")
+        uniform = random.Random().uniform
+        low, high = self.delay_range
+        while True:
+            item = await self.queue.get()
+            if item is None:
+                # Sentinel value received, stop consuming
+                if self.verbose:
+                    print(f"[{self.name}] Received stop signal. Exiting.")
+                break
+
+            # Simulate I/O-bound processing
+            await asyncio.sleep(uniform(low, high))
+            self.consumed_count += 1
+            if self.verbose:
+                print(f"[{self.name}] Processed {item}")
+
+        if self.verbose:
+            print(f"[{self.name}] Finished. Total consumed: {self.consumed_count}")
+
+async def async_main() -> None:
+    """
+    Asyncio counterpart of main(): the same demo run as coroutines on one event loop.
+    """
+    print("=== Producer-Consumer Challenge Demo (asyncio) ===")
+
+    # Configuration
+    QUEUE_CAPACITY = 5
+    NUM_PRODUCERS = 2
+    NUM_CONSUMERS = 3
+    ITEMS_PER_PRODUCER = 10
+
+    queue: AsyncBoundedBlockingQueue = AsyncBoundedBlockingQueue(QUEUE_CAPACITY)
+    producers = [AsyncProducer(i + 1, queue, ITEMS_PER_PRODUCER, verbose=True) for i in range(NUM_PRODUCERS)]
+    consumers = [AsyncConsumer(i + 1, queue, verbose=True) for i in range(NUM_CONSUMERS)]
+
+    consumer_tasks = [asyncio.create_task(c.run()) for c in consumers]
+    try:
+        await asyncio.gather(*(p.run() for p in producers))
+        print("--- All Producers Finished ---")
+    finally:
+        # One sentinel per consumer, sent even if a producer failed
+        print("--- Sending Shutdown Signal ---")
+        await queue.put_many([None] * NUM_CONSUMERS)
+    await asyncio.gather(*consumer_tasks)
+
+    print("=== Demo Completed Successfully ===")
+
+if __name__ == "__main__":
+    asyncio.run(async_main())
@@ -1,21 +1,35 @@
+import itertools
+import os
+import queue
 import threading
-from typing import Generic, TypeVar, List, Optional
+from collections import deque
+from typing import Deque, Generic, List, Sequence, Tuple, TypeVar, Optional
 import time
 
 T = TypeVar('T')
 
+class QueueShutDown(Exception):
+    """
+    Raised by put() on a queue that has been shut down, and by get() once a
+    shut-down queue has been drained.
+    """
+
 class BoundedBlockingQueue(Generic[T]):
     """
     A thread-safe bounded blocking queue implemented using threading.Condition.
     
     Attributes:
         capacity (int): The maximum number of items the queue can hold.
-        queue (List[T]): Internal storage for queue items.
+        queue (Deque[T]): Internal FIFO storage for queue items (O(1) append/popleft).
         lock (threading.Lock): Lock for thread safety.
-        not_full (threading.Condition): Condition variable for "not full" state.
-        not_empty (threading.Condition): Condition variable for "not empty" state.
+        cond (threading.Condition): Single condition variable shared by producers and consumers.
     """
 
+    # Non-blocking attempts put()/get() make, yielding the GIL in between, before
+    # falling back to cond.wait(). Trades a little idle CPU for fewer blocking
+    # waits when producers and consumers run at closely matched rates. 0 disables.
+    SPIN_COUNT = 3
+
     def __init__(self, capacity: int) -> None:
         """
         Initialize the queue with a specific capacity.
@@ -27,11 +41,16 @@ class BoundedBlockingQueue(Generic[T]):
             raise ValueError("Capacity must be greater than 0")
         
         self.capacity = capacity
-        self.queue: List[T] = []
+        self.queue: Deque[T] = deque()
         self.lock = threading.Lock()
-        # Condition variables share the same lock
-        self.not_full = threading.Condition(self.lock)
-        self.not_empty = threading.Condition(self.lock)
+        # One condition for both sides; producers wait for "not full" and
+        # consumers wait for "not empty" using separate predicates.
+        self.cond = threading.Condition(self.lock)
+        # Number of threads currently blocked in put()/get(). Lets each side
+        # skip notify() when nobody on the other side is waiting.
+        self._waiting_putters = 0
+        self._waiting_getters = 0
+        self._shutdown = False
 
     def put(self, item: T) -> None:
         """
@@ -40,34 +59,264 @@ class BoundedBlockingQueue(Generic[T]):
 
         Args:
             item (T): The item to add.
+
+        Raises:
+            QueueShutDown: If the queue has been shut down.
         """
-        with self.not_full:
-            while len(self.queue) >= self.capacity:
+        for _ in range(self.SPIN_COUNT):
+            if self._try_put(item):
+                return
+            time.sleep(0)
+
+        with self.cond:
+            while not self._shutdown and len(self.queue) >= self.capacity:
                 # Wait until there is space
-                self.not_full.wait()
+                self._waiting_putters += 1
+                try:
+                    self.cond.wait()
+                finally:
+                    self._waiting_putters -= 1
+            if self._shutdown:
+                raise QueueShutDown
             
             self.queue.append(item)
             # Notify consumers that an item is available
-            self.not_empty.notify()
+            self._notify(self._waiting_getters, self._waiting_putters)
 
-    def get(self) -> T:
+    def put_many(self, items: Sequence[T]) -> None:
+        """
+        Add several items to the queue under a single lock acquisition.
+        Blocks until there is room for all of them at once, then wakes up to
+        len(items) consumers with a single notify(n).
+
+        Args:
+            items (Sequence[T]): The items to add, in order.
+
+        Raises:
+            ValueError: If more items are given than the queue can ever hold.
+            QueueShutDown: If the queue has been shut down.
+        """
+        n = len(items)
+        if n > self.capacity:
+            raise ValueError("Cannot put more items than the queue capacity at once")
+        if n == 0:
+            return
+
+        with self.cond:
+            while not self._shutdown and self.capacity - len(self.queue) < n:
+                # Wait until there is space for the whole batch
+                self._waiting_putters += 1
+                try:
+                    self.cond.wait()
+                finally:
+                    self._waiting_putters -= 1
+            if self._shutdown:
+                raise QueueShutDown
+
+            self.queue.extend(items)
+            # Notify up to n consumers that items are available
+            self._notify(self._waiting_getters, self._waiting_putters, n)
+
+    def get(self, timeout: Optional[float] = None) -> T:
         """
         Remove and return an item from the queue.
         Blocks if the queue is empty until an item is available.
 
+        Args:
+            timeout (Optional[float]): Maximum seconds to block. None blocks indefinitely.
+
         Returns:
             T: The item removed from the queue.
+
+        Raises:
+            queue.Empty: If the timeout expires before an item is available.
+            QueueShutDown: If the queue has been shut down and is empty.
         """
-        with self.not_empty:
+        for _ in range(self.SPIN_COUNT):
+            found, item = self._try_get()
+            if found:
+                return item
+            time.sleep(0)
+
+        with self.cond:
+            if timeout is not None:
+                deadline = time.monotonic() + timeout
             while len(self.queue) == 0:
+                if self._shutdown:
+                    raise QueueShutDown
+                if timeout is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise queue.Empty
+                else:
+                    remaining = None
                 # Wait until there is an item
-                self.not_empty.wait()
+                self._waiting_getters += 1
+                try:
+                    self.cond.wait(remaining)
+                finally:
+                    self._waiting_getters -= 1
             
-            item = self.queue.pop(0)
+            item = self.queue.popleft()
             # Notify producers that there is space
-            self.not_full.notify()
+            self._notify(self._waiting_putters, self._waiting_getters)
             return item
 
+    def get_many(self, max_items: int) -> List[T]:
+        """
+        Remove and return up to max_items items under a single lock acquisition.
+        Blocks if the queue is empty until at least one item is available, then
+        wakes up to as many producers as items were removed with one notify(n).
+
+        Args:
+            max_items (int): Maximum number of items to remove. Must be > 0.
+
+        Returns:
+            List[T]: Between 1 and max_items items, in FIFO order.
+
+        Raises:
+            QueueShutDown: If the queue has been shut down and is empty.
+        """
+        if max_items <= 0:
+            raise ValueError("max_items must be greater than 0")
+
+        with self.cond:
+            while len(self.queue) == 0:
+                if self._shutdown:
+                    raise QueueShutDown
+                # Wait until there is an item
+                self._waiting_getters += 1
+                try:
+                    self.cond.wait()
+                finally:
+                    self._waiting_getters -= 1
+
+            popleft = self.queue.popleft
+            items = [popleft() for _ in range(min(max_items, len(self.queue)))]
+            # Notify producers that there is space
+            self._notify(self._waiting_putters, self._waiting_getters, len(items))
+            return items
+
+    def put_nowait(self, item: T) -> None:
+        """
+        Add an item to the queue without waiting for space.
+
+        Args:
+            item (T): The item to add.
+
+        Raises:
+            queue.Full: If the queue is full.
+            QueueShutDown: If the queue has been shut down.
+        """
+        with self.cond:
+            if self._shutdown:
+                raise QueueShutDown
+            if len(self.queue) >= self.capacity:
+                raise queue.Full
+
+            self.queue.append(item)
+            # Notify consumers that an item is available
+            self._notify(self._waiting_getters, self._waiting_putters)
+
+    def get_nowait(self) -> T:
+        """
+        Remove and return an item from the queue without waiting for one.
+
+        Returns:
+            T: The item removed from the queue.
+
+        Raises:
+            queue.Empty: If the queue is empty.
+            QueueShutDown: If the queue has been shut down and is empty.
+        """
+        with self.cond:
+            if len(self.queue) == 0:
+                if self._shutdown:
+                    raise QueueShutDown
+                raise queue.Empty
+
+            item = self.queue.popleft()
+            # Notify producers that there is space
+            self._notify(self._waiting_putters, self._waiting_getters)
+            return item
+
+    def _try_put(self, item: T) -> bool:
+        """
+        Add an item only if the lock is free and there is space, without blocking at all.
+
+        Args:
+            item (T): The item to add.
+
+        Returns:
+            bool: True if the item was added.
+        """
+        if not self.lock.acquire(blocking=False):
+            return False
+        try:
+            if self._shutdown or len(self.queue) >= self.capacity:
+                return False
+            self.queue.append(item)
+            self._notify(self._waiting_getters, self._waiting_putters)
+            return True
+        finally:
+            self.lock.release()
+
+    def _try_get(self) -> Tuple[bool, Optional[T]]:
+        """
+        Remove an item only if the lock is free and the queue is non-empty, without blocking at all.
+
+        Returns:
+            Tuple[bool, Optional[T]]: (True, item) on success, otherwise (False, None).
+                The flag is needed because None is a valid item (sentinel).
+        """
+        if not self.lock.acquire(blocking=False):
+            return False, None
+        try:
+            if len(self.queue) == 0:
+                return False, None
+            item = self.queue.popleft()
+            self._notify(self._waiting_putters, self._waiting_getters)
+            return True, item
+        finally:
+            self.lock.release()
+
+    def shutdown(self) -> None:
+        """
+        Shut the queue down, waking every blocked producer and consumer.
+
+        Further put() calls raise QueueShutDown. Consumers keep receiving the
+        items already queued and get QueueShutDown once it is empty, so one call
+        stops any number of consumers without using up queue slots for sentinels.
+        notify_all() is fine here: every woken thread exits instead of
+        re-contending for the lock.
+        """
+        with self.cond:
+            self._shutdown = True
+            self.cond.notify_all()
+
+    def _notify(self, other_side: int, same_side: int, n: int = 1) -> None:
+        """
+        Wake up to n waiters on the other side of the queue. Must hold the lock.
+
+        With a single condition, notify() wakes the longest-waiting threads
+        whatever side they are on. When both producers and consumers are
+        blocked, a targeted wake could land on the wrong side and be lost,
+        so fall back to notify_all() in that (rare) mixed case. Otherwise
+        never use notify_all(): waking every waiter only to have all but n
+        re-block on the lock is the thundering-herd pattern.
+
+        Args:
+            other_side (int): Number of waiters that can make progress now.
+            same_side (int): Number of waiters that cannot.
+            n (int): Number of waiters that can make progress.
+        """
+        if other_side == 0:
+            return
+        if same_side == 0:
+            self.cond.notify(min(n, other_side))
+        else:
+            self.cond.notify_all()
+
     def qsize(self) -> int:
         """
         Return the approximate size of the queue.
@@ -77,3 +326,499 @@ class BoundedBlockingQueue(Generic[T]):
         """
         with self.lock:
             return len(self.queue)
+
+    def approx_qsize(self) -> int:
+        """
+        Return the queue size without taking the lock.
+
+        len() of a deque is a single atomic read under the GIL, so this is safe
+        but may be stale by the time the caller uses it. Meant for logging and
+        display, not for decisions.
+
+        Returns:
+            int: Number of items in the queue.
+        """
+        return len(self.queue)
+
+
+class ShardedBoundedBlockingQueue(Generic[T]):
+    """
+    A bounded blocking queue split into independently locked BoundedBlockingQueue shards.
+
+    Producers are spread across shards round-robin and consumers probe the shards
+    starting from a rotating offset, so concurrent threads mostly contend on
+    different locks instead of a single one. A consumer that finds every shard
+    empty sleeps on one condition shared by all shards, which producers only
+    touch while a consumer is actually waiting. Ordering is FIFO within each shard
+    only, and a put() blocks when its target shard is full even if others have room.
+    Because a sentinel can overtake items sitting in other shards, prefer shutdown()
+    or wait for qsize() to reach 0 before sending sentinel-style shutdown signals.
+
+    Attributes:
+        capacity (int): The maximum number of items across all shards.
+        shards (List[BoundedBlockingQueue[T]]): The underlying per-shard queues.
+    """
+
+    def __init__(self, capacity: int, shards: Optional[int] = None) -> None:
+        """
+        Initialize the queue, dividing the capacity evenly between shards.
+
+        Args:
+            capacity (int): Maximum number of items across all shards. Must be > 0.
+            shards (Optional[int]): Number of shards. Defaults to the CPU count,
+                capped at the capacity. Must be between 1 and capacity.
+        """
+        if capacity <= 0:
+            raise ValueError("Capacity must be greater than 0")
+        if shards is None:
+            shards = min(os.cpu_count() or 1, capacity)
+        if not 0 < shards <= capacity:
+            raise ValueError("Shard count must be between 1 and capacity")
+
+        self.capacity = capacity
+        base, extra = divmod(capacity, shards)
+        self.shards: List[BoundedBlockingQueue[T]] = [
+            BoundedBlockingQueue(base + (1 if i < extra else 0)) for i in range(shards)
+        ]
+        # next() on itertools.count is atomic under the GIL, so no lock is needed
+        self._put_counter = itertools.count()
+        self._get_counter = itertools.count()
+        # Wakes consumers blocked because every shard was empty. _put_seq is
+        # bumped on each put made while a consumer waits, so a consumer can tell
+        # whether anything arrived since it last probed.
+        self._available = threading.Condition()
+        self._waiting_getters = 0
+        self._put_seq = 0
+        self._shutdown = False
+
+    def put(self, item: T) -> None:
+        """
+        Add an item to the next shard in round-robin order.
+        Blocks if that shard is full until space becomes available.
+
+        Args:
+            item (T): The item to add.
+
+        Raises:
+            QueueShutDown: If the queue has been shut down.
+        """
+        self.shards[next(self._put_counter) % len(self.shards)].put(item)
+        self._notify_getter()
+
+    def put_many(self, items: Sequence[T]) -> None:
+        """
+        Add several items, spreading them across shards in round-robin order.
+
+        Args:
+            items (Sequence[T]): The items to add.
+        """
+        for item in items:
+            self.put(item)
+
+    def get(self, timeout: Optional[float] = None) -> T:
+        """
+        Remove and return an item from any shard.
+        Blocks if every shard is empty until an item is available.
+
+        Args:
+            timeout (Optional[float]): Maximum seconds to block. None blocks indefinitely.
+
+        Returns:
+            T: The item removed from the queue.
+
+        Raises:
+            queue.Empty: If the timeout expires before an item is available.
+            QueueShutDown: If the queue has been shut down and every shard is empty.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            found, item = self._probe()
+            if found:
+                return item
+
+            with self._available:
+                self._waiting_getters += 1
+                seq = self._put_seq
+            try:
+                # Probe again now that producers can see this waiter: an item put
+                # before the registration did not bump _put_seq
+                found, item = self._probe()
+                if found:
+                    return item
+                with self._available:
+                    while self._put_seq == seq and not self._shutdown:
+                        if deadline is None:
+                            self._available.wait()
+                            continue
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            raise queue.Empty
+                        self._available.wait(remaining)
+            finally:
+                with self._available:
+                    self._waiting_getters -= 1
+
+    def get_many(self, max_items: int) -> List[T]:
+        """
+        Remove and return up to max_items items from any shards.
+        Blocks like get() for the first item, then takes whatever else is
+        already queued without waiting.
+
+        Args:
+            max_items (int): Maximum number of items to remove. Must be > 0.
+
+        Returns:
+            List[T]: Between 1 and max_items items, FIFO within each shard.
+
+        Raises:
+            QueueShutDown: If the queue has been shut down and every shard is empty.
+        """
+        if max_items <= 0:
+            raise ValueError("max_items must be greater than 0")
+
+        items = [self.get()]
+        num_shards = len(self.shards)
+        start = next(self._get_counter) % num_shards
+        for offset in range(num_shards):
+            shard = self.shards[(start + offset) % num_shards]
+            while len(items) < max_items:
+                try:
+                    items.append(shard.get_nowait())
+                except (queue.Empty, QueueShutDown):
+                    break
+        return items
+
+    def put_nowait(self, item: T) -> None:
+        """
+        Add an item to the first shard with room, starting from the round-robin shard.
+
+        Args:
+            item (T): The item to add.
+
+        Raises:
+            queue.Full: If every shard is full.
+            QueueShutDown: If the queue has been shut down.
+        """
+        num_shards = len(self.shards)
+        start = next(self._put_counter) % num_shards
+        for offset in range(num_shards):
+            try:
+                self.shards[(start + offset) % num_shards].put_nowait(item)
+            except queue.Full:
+                continue
+            self._notify_getter()
+            return
+        raise queue.Full
+
+    def get_nowait(self) -> T:
+        """
+        Remove and return an item from any shard without waiting for one.
+
+        Returns:
+            T: The item removed from the queue.
+
+        Raises:
+            queue.Empty: If every shard is empty.
+            QueueShutDown: If the queue has been shut down and every shard is empty.
+        """
+        found, item = self._probe()
+        if not found:
+            raise queue.Empty
+        return item
+
+    def _probe(self) -> Tuple[bool, Optional[T]]:
+        """
+        Take an item from the first non-empty shard, starting from a rotating offset.
+
+        Returns:
+            Tuple[bool, Optional[T]]: (True, item) on success, otherwise (False, None).
+                The flag is needed because None is a valid item (sentinel).
+
+        Raises:
+            QueueShutDown: If every shard has been shut down and is empty.
+        """
+        num_shards = len(self.shards)
+        start = next(self._get_counter) % num_shards
+        drained = 0
+        for offset in range(num_shards):
+            try:
+                return True, self.shards[(start + offset) % num_shards].get_nowait()
+            except queue.Empty:
+                continue
+            except QueueShutDown:
+                drained += 1
+        if drained == num_shards:
+            raise QueueShutDown
+        return False, None
+
+    def _notify_getter(self) -> None:
+        """
+        Wake one consumer blocked in get() after an item was added.
+
+        The unlocked read of _waiting_getters keeps producers off the shared lock
+        while no consumer waits. It cannot miss one: a consumer registers before
+        its final probe, so if the count still read 0, that probe sees the item.
+        """
+        if self._waiting_getters:
+            with self._available:
+                self._put_seq += 1
+                self._available.notify()
+
+    def shutdown(self) -> None:
+        """
+        Shut down every shard. Consumers drain all shards before getting QueueShutDown.
+        """
+        for shard in self.shards:
+            shard.shutdown()
+        with self._available:
+            self._shutdown = True
+            self._available.notify_all()
+
+    def qsize(self) -> int:
+        """
+        Return the approximate size of the queue across all shards.
+
+        Returns:
+            int: Number of items in the queue.
+        """
+        return sum(shard.qsize() for shard in self.shards)
+
+    def approx_qsize(self) -> int:
+        """
+        Return the size across all shards without taking any shard lock.
+
+        Returns:
+            int: Number of items in the queue.
+        """
+        return sum(shard.approx_qsize() for shard in self.shards)
+
+
+class StdlibBoundedBlockingQueue(Generic[T]):
+    """
+    Alternative to BoundedBlockingQueue backed by the standard library's queue.Queue.
+
+    Offers the same interface (blocking, timed and non-blocking get/put, and
+    shutdown()), with queue.Queue providing the storage, the mutex and its
+    not_empty/not_full condition pair. The waits are written here rather than
+    delegated to queue.Queue.get()/put(), which before Python 3.13 cannot be
+    woken by a shutdown.
+
+    Attributes:
+        capacity (int): The maximum number of items the queue can hold.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """
+        Initialize the queue with a specific capacity.
+
+        Args:
+            capacity (int): Maximum number of items. Must be > 0.
+        """
+        if capacity <= 0:
+            raise ValueError("Capacity must be greater than 0")
+
+        self.capacity = capacity
+        self._q: "queue.Queue[T]" = queue.Queue(capacity)
+        self._shutdown = False
+        # put_many() callers blocked waiting for room for a whole batch
+        self._batch_putters = 0
+
+    def put(self, item: T) -> None:
+        """
+        Add an item to the queue.
+        Blocks if the queue is full until space becomes available.
+
+        Args:
+            item (T): The item to add.
+
+        Raises:
+            QueueShutDown: If the queue has been shut down.
+        """
+        q = self._q
+        with q.not_full:
+            while not self._shutdown and q._qsize() >= self.capacity:
+                q.not_full.wait()
+            if self._shutdown:
+                raise QueueShutDown
+            q._put(item)
+            q.not_empty.notify()
+
+    def put_many(self, items: Sequence[T]) -> None:
+        """
+        Add several items to the queue under a single lock acquisition.
+        Blocks until there is room for all of them at once.
+
+        Args:
+            items (Sequence[T]): The items to add, in order.
+
+        Raises:
+            ValueError: If more items are given than the queue can ever hold.
+            QueueShutDown: If the queue has been shut down.
+        """
+        n = len(items)
+        if n > self.capacity:
+            raise ValueError("Cannot put more items than the queue capacity at once")
+        if n == 0:
+            return
+
+        q = self._q
+        with q.not_full:
+            while not self._shutdown and self.capacity - q._qsize() < n:
+                self._batch_putters += 1
+                try:
+                    q.not_full.wait()
+                finally:
+                    self._batch_putters -= 1
+            if self._shutdown:
+                raise QueueShutDown
+            for item in items:
+                q._put(item)
+            q.not_empty.notify(n)
+
+    def get(self, timeout: Optional[float] = None) -> T:
+        """
+        Remove and return an item from the queue.
+        Blocks if the queue is empty until an item is available.
+
+        Args:
+            timeout (Optional[float]): Maximum seconds to block. None blocks indefinitely.
+
+        Returns:
+            T: The item removed from the queue.
+
+        Raises:
+            queue.Empty: If the timeout expires before an item is available.
+            QueueShutDown: If the queue has been shut down and is empty.
+        """
+        q = self._q
+        with q.not_empty:
+            if timeout is not None:
+                deadline = time.monotonic() + timeout
+            while not q._qsize():
+                if self._shutdown:
+                    raise QueueShutDown
+                if timeout is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise queue.Empty
+                else:
+                    remaining = None
+                q.not_empty.wait(remaining)
+            item = q._get()
+            self._notify_not_full()
+            return item
+
+    def get_many(self, max_items: int) -> List[T]:
+        """
+        Remove and return up to max_items items under a single lock acquisition.
+        Blocks if the queue is empty until at least one item is available.
+
+        Args:
+            max_items (int): Maximum number of items to remove. Must be > 0.
+
+        Returns:
+            List[T]: Between 1 and max_items items, in FIFO order.
+
+        Raises:
+            QueueShutDown: If the queue has been shut down and is empty.
+        """
+        if max_items <= 0:
+            raise ValueError("max_items must be greater than 0")
+
+        q = self._q
+        with q.not_empty:
+            while not q._qsize():
+                if self._shutdown:
+                    raise QueueShutDown
+                q.not_empty.wait()
+            items = [q._get() for _ in range(min(max_items, q._qsize()))]
+            self._notify_not_full(len(items))
+            return items
+
+    def put_nowait(self, item: T) -> None:
+        """
+        Add an item to the queue without waiting for space.
+
+        Args:
+            item (T): The item to add.
+
+        Raises:
+            queue.Full: If the queue is full.
+            QueueShutDown: If the queue has been shut down.
+        """
+        q = self._q
+        with q.mutex:
+            if self._shutdown:
+                raise QueueShutDown
+            if q._qsize() >= self.capacity:
+                raise queue.Full
+            q._put(item)
+            q.not_empty.notify()
+
+    def get_nowait(self) -> T:
+        """
+        Remove and return an item from the queue without waiting for one.
+
+        Returns:
+            T: The item removed from the queue.
+
+        Raises:
+            queue.Empty: If the queue is empty.
+            QueueShutDown: If the queue has been shut down and is empty.
+        """
+        q = self._q
+        with q.mutex:
+            if not q._qsize():
+                if self._shutdown:
+                    raise QueueShutDown
+                raise queue.Empty
+            item = q._get()
+            self._notify_not_full()
+            return item
+
+    def _notify_not_full(self, n: int = 1) -> None:
+        """
+        Wake producers after n slots were freed. Must hold the mutex.
+
+        A targeted notify(n) could land on a put_many() caller that still lacks
+        room for its batch while a single-item put() could proceed, so wake
+        every producer whenever a batched one is waiting.
+
+        Args:
+            n (int): Number of slots freed.
+        """
+        if self._batch_putters:
+            self._q.not_full.notify_all()
+        else:
+            self._q.not_full.notify(n)
+
+    def shutdown(self) -> None:
+        """
+        Shut the queue down, waking every blocked producer and consumer.
+
+        Same semantics as BoundedBlockingQueue.shutdown(): put() raises
+        QueueShutDown, and get() drains the remaining items first.
+        """
+        q = self._q
+        with q.mutex:
+            self._shutdown = True
+            q.not_full.notify_all()
+            q.not_empty.notify_all()
+
+    def qsize(self) -> int:
+        """
+        Return the approximate size of the queue.
+
+        Returns:
+            int: Number of items in the queue.
+        """
+        return self._q.qsize()
+
+    def approx_qsize(self) -> int:
+        """
+        Return the queue size without taking queue.Queue's mutex.
+
+        Returns:
+            int: Number of items in the queue.
+        """
+        return len(self._q.queue)
@@ -2,15 +2,15 @@ import threading
 import time
 import random
 from typing import Any
-from .blocking_queue import BoundedBlockingQueue
+from .blocking_queue import BoundedBlockingQueue, QueueShutDown
 
 class Consumer(threading.Thread):
     """
     Consumer thread that retrieves items from the queue and processes them.
-    Stops when it receives a sentinel value (None).
+    Stops when the queue is shut down and drained, or when it receives a sentinel value (None).
     """
 
-    def __init__(self, thread_id: int, queue: BoundedBlockingQueue, delay_range: tuple[float, float] = (0.05, 0.2)) -> None:
+    def __init__(self, thread_id: int, queue: BoundedBlockingQueue, delay_range: tuple[float, float] = (0.05, 0.2), batch_size: int = 1, verbose: bool = False) -> None:
         """
         Initialize the Consumer.
 
@@ -18,11 +18,17 @@ class Consumer(threading.Thread):
             thread_id (int): Identifier for the thread.
             queue (BoundedBlockingQueue): The shared queue.
             delay_range (tuple): Min and max delay in seconds for processing.
+            batch_size (int): Maximum items to take per queue access. Values above 1
+                use get_many() to amortize locking over several items.
+            verbose (bool): Print progress for every item. Off by default since
+                print() serializes all workers on the stdout lock.
         """
         super().__init__(name=f"Consumer-{thread_id}")
         self.thread_id = thread_id
         self.queue = queue
         self.delay_range = delay_range
+        self.batch_size = batch_size
+        self.verbose = verbose
         self.consumed_count = 0
 
     def run(self) -> None:
@@ -30,25 +36,48 @@ class Consumer(threading.Thread):
         Main execution loop of the consumer thread.
 
         Continuously retrieves items from the queue and processes them.
-        The loop terminates when a sentinel value (None) is retrieved.
+        The loop terminates when the queue reports QueueShutDown or a sentinel
+        value (None) is retrieved.
+        Processing delays come from a per-worker generator rather than the
+        module-level one shared by every thread.
         """
-        print(f"[{self.name}] Started.")
-        while True:
-            item = self.queue.get()
-            
-            if item is None:
-                # Sentinel value received, stop consuming
-                print(f"[{self.name}] Received stop signal. Exiting.")
-                # Put the sentinel back for other consumers if needed? 
-                # Ideally, main sends one sentinel per consumer.
-                # Here we assume 1 sentinel per consumer.
+        if self.verbose:
+            print(f"[{self.name}] Started.")
+        uniform = random.Random().uniform
+        low, high = self.delay_range
+        running = True
+        while running:
+            try:
+                if self.batch_size > 1:
+                    items = self.queue.get_many(self.batch_size)
+                else:
+                    items = [self.queue.get()]
+            except QueueShutDown:
+                if self.verbose:
+                    print(f"[{self.name}] Queue shut down. Exiting.")
                 break
-            
-            print(f"[{self.name}] Retrieved {item} (Size: {self.queue.qsize()})")
-            
-            # Simulate processing
-            time.sleep(random.uniform(*self.delay_range))
-            self.consumed_count += 1
-            print(f"[{self.name}] Processed {item}")
+
+            for index, item in enumerate(items):
+                if item is None:
+                    # Sentinel value received, stop consuming
+                    if self.verbose:
+                        print(f"[{self.name}] Received stop signal. Exiting.")
+                    # Main sends one sentinel per consumer. Hand back anything
+                    # taken after ours (e.g. other consumers' sentinels).
+                    remaining = items[index + 1:]
+                    if remaining:
+                        self.queue.put_many(remaining)
+                    running = False
+                    break
+
+                if self.verbose:
+                    print(f"[{self.name}] Retrieved {item} (Size: {self.queue.approx_qsize()})")
+
+                # Simulate processing
+                time.sleep(uniform(low, high))
+                self.consumed_count += 1
+                if self.verbose:
+                    print(f"[{self.name}] Processed {item}")
         
-        print(f"[{self.name}] Finished. Total consumed: {self.consumed_count}")
+        if self.verbose:
+            print(f"[{self.name}] Finished. Total consumed: {self.consumed_count}")
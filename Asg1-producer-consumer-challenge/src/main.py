@@ -8,7 +8,7 @@ def main() -> None:
     Main entry point for the Producer-Consumer demonstration.
 
     Sets up the shared blocking queue, initializes producer and consumer threads,
-    starts them, waits for completion, and handles graceful shutdown using sentinel values.
+    starts them, waits for completion, and handles graceful shutdown by shutting the queue down.
     """
     print("=== Producer-Consumer Challenge Demo ===")
     
@@ -24,37 +24,38 @@ def main() -> None:
     # Create Producers
     producers = []
     for i in range(NUM_PRODUCERS):
-        p = Producer(thread_id=i+1, queue=queue, items_to_produce=ITEMS_PER_PRODUCER)
+        p = Producer(thread_id=i+1, queue=queue, items_to_produce=ITEMS_PER_PRODUCER, verbose=True)
         producers.append(p)
     
     # Create Consumers
     consumers = []
     for i in range(NUM_CONSUMERS):
-        c = Consumer(thread_id=i+1, queue=queue)
+        c = Consumer(thread_id=i+1, queue=queue, verbose=True)
         consumers.append(c)
     
     # Start Consumers
     for c in consumers:
         c.start()
-        
+
     # Start Producers
     for p in producers:
         p.start()
-        
-    # Wait for producers to finish
-    for p in producers:
-        p.join()
-    print("--- All Producers Finished ---")
-    
-    # Signal consumers to stop (send one sentinel per consumer)
-    print("--- Sending Shutdown Signals ---")
-    for _ in range(NUM_CONSUMERS):
-        queue.put(None)
-        
+
+    try:
+        # Wait for producers to finish
+        for p in producers:
+            p.join()
+        print("--- All Producers Finished ---")
+    finally:
+        # Signal consumers to stop once the remaining items are drained.
+        # Done unconditionally so an interrupted wait cannot leave consumers blocked.
+        print("--- Sending Shutdown Signal ---")
+        queue.shutdown()
+
     # Wait for consumers to finish
     for c in consumers:
         c.join()
-        
+
     print("=== Demo Completed Successfully ===")
 
 if __name__ == "__main__":
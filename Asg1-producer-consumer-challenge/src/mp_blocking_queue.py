@@ -0,0 +1,170 @@
+import multiprocessing
+import queue
+from typing import Generic, List, Sequence, TypeVar
+from .producer import Producer
+from .consumer import Consumer
+
+T = TypeVar('T')
+
+class MPBoundedBlockingQueue(Generic[T]):
+    """
+    A process-safe bounded blocking queue backed by multiprocessing.Queue.
+
+    Offers the same put()/get() interface as BoundedBlockingQueue so the existing
+    Producer/Consumer loops can run in separate processes, sidestepping the GIL for
+    CPU-bound item processing. Every item is pickled and sent through a pipe, so this
+    only pays off when per-item compute is much larger than the pickling overhead;
+    for sleep- or I/O-bound work, the threaded queue is faster.
+    Shutdown uses sentinel values (None), as exceptions cannot cross processes.
+
+    Attributes:
+        capacity (int): The maximum number of items the queue can hold.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """
+        Initialize the queue with a specific capacity.
+
+        Args:
+            capacity (int): Maximum number of items. Must be > 0.
+        """
+        if capacity <= 0:
+            raise ValueError("Capacity must be greater than 0")
+
+        self.capacity = capacity
+        self._q: "multiprocessing.Queue[T]" = multiprocessing.Queue(capacity)
+
+    def put(self, item: T) -> None:
+        """
+        Add an item to the queue.
+        Blocks if the queue is full until space becomes available.
+
+        Args:
+            item (T): The item to add.
+        """
+        self._q.put(item)
+
+    def put_many(self, items: Sequence[T]) -> None:
+        """
+        Add several items to the queue, in order.
+
+        Args:
+            items (Sequence[T]): The items to add.
+        """
+        for item in items:
+            self._q.put(item)
+
+    def get(self) -> T:
+        """
+        Remove and return an item from the queue.
+        Blocks if the queue is empty until an item is available.
+
+        Returns:
+            T: The item removed from the queue.
+        """
+        return self._q.get()
+
+    def get_many(self, max_items: int) -> List[T]:
+        """
+        Remove and return up to max_items items.
+        Blocks until at least one item is available, then takes whatever else is ready.
+
+        Args:
+            max_items (int): Maximum number of items to remove. Must be > 0.
+
+        Returns:
+            List[T]: Between 1 and max_items items.
+        """
+        if max_items <= 0:
+            raise ValueError("max_items must be greater than 0")
+
+        items = [self._q.get()]
+        while len(items) < max_items:
+            try:
+                items.append(self._q.get_nowait())
+            except queue.Empty:
+                break
+        return items
+
+    def qsize(self) -> int:
+        """
+        Return the approximate size of the queue.
+        Not available on platforms without sem_getvalue() (e.g. macOS).
+
+        Returns:
+            int: Number of items in the queue.
+        """
+        return self._q.qsize()
+
+    def approx_qsize(self) -> int:
+        """
+        Alias for qsize(); multiprocessing.Queue has no cheaper size read.
+
+        Returns:
+            int: Number of items in the queue.
+        """
+        return self._q.qsize()
+
+class MPProducer(multiprocessing.Process):
+    """
+    Producer process that runs the same loop as Producer against an MPBoundedBlockingQueue.
+    """
+
+    def __init__(self, thread_id: int, queue: MPBoundedBlockingQueue, items_to_produce: int, delay_range: tuple[float, float] = (0.01, 0.1), batch_size: int = 1, verbose: bool = False) -> None:
+        """
+        Initialize the MPProducer.
+
+        Args:
+            thread_id (int): Identifier for the process.
+            queue (MPBoundedBlockingQueue): The shared queue.
+            items_to_produce (int): Number of items to generate.
+            delay_range (tuple): Min and max delay in seconds between items.
+            batch_size (int): Number of items to accumulate before handing them to the queue.
+            verbose (bool): Print progress for every item.
+        """
+        super().__init__(name=f"Producer-{thread_id}")
+        self.thread_id = thread_id
+        self.queue = queue
+        self.items_to_produce = items_to_produce
+        self.delay_range = delay_range
+        self.batch_size = min(batch_size, queue.capacity)
+        self.verbose = verbose
+
+    run = Producer.run
+
+class MPConsumer(multiprocessing.Process):
+    """
+    Consumer process that runs the same loop as Consumer against an MPBoundedBlockingQueue.
+    Stops when it receives a sentinel value (None).
+    """
+
+    def __init__(self, thread_id: int, queue: MPBoundedBlockingQueue, delay_range: tuple[float, float] = (0.05, 0.2), batch_size: int = 1, verbose: bool = False) -> None:
+        """
+        Initialize the MPConsumer.
+
+        Args:
+            thread_id (int): Identifier for the process.
+            queue (MPBoundedBlockingQueue): The shared queue.
+            delay_range (tuple): Min and max delay in seconds for processing.
+            batch_size (int): Maximum items to take per queue access.
+            verbose (bool): Print progress for every item.
+        """
+        super().__init__(name=f"Consumer-{thread_id}")
+        self.thread_id = thread_id
+        self.queue = queue
+        self.delay_range = delay_range
+        self.batch_size = batch_size
+        self.verbose = verbose
+        # Shared memory so the parent can read the count after join()
+        self._consumed = multiprocessing.Value("i", 0)
+
+    @property
+    def consumed_count(self) -> int:
+        """Number of items processed by this consumer."""
+        return self._consumed.value
+
+    @consumed_count.setter
+    def consumed_count(self, value: int) -> None:
+        self._consumed.value = value
+
+    run = Consumer.run
@@ -9,7 +9,7 @@ class Producer(threading.Thread):
     Producer thread that generates items and puts them into the queue.
     """
 
-    def __init__(self, thread_id: int, queue: BoundedBlockingQueue, items_to_produce: int, delay_range: tuple[float, float] = (0.01, 0.1)) -> None:
+    def __init__(self, thread_id: int, queue: BoundedBlockingQueue, items_to_produce: int, delay_range: tuple[float, float] = (0.01, 0.1), batch_size: int = 1, verbose: bool = False) -> None:
         """
         Initialize the Producer.
 
@@ -18,12 +18,18 @@ class Producer(threading.Thread):
             queue (BoundedBlockingQueue): The shared queue.
             items_to_produce (int): Number of items to generate.
             delay_range (tuple): Min and max delay in seconds between items.
+            batch_size (int): Number of items to accumulate before handing them to the
+                queue with a single put_many(). Capped at the queue capacity.
+            verbose (bool): Print progress for every item. Off by default since
+                print() serializes all workers on the stdout lock.
         """
         super().__init__(name=f"Producer-{thread_id}")
         self.thread_id = thread_id
         self.queue = queue
         self.items_to_produce = items_to_produce
         self.delay_range = delay_range
+        self.batch_size = min(batch_size, queue.capacity)
+        self.verbose = verbose
 
     def run(self) -> None:
         """
@@ -31,16 +37,35 @@ class Producer(threading.Thread):
 
         Generates a specified number of items and puts them into the queue.
         Simulates work by sleeping for a random duration before producing each item.
+        The whole sleep schedule is drawn up front from a per-worker generator,
+        keeping RNG calls out of the per-item loop.
         """
-        print(f"[{self.name}] Started.")
+        if self.verbose:
+            print(f"[{self.name}] Started.")
+        rng = random.Random()
+        low, high = self.delay_range
+        sleeps = [rng.uniform(low, high) for _ in range(self.items_to_produce)]
+        batch = []
         for i in range(1, self.items_to_produce + 1):
             item = f"Item-{self.thread_id}-{i}"
             
             # Simulate work
-            time.sleep(random.uniform(*self.delay_range))
+            time.sleep(sleeps[i - 1])
             
-            print(f"[{self.name}] Producing {item}...")
-            self.queue.put(item)
-            print(f"[{self.name}] Put {item} into queue (Size: {self.queue.qsize()})")
+            if self.verbose:
+                print(f"[{self.name}] Producing {item}...")
+            if self.batch_size <= 1:
+                self.queue.put(item)
+                if self.verbose:
+                    print(f"[{self.name}] Put {item} into queue (Size: {self.queue.approx_qsize()})")
+                continue
+
+            batch.append(item)
+            if len(batch) == self.batch_size or i == self.items_to_produce:
+                self.queue.put_many(batch)
+                if self.verbose:
+                    print(f"[{self.name}] Put {len(batch)} items into queue (Size: {self.queue.approx_qsize()})")
+                batch = []
         
-        print(f"[{self.name}] Finished producing {self.items_to_produce} items.")
+        if self.verbose:
+            print(f"[{self.name}] Finished producing {self.items_to_produce} items.")
@@ -1,7 +1,13 @@
 import pytest
+import queue
 import threading
 import time
-from src.blocking_queue import BoundedBlockingQueue
+from src.blocking_queue import (
+    BoundedBlockingQueue,
+    QueueShutDown,
+    ShardedBoundedBlockingQueue,
+    StdlibBoundedBlockingQueue,
+)
 
 def test_queue_initialization() -> None:
     """
@@ -104,3 +110,398 @@ def test_fifo_order() -> None:
         outputs.append(q.get())
         
     assert inputs == outputs
+
+def test_mixed_waiters_no_lost_wakeup() -> None:
+    """
+    Test that producers and consumers sharing one condition never deadlock.
+
+    Uses a capacity of 1 with several producers and consumers so that both sides
+    are frequently blocked at the same time, then verifies every item is delivered.
+    """
+    q = BoundedBlockingQueue(1)
+    num_threads = 4
+    items_per_thread = 200
+    received = []
+    received_lock = threading.Lock()
+
+    def produce() -> None:
+        """Helper function to put a fixed number of items into the queue."""
+        for i in range(items_per_thread):
+            q.put(i)
+
+    def consume() -> None:
+        """Helper function to get a fixed number of items from the queue."""
+        for _ in range(items_per_thread):
+            item = q.get()
+            with received_lock:
+                received.append(item)
+
+    threads = [threading.Thread(target=produce) for _ in range(num_threads)]
+    threads += [threading.Thread(target=consume) for _ in range(num_threads)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=10)
+
+    assert not any(t.is_alive() for t in threads)
+    assert len(received) == num_threads * items_per_thread
+    assert q.qsize() == 0
+
+def test_stdlib_queue_matches_custom_queue() -> None:
+    """
+    Test that StdlibBoundedBlockingQueue behaves like BoundedBlockingQueue.
+
+    Verifies capacity validation, FIFO order, size tracking, and blocking put() on a full queue.
+    """
+    with pytest.raises(ValueError):
+        StdlibBoundedBlockingQueue(0)
+
+    q = StdlibBoundedBlockingQueue(2)
+    assert q.capacity == 2
+    q.put(1)
+    q.put(2)
+    assert q.qsize() == 2
+
+    def delayed_get() -> None:
+        """Helper function to get an item from the queue after a delay."""
+        time.sleep(0.2)
+        q.get()
+
+    t = threading.Thread(target=delayed_get)
+    start_time = time.time()
+    t.start()
+    q.put(3)  # Should block until delayed_get runs
+    assert time.time() - start_time >= 0.2
+    t.join()
+
+    assert q.get() == 2
+    assert q.get() == 3
+    assert q.qsize() == 0
+
+def test_stdlib_queue_shutdown_and_nowait() -> None:
+    """
+    Test that StdlibBoundedBlockingQueue supports the rest of BoundedBlockingQueue's interface.
+
+    Verifies the non-blocking variants, that get()'s first argument is a timeout, and that
+    shutdown() wakes blocked consumers and producers after queued items are drained.
+    """
+    q = StdlibBoundedBlockingQueue(1)
+    with pytest.raises(queue.Empty):
+        q.get_nowait()
+    start_time = time.time()
+    with pytest.raises(queue.Empty):
+        q.get(0.2)
+    assert time.time() - start_time >= 0.2
+
+    q.put_nowait("a")
+    with pytest.raises(queue.Full):
+        q.put_nowait("b")
+    assert q.get_nowait() == "a"
+
+    outcomes = []
+    outcomes_lock = threading.Lock()
+
+    def blocked(op) -> None:
+        """Helper function that blocks on the queue until shutdown."""
+        try:
+            op()
+        except QueueShutDown:
+            with outcomes_lock:
+                outcomes.append("shutdown")
+
+    getters = [threading.Thread(target=blocked, args=(q.get,)) for _ in range(3)]
+    for t in getters:
+        t.start()
+    time.sleep(0.1)  # Let the consumers block on get()
+    q.shutdown()
+    for t in getters:
+        t.join(timeout=5)
+    assert not any(t.is_alive() for t in getters)
+    assert outcomes == ["shutdown"] * 3
+    with pytest.raises(QueueShutDown):
+        q.put_nowait("late")
+
+    q2 = StdlibBoundedBlockingQueue(1)
+    q2.put("first")
+    putter = threading.Thread(target=blocked, args=(lambda: q2.put("second"),))
+    putter.start()
+    time.sleep(0.1)  # Let the producer block on put()
+    q2.shutdown()
+    putter.join(timeout=5)
+    assert not putter.is_alive()
+    assert len(outcomes) == 4
+    assert q2.get() == "first"
+    with pytest.raises(QueueShutDown):
+        q2.get_nowait()
+
+def test_put_many() -> None:
+    """
+    Test that put_many() adds a batch atomically and wakes blocked consumers.
+
+    Starts several consumers on an empty queue, puts one item per consumer in a single
+    call, and verifies that every consumer receives exactly one item in FIFO order.
+    Also ensures that a batch larger than the capacity raises a ValueError.
+    """
+    q = BoundedBlockingQueue(3)
+
+    with pytest.raises(ValueError):
+        q.put_many([1, 2, 3, 4])
+
+    results = []
+    results_lock = threading.Lock()
+
+    def consume() -> None:
+        """Helper function to get one item from the queue."""
+        item = q.get()
+        with results_lock:
+            results.append(item)
+
+    threads = [threading.Thread(target=consume) for _ in range(3)]
+    for t in threads:
+        t.start()
+    time.sleep(0.1)  # Let the consumers block on get()
+
+    q.put_many(["a", "b", "c"])
+    for t in threads:
+        t.join(timeout=5)
+
+    assert not any(t.is_alive() for t in threads)
+    assert sorted(results) == ["a", "b", "c"]
+    assert q.qsize() == 0
+
+    q.put_many([1, 2])
+    assert [q.get(), q.get()] == [1, 2]
+
+def test_get_timeout_and_nowait() -> None:
+    """
+    Test the non-blocking and time-limited variants of get().
+
+    Verifies that get_nowait() and get(timeout=...) raise queue.Empty on an empty
+    queue and return items normally when data is available.
+    """
+    q = BoundedBlockingQueue(2)
+
+    with pytest.raises(queue.Empty):
+        q.get_nowait()
+
+    start_time = time.time()
+    with pytest.raises(queue.Empty):
+        q.get(timeout=0.2)
+    assert time.time() - start_time >= 0.2
+
+    q.put("a")
+    q.put("b")
+    assert q.get_nowait() == "a"
+    assert q.get(timeout=0.2) == "b"
+
+def test_sharded_queue() -> None:
+    """
+    Test the ShardedBoundedBlockingQueue with several producers and consumers.
+
+    Verifies capacity/shard validation, that capacity is split across shards, and
+    that every produced item is consumed exactly once.
+    """
+    with pytest.raises(ValueError):
+        ShardedBoundedBlockingQueue(0)
+    with pytest.raises(ValueError):
+        ShardedBoundedBlockingQueue(2, shards=3)
+
+    q = ShardedBoundedBlockingQueue(10, shards=4)
+    assert q.capacity == 10
+    assert sum(shard.capacity for shard in q.shards) == 10
+
+    num_producers = 3
+    items_per_producer = 100
+    received = []
+    received_lock = threading.Lock()
+
+    def produce(producer_id: int) -> None:
+        """Helper function to put a fixed number of items into the queue."""
+        for i in range(items_per_producer):
+            q.put((producer_id, i))
+
+    def consume() -> None:
+        """Helper function to get items until the queue is shut down."""
+        while True:
+            try:
+                item = q.get()
+            except QueueShutDown:
+                break
+            with received_lock:
+                received.append(item)
+
+    producers = [threading.Thread(target=produce, args=(i,)) for i in range(num_producers)]
+    consumers = [threading.Thread(target=consume) for _ in range(2)]
+    for t in consumers + producers:
+        t.start()
+    for t in producers:
+        t.join(timeout=10)
+    q.shutdown()
+    for t in consumers:
+        t.join(timeout=10)
+
+    assert not any(t.is_alive() for t in producers + consumers)
+    assert sorted(received) == [(p, i) for p in range(num_producers) for i in range(items_per_producer)]
+    assert q.qsize() == 0
+
+def test_sharded_queue_timeout_and_nowait() -> None:
+    """
+    Test the timed and non-blocking variants on ShardedBoundedBlockingQueue.
+
+    Verifies that get(timeout=...) and get_nowait() raise queue.Empty when every shard is
+    empty, that put_nowait() only raises queue.Full once every shard is full, and that a
+    consumer blocked on the shared condition is woken by a put to any shard.
+    """
+    q = ShardedBoundedBlockingQueue(2, shards=2)
+    with pytest.raises(queue.Empty):
+        q.get_nowait()
+    start_time = time.time()
+    with pytest.raises(queue.Empty):
+        q.get(timeout=0.2)
+    assert time.time() - start_time >= 0.2
+
+    q.put_nowait("a")
+    q.put_nowait("b")
+    with pytest.raises(queue.Full):
+        q.put_nowait("c")
+    assert sorted([q.get_nowait(), q.get(timeout=0.2)]) == ["a", "b"]
+
+    received = []
+
+    def blocked_get() -> None:
+        """Helper function that blocks until an item arrives in any shard."""
+        received.append(q.get(timeout=5))
+
+    t = threading.Thread(target=blocked_get)
+    t.start()
+    time.sleep(0.1)  # Let the consumer block on the shared condition
+    assert q._waiting_getters == 1
+    q.put("late")
+    t.join(timeout=5)
+    assert not t.is_alive()
+    assert received == ["late"]
+
+def test_get_many() -> None:
+    """
+    Test that get_many() returns up to max_items items in FIFO order.
+
+    Verifies partial batches when fewer items are queued, that a blocked producer is
+    released once items are removed, and that a non-positive max_items raises ValueError.
+    """
+    q = BoundedBlockingQueue(3)
+
+    with pytest.raises(ValueError):
+        q.get_many(0)
+
+    q.put_many([1, 2, 3])
+    assert q.get_many(2) == [1, 2]
+    assert q.get_many(5) == [3]
+
+    q.put_many([4, 5, 6])
+
+    def delayed_get_many() -> None:
+        """Helper function to remove two items from the queue after a delay."""
+        time.sleep(0.2)
+        q.get_many(2)
+
+    t = threading.Thread(target=delayed_get_many)
+    t.start()
+    q.put_many([7, 8])  # Should block until delayed_get_many frees two slots
+    t.join()
+
+    assert q.get_many(3) == [6, 7, 8]
+
+def test_shutdown() -> None:
+    """
+    Test that shutdown() wakes blocked consumers and producers.
+
+    Verifies that queued items are still delivered after shutdown, that consumers then
+    get QueueShutDown, and that put() is rejected once the queue is shut down.
+    """
+    q = BoundedBlockingQueue(1)
+    outcomes = []
+    outcomes_lock = threading.Lock()
+
+    def blocked_get() -> None:
+        """Helper function that blocks on an empty queue until shutdown."""
+        try:
+            q.get()
+            outcome = "item"
+        except QueueShutDown:
+            outcome = "shutdown"
+        with outcomes_lock:
+            outcomes.append(outcome)
+
+    threads = [threading.Thread(target=blocked_get) for _ in range(3)]
+    for t in threads:
+        t.start()
+    time.sleep(0.1)  # Let the consumers block on get()
+
+    q.shutdown()
+    for t in threads:
+        t.join(timeout=5)
+    assert not any(t.is_alive() for t in threads)
+    assert outcomes == ["shutdown"] * 3
+
+    with pytest.raises(QueueShutDown):
+        q.put("late")
+
+    # Items queued before shutdown are drained first
+    q2 = BoundedBlockingQueue(1)
+    q2.put("first")
+
+    def blocked_put() -> None:
+        """Helper function that blocks on a full queue until shutdown."""
+        try:
+            q2.put("second")
+        except QueueShutDown:
+            with outcomes_lock:
+                outcomes.append("put rejected")
+
+    t = threading.Thread(target=blocked_put)
+    t.start()
+    time.sleep(0.1)  # Let the producer block on put()
+    q2.shutdown()
+    t.join(timeout=5)
+    assert not t.is_alive()
+    assert outcomes[-1] == "put rejected"
+    assert q2.get() == "first"
+    with pytest.raises(QueueShutDown):
+        q2.get_many(2)
+
+def test_put_nowait_and_spin() -> None:
+    """
+    Test put_nowait() and the spin-before-blocking fast path.
+
+    Verifies that put_nowait() raises queue.Full on a full queue, and that put()/get()
+    behave identically whether or not the initial non-blocking spin is enabled.
+    """
+    q = BoundedBlockingQueue(1)
+    q.put_nowait("a")
+    with pytest.raises(queue.Full):
+        q.put_nowait("b")
+    assert q.get() == "a"
+
+    for spin_count in (0, BoundedBlockingQueue.SPIN_COUNT):
+        q = BoundedBlockingQueue(2)
+        q.SPIN_COUNT = spin_count
+        q.put(None)  # None is a valid item, not a failed spin
+        q.put("x")
+        assert q.get() is None
+        assert q.get() == "x"
+        with pytest.raises(queue.Empty):
+            q.get(timeout=0.05)
+
+def test_approx_qsize() -> None:
+    """
+    Test approx_qsize() on every queue variant.
+
+    Verifies that the lock-free size read agrees with qsize() when the queue is quiescent.
+    """
+    for q in (BoundedBlockingQueue(4), ShardedBoundedBlockingQueue(4, shards=2), StdlibBoundedBlockingQueue(4)):
+        assert q.approx_qsize() == 0
+        q.put(1)
+        q.put(2)
+        assert q.approx_qsize() == q.qsize() == 2
+        q.get()
+        assert q.approx_qsize() == q.qsize() == 1
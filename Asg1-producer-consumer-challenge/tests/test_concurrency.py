@@ -1,9 +1,12 @@
+import asyncio
 import pytest
 import threading
 import time
-from src.blocking_queue import BoundedBlockingQueue
+from src.blocking_queue import BoundedBlockingQueue, ShardedBoundedBlockingQueue, StdlibBoundedBlockingQueue
 from src.producer import Producer
 from src.consumer import Consumer
+from src.async_blocking_queue import AsyncBoundedBlockingQueue, AsyncConsumer, AsyncProducer
+from src.mp_blocking_queue import MPBoundedBlockingQueue, MPConsumer, MPProducer
 
 def test_producer_consumer_integration() -> None:
     """
@@ -27,9 +30,8 @@ def test_producer_consumer_integration() -> None:
     for p in producers:
         p.join()
         
-    # Send Stop Signals
-    for _ in consumers:
-        queue.put(None)
+    # Send Stop Signal
+    queue.shutdown()
         
     # Wait for consumers
     for c in consumers:
@@ -40,7 +42,7 @@ def test_producer_consumer_integration() -> None:
     # Consumed count check
     total_consumed = sum(c.consumed_count for c in consumers)
     assert total_consumed == 10
-    assert queue.qsize() == 0 # Queue should be empty (sentinels also consumed)
+    assert queue.qsize() == 0 # Queue should be drained before consumers exit
 
 def test_consumer_wait_logic() -> None:
     """
@@ -66,3 +68,104 @@ def test_consumer_wait_logic() -> None:
     consumer.join()
     
     assert consumer.consumed_count == 1
+
+def test_batched_producer_consumer() -> None:
+    """
+    Integration test for batched Producers and Consumers.
+
+    Producers hand items over with put_many() and consumers take up to several items
+    per get_many() call. Verifies that every item is consumed exactly once and that
+    shutdown sentinels taken in the same batch are handed back to the other consumers.
+    """
+    queue = BoundedBlockingQueue(8)
+    producers = [Producer(i, queue, 10, (0, 0.001), batch_size=4) for i in range(2)]
+    consumers = [Consumer(i, queue, (0, 0.001), batch_size=8) for i in range(3)]
+
+    for c in consumers:
+        c.start()
+    for p in producers:
+        p.start()
+    for p in producers:
+        p.join()
+
+    queue.put_many([None] * len(consumers))
+    for c in consumers:
+        c.join(timeout=5)
+
+    assert not any(c.is_alive() for c in consumers)
+    assert sum(c.consumed_count for c in consumers) == 20
+    assert queue.qsize() == 0
+
+def test_batched_workers_on_every_queue() -> None:
+    """
+    Integration test for batched Producers and Consumers on every thread queue variant.
+
+    The workers call put_many()/get_many() whenever batch_size > 1, so each queue class
+    must provide both. Consumers are stopped with shutdown(), which drains every item first.
+    """
+    for queue in (BoundedBlockingQueue(8), ShardedBoundedBlockingQueue(8, shards=3), StdlibBoundedBlockingQueue(8)):
+        producers = [Producer(i, queue, 10, (0, 0.001), batch_size=4) for i in range(3)]
+        consumers = [Consumer(i, queue, (0, 0.001), batch_size=3) for i in range(2)]
+
+        for c in consumers:
+            c.start()
+        for p in producers:
+            p.start()
+        for p in producers:
+            p.join(timeout=5)
+
+        queue.shutdown()
+        for c in consumers:
+            c.join(timeout=5)
+
+        assert not any(t.is_alive() for t in producers + consumers), type(queue).__name__
+        assert sum(c.consumed_count for c in consumers) == 30, type(queue).__name__
+        assert queue.qsize() == 0
+
+def test_multiprocess_producer_consumer() -> None:
+    """
+    Integration test for the process-based MPProducer and MPConsumer.
+
+    Runs the shared Producer/Consumer loops in separate processes over an
+    MPBoundedBlockingQueue and verifies that every item is consumed exactly once.
+    """
+    queue = MPBoundedBlockingQueue(4)
+    producers = [MPProducer(i, queue, 5, (0, 0)) for i in range(2)]
+    consumers = [MPConsumer(i, queue, (0, 0), batch_size=2) for i in range(2)]
+
+    for c in consumers:
+        c.start()
+    for p in producers:
+        p.start()
+    for p in producers:
+        p.join(timeout=10)
+
+    queue.put_many([None] * len(consumers))
+    for c in consumers:
+        c.join(timeout=10)
+
+    assert all(c.exitcode == 0 for c in producers + consumers)
+    assert sum(c.consumed_count for c in consumers) == 10
+
+def test_async_producer_consumer() -> None:
+    """
+    Integration test for the coroutine-based AsyncProducer and AsyncConsumer.
+
+    Runs many consumers on one event loop over an AsyncBoundedBlockingQueue and
+    verifies that every item is consumed exactly once.
+    """
+    async def scenario() -> list:
+        queue = AsyncBoundedBlockingQueue(4)
+        producers = [AsyncProducer(i, queue, 25, (0, 0.001)) for i in range(4)]
+        consumers = [AsyncConsumer(i, queue, (0, 0.001)) for i in range(50)]
+
+        consumer_tasks = [asyncio.create_task(c.run()) for c in consumers]
+        await asyncio.gather(*(p.run() for p in producers))
+        await queue.put_many([None] * len(consumers))
+        await asyncio.wait_for(asyncio.gather(*consumer_tasks), timeout=10)
+
+        assert queue.qsize() == 0
+        return consumers
+
+    consumers = asyncio.run(scenario())
+    assert sum(c.consumed_count for c in consumers) == 100
@@ -12,17 +12,48 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from cli.convert_excel_to_csv import convert_excel_to_csv
-from streamsight.config import Config
+from streamsight.config import get_config
 from streamsight.logging_conf import configure_logging, get_logger
+from streamsight.pipeline.cache import file_sha256
 from streamsight.pipeline.runner import run_pipeline
 from streamsight.viz.plots import create_all_plots
 from streamsight.viz.reporting import generate_summary_report
 
 
+def _etag_path(csv_path: Path) -> Path:
+    """Return the path of the file recording which Excel content a CSV came from."""
+    return csv_path.with_name(csv_path.name + ".etag")
+
+
+def _needs_conversion(excel_path: Path, csv_path: Path) -> bool:
+    """Decide whether the CSV must be (re)generated from the Excel file.
+
+    The CSV is reused when it is newer than the workbook. A workbook that is
+    newer but whose SHA-256 matches the recorded ``.etag`` (touched, not
+    edited) is also treated as fresh, so the slow xlsx parse is skipped.
+
+    Args:
+        excel_path: Path to the source Excel file
+        csv_path: Path to the converted CSV file
+
+    Returns:
+        True if conversion should run
+    """
+    if not csv_path.exists():
+        return True
+    if not excel_path.exists():
+        return False
+    if excel_path.stat().st_mtime <= csv_path.stat().st_mtime:
+        return False
+
+    etag_path = _etag_path(csv_path)
+    return not etag_path.exists() or etag_path.read_text().strip() != file_sha256(excel_path)
+
+
 def main() -> None:
     """Main orchestration."""
     # Load configuration
-    config = Config()
+    config = get_config()
     configure_logging(config.log_level)
     logger = get_logger(__name__)
 
@@ -33,10 +64,11 @@ def main() -> None:
     start_time = time.time()
 
     try:
-        # Step 1: Check if CSV exists, if not convert from Excel
-        if not config.input_file.exists():
+        # Step 1: Convert from Excel if the CSV is missing or stale
+        excel_path = config.input_file.parent / "Online Retail.xlsx"
+
+        if _needs_conversion(excel_path, config.input_file):
             print("\n[1/4] Converting Excel to CSV...")
-            excel_path = config.input_file.parent / "Online Retail.xlsx"
 
             if not excel_path.exists():
                 print(f"\nError: Neither CSV nor Excel file found")
@@ -44,8 +76,19 @@ def main() -> None:
                 sys.exit(1)
 
             convert_excel_to_csv(excel_path, config.input_file)
+            _etag_path(config.input_file).write_text(file_sha256(excel_path))
         else:
-            print(f"\n[1/4] CSV file found: {config.input_file}")
+            print(f"\n[1/4] CSV file up to date: {config.input_file}")
+
+        # Prefer the columnar Parquet copy when the converter produced one
+        # (and it was not left behind by an older conversion)
+        parquet_path = config.input_file.with_suffix(".parquet")
+        if (
+            parquet_path.exists()
+            and parquet_path.stat().st_mtime >= config.input_file.stat().st_mtime
+        ):
+            print(f"   Using Parquet copy: {parquet_path}")
+            config = config.model_copy(update={"input_file": parquet_path})
 
         # Step 2: Run analytics pipeline
         print("\n[2/4] Running analytics pipeline...")
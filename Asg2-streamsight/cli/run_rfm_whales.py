@@ -11,10 +11,10 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from streamsight.config import Config
+from streamsight.config import get_config
 from streamsight.io.csv_stream import stream_transactions
 from streamsight.logging_conf import configure_logging, get_logger
-from streamsight.rfm.calculator import build_customer_profiles
+from streamsight.rfm.calculator import build_profiles_from_transactions
 from streamsight.rfm.segmentation import segment_customers
 from streamsight.viz.plots import plot_whale_pareto
 
@@ -22,8 +22,9 @@ from streamsight.viz.plots import plot_whale_pareto
 def main() -> None:
     """Main entry point."""
     # Load configuration
-    config = Config()
-    config.enable_anomaly_detection = False  # Focus on RFM only
+    config = get_config().model_copy(
+        update={"enable_anomaly_detection": False}  # Focus on RFM only
+    )
 
     # Configure logging
     configure_logging(config.log_level)
@@ -46,8 +47,8 @@ def main() -> None:
 
         # Stream transactions and build profiles
         stream = stream_transactions(config.input_file)
-        valid_stream = (result for result in stream if result.is_ok())
-        profiles = build_customer_profiles(valid_stream)
+        transactions = (result.unwrap() for result in stream if result.is_ok())
+        profiles = build_profiles_from_transactions(transactions)
 
         print(f"Built {len(profiles):,} customer profiles")
 
@@ -10,17 +10,246 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from streamsight.config import Config
+from streamsight.config import Config, get_config
 from streamsight.logging_conf import configure_logging, get_logger
-from streamsight.pipeline.runner import run_pipeline
+from streamsight.pipeline.runner import PipelineResults, run_pipeline
 from streamsight.viz.plots import create_all_plots
 from streamsight.viz.reporting import generate_summary_report
 
+BANNER = "=" * 70
+
+SUMMARY_HEADER = f"""
+{BANNER}
+Pipeline Completed Successfully!
+{BANNER}"""
+
+REVENUE_TEMPLATE = """
+REVENUE ANALYSIS
+   Gross Revenue:        ${gross_revenue:,.2f}
+   Net Revenue:          ${net_revenue:,.2f}
+   Total Transactions:   {transaction_count:,}
+   Return Transactions:  {return_count:,}
+   Daily Revenue Points: {daily_points}
+   Monthly Periods:      {monthly_periods}
+
+GEOGRAPHY ANALYSIS
+   Total Countries:      {country_count}
+   Top 5 Countries by Revenue:"""
+
+COUNTRY_TEMPLATE = "      {rank}. {country:20s} ${revenue:>12,.2f} ({share:5.2f}%)"
+
+PRODUCTS_TEMPLATE = """
+PRODUCT ANALYSIS
+   Total Products:       {total_products:,}
+   Top {top_count} Products by Revenue:"""
+
+PRODUCT_TEMPLATE = """      {rank}. {description:45s} ${revenue:>12,.2f}
+         Qty: {quantity:,} | Transactions: {transactions:,}"""
+
+RETURNS_TEMPLATE = """
+RETURNS ANALYSIS
+   Total Transactions:   {total_transactions:,}
+   Return Transactions:  {return_transactions:,}
+   Return Rate:          {return_rate:.2f}%
+   Return Impact:        ${return_impact:,.2f}"""
+
+QUALITY_TEMPLATE = """
+DATA QUALITY
+   Valid Rows:           {valid_rows:,}
+   Missing Customer ID:  {missing_customer_id:,}
+   Missing Description:  {missing_description:,}
+   Completeness Rate:    {completeness_rate:.2f}%
+   DLQ Errors:           {dlq_count:,}"""
+
+RFM_TEMPLATE = """
+WHALE CUSTOMER ANALYSIS
+   Total Customers:      {total_customers:,}
+   Whale Customers:      {whale_count:,} ({whale_pct:.2f}%)
+   Whale Revenue:        ${whale_revenue:,.2f}
+   Whale Revenue Share:  {whale_share:.2f}%
+   Total Revenue:        ${total_revenue:,.2f}
+
+   Top 5 Whale Customers:"""
+
+WHALE_TEMPLATE = """      {rank}. Customer {customer_id}
+         Spend: ${monetary:,.2f} | Frequency: {frequency} | Recency: {recency} days
+         RFM Score: {score}"""
+
+ANOMALY_TEMPLATE = """
+ANOMALY DETECTION
+   Transactions Analyzed: {total_transactions:,}
+   Anomalies Detected:    {anomaly_count:,} ({anomaly_pct:.3f}%)
+   Mean Transaction:      ${mean:.2f}
+   Std Deviation:         ${stddev:.2f}"""
+
+ANOMALY_ROW_TEMPLATE = """      {rank}. Invoice {invoice}
+         Amount: ${amount:,.2f} | Z-Score: {z_score:.2f}
+         Customer: {customer}"""
+
+OUTPUT_TEMPLATE = """
+OUTPUT FILES
+   Figures:    {figures}
+   Tables:     {tables}
+   Report:     {report}"""
+
+SUMMARY_FOOTER = f"""
+{BANNER}
+Pipeline completed successfully!
+{BANNER}
+"""
+
+
+def format_summary(config: Config, results: PipelineResults) -> str:
+    """Render the detailed console summary of a pipeline run.
+
+    Args:
+        config: Pipeline configuration (for output paths)
+        results: Results of the run
+
+    Returns:
+        The whole summary as one newline-terminated string
+    """
+    revenue = results.revenue
+    geography = results.geography
+    products = results.products
+    returns = results.returns
+    quality = results.data_quality
+
+    lines = [
+        SUMMARY_HEADER,
+        REVENUE_TEMPLATE.format(
+            gross_revenue=revenue.gross_revenue,
+            net_revenue=revenue.net_revenue,
+            transaction_count=revenue.transaction_count,
+            return_count=revenue.return_count,
+            daily_points=len(revenue.daily_revenue),
+            monthly_periods=len(revenue.monthly_revenue),
+            country_count=len(geography.country_revenue),
+        ),
+    ]
+    lines.extend(
+        COUNTRY_TEMPLATE.format(
+            rank=i,
+            country=country,
+            revenue=geography.country_revenue[country],
+            share=geography.country_revenue_share.get(country, 0),
+        )
+        for i, country in enumerate(geography.countries_by_revenue[:5], 1)
+    )
+
+    lines.append(
+        PRODUCTS_TEMPLATE.format(
+            total_products=products.total_product_count, top_count=len(products.top_products)
+        )
+    )
+    lines.extend(
+        PRODUCT_TEMPLATE.format(
+            rank=i,
+            description=(
+                product.description[:40] + "..."
+                if len(product.description) > 40
+                else product.description
+            ),
+            revenue=product.revenue,
+            quantity=product.quantity_sold,
+            transactions=product.transaction_count,
+        )
+        for i, product in enumerate(products.top_products, 1)
+    )
+
+    lines.append(
+        RETURNS_TEMPLATE.format(
+            total_transactions=returns.total_transactions,
+            return_transactions=returns.return_transactions,
+            return_rate=returns.return_rate,
+            return_impact=returns.return_revenue_impact,
+        )
+    )
+    if returns.top_returned_products:
+        lines.append("   Most Returned Products:")
+        lines.extend(
+            f"      - {stock_code}: {count} returns"
+            for stock_code, count in list(returns.top_returned_products.items())[:5]
+        )
+
+    lines.append(
+        QUALITY_TEMPLATE.format(
+            valid_rows=quality.valid_rows,
+            missing_customer_id=quality.missing_customer_id,
+            missing_description=quality.missing_description,
+            completeness_rate=quality.completeness_rate,
+            dlq_count=results.dlq_count,
+        )
+    )
+
+    rfm = results.rfm
+    if rfm:
+        lines.append(
+            RFM_TEMPLATE.format(
+                total_customers=rfm.total_customers,
+                whale_count=rfm.whale_count,
+                whale_pct=rfm.whale_count / rfm.total_customers * 100,
+                whale_revenue=rfm.whale_revenue,
+                whale_share=rfm.whale_revenue_share,
+                total_revenue=rfm.total_revenue,
+            )
+        )
+        lines.extend(
+            WHALE_TEMPLATE.format(
+                rank=i,
+                customer_id=whale.customer_id,
+                monetary=whale.monetary,
+                frequency=whale.frequency,
+                recency=whale.recency_days,
+                score=whale.rfm_score,
+            )
+            for i, whale in enumerate(rfm.whale_customers[:5], 1)
+        )
+
+    anomaly = results.anomaly
+    if anomaly:
+        lines.append(
+            ANOMALY_TEMPLATE.format(
+                total_transactions=anomaly.total_transactions,
+                anomaly_count=anomaly.anomaly_count,
+                anomaly_pct=anomaly.anomaly_count / anomaly.total_transactions * 100,
+                mean=anomaly.mean_transaction_value,
+                stddev=anomaly.stddev_transaction_value,
+            )
+        )
+        if anomaly.anomalies:
+            lines.append("\n   Top 5 Anomalous Transactions:")
+            lines.extend(
+                ANOMALY_ROW_TEMPLATE.format(
+                    rank=i,
+                    invoice=a.transaction.InvoiceNo,
+                    amount=a.transaction_value,
+                    z_score=a.z_score,
+                    customer=a.transaction.CustomerID or "Unknown",
+                )
+                for i, a in enumerate(anomaly.anomalies[:5], 1)
+            )
+
+    lines.append(
+        OUTPUT_TEMPLATE.format(
+            figures=config.figures_dir,
+            tables=config.tables_dir,
+            report=config.reports_dir / "SUMMARY.md",
+        )
+    )
+    if results.dlq_count > 0:
+        lines.append(
+            f"   DLQ Errors: {config.errors_dir / 'bad_rows.jsonl'} ({results.dlq_count} rows)"
+        )
+
+    lines.append(SUMMARY_FOOTER)
+    return "\n".join(lines)
+
 
 def main() -> None:
     """Main entry point."""
     # Load configuration
-    config = Config()
+    config = get_config()
 
     # Configure logging
     configure_logging(config.log_level)
@@ -55,101 +284,7 @@ def main() -> None:
         print("Generating summary report...")
         generate_summary_report(config, results)
 
-        # Print detailed summary
-        print("\n" + "=" * 70)
-        print("Pipeline Completed Successfully!")
-        print("=" * 70)
-        
-        # Revenue Analysis
-        print(f"\nREVENUE ANALYSIS")
-        print(f"   Gross Revenue:        ${results.revenue.gross_revenue:,.2f}")
-        print(f"   Net Revenue:          ${results.revenue.net_revenue:,.2f}")
-        print(f"   Total Transactions:   {results.revenue.transaction_count:,}")
-        print(f"   Return Transactions:  {results.revenue.return_count:,}")
-        print(f"   Daily Revenue Points: {len(results.revenue.daily_revenue)}")
-        print(f"   Monthly Periods:      {len(results.revenue.monthly_revenue)}")
-        
-        # Geography Analysis
-        print(f"\nGEOGRAPHY ANALYSIS")
-        print(f"   Total Countries:      {len(results.geography.country_revenue)}")
-        print(f"   Top 5 Countries by Revenue:")
-        top_countries = sorted(
-            results.geography.country_revenue.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )[:5]
-        for i, (country, revenue) in enumerate(top_countries, 1):
-            share = results.geography.country_revenue_share.get(country, 0)
-            print(f"      {i}. {country:20s} ${revenue:>12,.2f} ({share:5.2f}%)")
-        
-        # Product Analysis
-        print(f"\nPRODUCT ANALYSIS")
-        print(f"   Total Products:       {results.products.total_product_count:,}")
-        print(f"   Top {len(results.products.top_products)} Products by Revenue:")
-        for i, product in enumerate(results.products.top_products, 1):
-            desc = product.description[:40] + "..." if len(product.description) > 40 else product.description
-            print(f"      {i}. {desc:45s} ${product.revenue:>12,.2f}")
-            print(f"         Qty: {product.quantity_sold:,} | Transactions: {product.transaction_count:,}")
-        
-        # Returns Analysis
-        print(f"\nRETURNS ANALYSIS")
-        print(f"   Total Transactions:   {results.returns.total_transactions:,}")
-        print(f"   Return Transactions:  {results.returns.return_transactions:,}")
-        print(f"   Return Rate:          {results.returns.return_rate:.2f}%")
-        print(f"   Return Impact:        ${results.returns.return_revenue_impact:,.2f}")
-        if results.returns.top_returned_products:
-            print(f"   Most Returned Products:")
-            for stock_code, count in list(results.returns.top_returned_products.items())[:5]:
-                print(f"      - {stock_code}: {count} returns")
-        
-        # Data Quality
-        print(f"\nDATA QUALITY")
-        print(f"   Valid Rows:           {results.data_quality.valid_rows:,}")
-        print(f"   Missing Customer ID:  {results.data_quality.missing_customer_id:,}")
-        print(f"   Missing Description:  {results.data_quality.missing_description:,}")
-        print(f"   Completeness Rate:    {results.data_quality.completeness_rate:.2f}%")
-        print(f"   DLQ Errors:           {results.dlq_count:,}")
-
-        # RFM Whale Analysis
-        if results.rfm:
-            print(f"\nWHALE CUSTOMER ANALYSIS")
-            print(f"   Total Customers:      {results.rfm.total_customers:,}")
-            print(f"   Whale Customers:      {results.rfm.whale_count:,} ({results.rfm.whale_count / results.rfm.total_customers * 100:.2f}%)")
-            print(f"   Whale Revenue:        ${results.rfm.whale_revenue:,.2f}")
-            print(f"   Whale Revenue Share:  {results.rfm.whale_revenue_share:.2f}%")
-            print(f"   Total Revenue:        ${results.rfm.total_revenue:,.2f}")
-            
-            print(f"\n   Top 5 Whale Customers:")
-            for i, whale in enumerate(results.rfm.whale_customers[:5], 1):
-                print(f"      {i}. Customer {whale.customer_id}")
-                print(f"         Spend: ${whale.monetary:,.2f} | Frequency: {whale.frequency} | Recency: {whale.recency_days} days")
-                print(f"         RFM Score: {whale.rfm_score}")
-
-        # Anomaly Detection
-        if results.anomaly:
-            print(f"\nANOMALY DETECTION")
-            print(f"   Transactions Analyzed: {results.anomaly.total_transactions:,}")
-            print(f"   Anomalies Detected:    {results.anomaly.anomaly_count:,} ({results.anomaly.anomaly_count / results.anomaly.total_transactions * 100:.3f}%)")
-            print(f"   Mean Transaction:      ${results.anomaly.mean_transaction_value:.2f}")
-            print(f"   Std Deviation:         ${results.anomaly.stddev_transaction_value:.2f}")
-            
-            if results.anomaly.anomalies:
-                print(f"\n   Top 5 Anomalous Transactions:")
-                for i, anomaly in enumerate(results.anomaly.anomalies[:5], 1):
-                    print(f"      {i}. Invoice {anomaly.transaction.InvoiceNo}")
-                    print(f"         Amount: ${anomaly.transaction_value:,.2f} | Z-Score: {anomaly.z_score:.2f}")
-                    print(f"         Customer: {anomaly.transaction.CustomerID or 'Unknown'}")
-
-        print(f"\nOUTPUT FILES")
-        print(f"   Figures:    {config.figures_dir}")
-        print(f"   Tables:     {config.tables_dir}")
-        print(f"   Report:     {config.reports_dir / 'SUMMARY.md'}")
-        if results.dlq_count > 0:
-            print(f"   DLQ Errors: {config.errors_dir / 'bad_rows.jsonl'} ({results.dlq_count} rows)")
-
-        print("\n" + "=" * 70)
-        print("Pipeline completed successfully!")
-        print("=" * 70)
+        sys.stdout.write(format_summary(config, results))
 
         logger.info("streamsight_completed")
 
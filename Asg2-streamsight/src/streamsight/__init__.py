@@ -8,7 +8,7 @@ and functional programming paradigms.
 __version__ = "0.1.0"
 __author__ = "StreamSight Team"
 
-from streamsight.config import Config
+from streamsight.config import Config, get_config
 
-__all__ = ["Config", "__version__"]
+__all__ = ["Config", "get_config", "__version__"]
 
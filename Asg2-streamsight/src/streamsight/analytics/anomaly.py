@@ -4,10 +4,14 @@ This module implements Welford's online algorithm for calculating mean
 and variance in a single pass, enabling real-time anomaly detection.
 """
 
+import heapq
 import math
+from array import array
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Iterator
+from typing import Iterable, Iterator, Mapping, Sequence
+
+import numpy as np
 
 from streamsight.core.types import Ok
 from streamsight.io.schema import Transaction
@@ -16,7 +20,7 @@ from streamsight.logging_conf import get_logger
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class AnomalyTransaction:
     """A transaction flagged as an anomaly.
 
@@ -31,14 +35,15 @@ class AnomalyTransaction:
     transaction_value: Decimal
 
 
-@dataclass
+@dataclass(slots=True)
 class AnomalyResult:
     """Results from anomaly detection.
 
     Attributes:
-        anomalies: List of detected anomalous transactions
+        anomalies: Detected anomalous transactions, highest |Z-score| first
+            (only the top ones when the detector was given max_anomalies)
         total_transactions: Total number of transactions analyzed
-        anomaly_count: Number of anomalies detected
+        anomaly_count: Number of anomalies detected (all of them)
         mean_transaction_value: Mean transaction value
         stddev_transaction_value: Standard deviation of transaction values
     """
@@ -77,6 +82,29 @@ class WelfordAccumulator:
         delta2 = value - self.mean
         self.m2 += delta * delta2
 
+    def update_many(self, values: Iterable[float]) -> None:
+        """Update statistics with a batch of values.
+
+        Performs exactly the same float operations as calling update() once
+        per value, so results are bit-identical, but keeps the running state
+        in locals instead of paying a method call and attribute writes per
+        value.
+
+        Args:
+            values: New values to incorporate, in order
+        """
+        count = self.count
+        mean = self.mean
+        m2 = self.m2
+        for value in values:
+            count += 1
+            delta = value - mean
+            mean += delta / count
+            m2 += delta * (value - mean)
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
+
     @property
     def variance(self) -> float:
         """Calculate variance.
@@ -112,7 +140,9 @@ class WelfordAccumulator:
 
 
 def detect_anomalies(
-    stream: Iterator[Ok[Transaction]], threshold: float = 3.0
+    stream: Iterator[Ok[Transaction]],
+    threshold: float = 3.0,
+    max_anomalies: int | None = None,
 ) -> AnomalyResult:
     """Detect anomalous transactions using streaming Z-score analysis.
 
@@ -125,6 +155,7 @@ def detect_anomalies(
     Args:
         stream: Iterator of Ok-wrapped Transaction objects
         threshold: Z-score threshold for anomaly detection (default: 3.0)
+        max_anomalies: Keep only this many top anomalies (default: all)
 
     Returns:
         AnomalyResult with detected anomalies and statistics
@@ -133,58 +164,159 @@ def detect_anomalies(
         >>> result = detect_anomalies(transaction_stream, threshold=3.0)
         >>> print(f"Found {result.anomaly_count} anomalies")
     """
-    logger.info("anomaly_detection_started", threshold=threshold)
-
-    welford = WelfordAccumulator()
-    anomalies: list[AnomalyTransaction] = []
-    total_transactions = 0
-
-    # Two-pass approach for accurate anomaly detection:
-    # Pass 1: Calculate statistics
-    # Pass 2: Detect anomalies
-    # However, for streaming, we'll use a single pass with buffering
-    transactions_buffer: list[tuple[Transaction, float]] = []
-
-    # Single pass: collect data and calculate statistics
-    for result in stream:
-        tx = result.unwrap()
-        total_transactions += 1
-
-        # Get absolute transaction value
-        value = abs(float(tx.total_amount))
-
-        # Update statistics
-        welford.update(value)
-
-        # Buffer transaction for anomaly detection
-        transactions_buffer.append((tx, value))
-
-    # Now detect anomalies using calculated statistics
-    for tx, value in transactions_buffer:
-        z_score = welford.z_score(value)
-
-        if abs(z_score) >= threshold:
-            anomalies.append(
-                AnomalyTransaction(
-                    transaction=tx,
-                    z_score=z_score,
-                    transaction_value=tx.total_amount,
-                )
-            )
+    return detect_transaction_anomalies(map(Ok.unwrap, stream), threshold, max_anomalies)
 
-    logger.info(
-        "anomaly_detection_completed",
-        total_transactions=total_transactions,
-        anomaly_count=len(anomalies),
-        mean_value=f"{welford.mean:.2f}",
-        stddev_value=f"{welford.stddev:.2f}",
-    )
-
-    return AnomalyResult(
-        anomalies=sorted(anomalies, key=lambda a: abs(a.z_score), reverse=True),
-        total_transactions=total_transactions,
-        anomaly_count=len(anomalies),
-        mean_transaction_value=welford.mean,
-        stddev_transaction_value=welford.stddev,
-    )
 
+def detect_transaction_anomalies(
+    transactions: Iterable[Transaction],
+    threshold: float = 3.0,
+    max_anomalies: int | None = None,
+) -> AnomalyResult:
+    """Detect anomalous transactions in a stream of bare Transactions.
+
+    Same as detect_anomalies(), for callers that have already unwrapped
+    their results, so the hot loop skips the per-row unwrap() call.
+
+    Args:
+        transactions: Iterable of Transaction objects
+        threshold: Z-score threshold for anomaly detection (default: 3.0)
+        max_anomalies: Keep only this many top anomalies (default: all)
+
+    Returns:
+        AnomalyResult with detected anomalies and statistics
+    """
+    buffered = list(transactions)
+    accumulator = AnomalyAccumulator(threshold, max_anomalies)
+    accumulator.update(enumerate(buffered))
+    return accumulator.finalize(buffered)
+
+
+class AnomalyAccumulator:
+    """Incremental state for streaming anomaly detection.
+
+    Z-scores need the final mean/stddev, so every row is revisited once the
+    stream ends. Only a packed float64 value and an int64 row key (16 bytes)
+    are kept per row; the caller supplies the flagged transactions by key at
+    the end, so it never has to buffer the whole stream.
+    """
+
+    def __init__(self, threshold: float = 3.0, max_anomalies: int | None = None) -> None:
+        """Initialize empty statistics.
+
+        Args:
+            threshold: Z-score threshold for anomaly detection
+            max_anomalies: Keep only this many top anomalies in the result
+                (default: all of them)
+        """
+        logger.info("anomaly_detection_started", threshold=threshold)
+
+        self.threshold = threshold
+        self.max_anomalies = max_anomalies
+        self.welford = WelfordAccumulator()
+        self.values = array("d")
+        self.keys = array("q")
+        self._flagged: list[tuple[int, float]] | None = None
+
+    def update(self, keyed_transactions: Iterable[tuple[int, Transaction]]) -> None:
+        """Fold (key, transaction) pairs into the statistics.
+
+        Integer cents are gathered into one int64 array and handed to
+        update_cents(), so both entry points share the float64 array path.
+
+        Args:
+            keyed_transactions: Pairs of a caller-chosen int key and a Transaction
+        """
+        pairs = list(keyed_transactions)
+        amount_cents = np.fromiter(
+            (tx.total_cents for _, tx in pairs), dtype=np.int64, count=len(pairs)
+        )
+        self.update_cents([key for key, _ in pairs], amount_cents)
+
+    def update_cents(self, keys: Sequence[int], amount_cents: np.ndarray) -> None:
+        """Fold a columnar batch (see TransactionBatch.amount_cents).
+
+        Same values as update(), computed with array operations: int64 cents
+        convert to float64 exactly, so the division matches abs(cents) / 100.
+
+        Args:
+            keys: One caller-chosen int key per row
+            amount_cents: Signed transaction amounts in integer cents
+        """
+        batch_values = np.abs(amount_cents) / 100
+        self.values.frombytes(batch_values.tobytes())
+        self.keys.extend(keys)
+        self.welford.update_many(batch_values.tolist())
+
+    def flagged(self) -> list[tuple[int, float]]:
+        """Return (key, z_score) for every anomalous row, in input order.
+
+        Returns:
+            Keys and Z-scores of rows at or beyond the threshold
+        """
+        if self._flagged is None:
+            # Vectorized; same float arithmetic as WelfordAccumulator.z_score
+            stddev = self.welford.stddev
+            values = np.frombuffer(self.values, dtype=np.float64)
+            if stddev == 0:
+                z_scores = np.zeros(len(values))
+            else:
+                z_scores = (values - self.welford.mean) / stddev
+
+            indices = np.flatnonzero(np.abs(z_scores) >= self.threshold)
+            keys = np.frombuffer(self.keys, dtype=np.int64)[indices]
+            self._flagged = list(zip(keys.tolist(), z_scores[indices].tolist()))
+        return self._flagged
+
+    def top_flagged(self) -> list[tuple[int, float]]:
+        """Return the flagged rows kept in the result, highest |z| first.
+
+        Ties keep input order. With max_anomalies set this is a bounded
+        heap selection (O(N log K)) rather than a full sort.
+
+        Returns:
+            At most max_anomalies (key, z_score) pairs
+        """
+        flagged = self.flagged()
+        if self.max_anomalies is None:
+            return sorted(flagged, key=lambda item: abs(item[1]), reverse=True)
+        return heapq.nlargest(self.max_anomalies, flagged, key=lambda item: abs(item[1]))
+
+    def finalize(
+        self, transactions: Mapping[int, Transaction] | Sequence[Transaction]
+    ) -> AnomalyResult:
+        """Build the AnomalyResult.
+
+        Args:
+            transactions: Lookup from key to Transaction, covering at least
+                every key returned by top_flagged()
+
+        Returns:
+            AnomalyResult with detected anomalies and statistics
+        """
+        welford = self.welford
+        anomalies = [
+            AnomalyTransaction(
+                transaction=transactions[key],
+                z_score=z_score,
+                transaction_value=transactions[key].total_amount,
+            )
+            for key, z_score in self.top_flagged()
+        ]
+        total_transactions = len(self.values)
+        anomaly_count = len(self.flagged())
+
+        logger.info(
+            "anomaly_detection_completed",
+            total_transactions=total_transactions,
+            anomaly_count=anomaly_count,
+            mean_value=f"{welford.mean:.2f}",
+            stddev_value=f"{welford.stddev:.2f}",
+        )
+
+        return AnomalyResult(
+            anomalies=anomalies,
+            total_transactions=total_transactions,
+            anomaly_count=anomaly_count,
+            mean_transaction_value=welford.mean,
+            stddev_transaction_value=welford.stddev,
+        )
@@ -0,0 +1,835 @@
+"""Vectorized (columnar) versions of the core aggregations.
+
+The row-wise analyzers in this package touch every Transaction attribute
+through the interpreter once per analyzer. This module instead converts
+fixed-size chunks of transactions into NumPy columns (structure of arrays)
+once, then computes every aggregate with array operations.
+
+Results are identical to the row-wise analyzers: money is summed as int64
+cents (exact) and grouped keys keep first-seen order, so dict ordering,
+top-K tie-breaking and rendered reports do not change.
+
+String keys (country, stock code) are factorized to integer codes once, at
+batch construction, through a KeyIndex shared by all batches of a stream.
+Codes are assigned in first-seen order, so accumulators can keep plain
+int64 arrays indexed by code instead of dicts, and never sort strings.
+"""
+
+from collections import defaultdict
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Generic, Protocol, TypeVar
+
+import numpy as np
+import numpy.typing as npt
+
+from streamsight.analytics.data_quality import DataQualityResult
+from streamsight.analytics.geography import GeographyResult
+from streamsight.analytics.products import ProductMetrics, ProductsResult
+from streamsight.analytics.returns import ReturnsResult
+from streamsight.analytics.revenue import RevenueResult
+from streamsight.core.money import from_cents, to_cents
+from streamsight.core.stream_utils import chunk_stream
+from streamsight.io.csv_stream import ColumnBlock
+from streamsight.io.schema import Transaction, TransactionRow
+from streamsight.logging_conf import get_logger
+
+logger = get_logger(__name__)
+
+# Rows per columnar batch; bounds the memory held by one batch's arrays
+DEFAULT_BATCH_SIZE = 65_536
+
+# ReturnsAccumulator.first_returned value for codes not returned yet
+NOT_RETURNED = np.iinfo(np.int64).max
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def timestamp_us(value: datetime) -> int:
+    """Return a datetime as integer microseconds since the Unix epoch.
+
+    Naive datetimes are taken as they are and aware ones in UTC, so values
+    that compare with each other keep their order as integers.
+
+    Args:
+        value: Datetime to convert
+
+    Returns:
+        Microseconds since 1970-01-01 00:00
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def timestamps_us(values: list[datetime]) -> np.ndarray:
+    """Convert datetimes with timestamp_us(), once per distinct value.
+
+    Rows share few distinct invoice times (and parsed dates are cached, so
+    equal ones are usually one object), so the conversion runs per value.
+
+    Args:
+        values: Datetimes to convert
+
+    Returns:
+        int64 array of microseconds since the epoch, one per value
+    """
+    distinct = dict.fromkeys(values)
+    for value in distinct:
+        distinct[value] = timestamp_us(value)
+    return np.fromiter(map(distinct.__getitem__, values), np.int64, len(values))
+
+
+# Key type of a KeyIndex: str, or str | None for CustomerID (None = missing)
+K = TypeVar("K", bound=str | None)
+
+
+class KeyIndex(Generic[K]):
+    """Assigns dense integer codes to string keys in first-seen order.
+
+    CustomerID indexes are KeyIndex[str | None]: a missing ID (None) gets a
+    code like any other key, and consumers skip it by mask.
+
+    Attributes:
+        labels: Key for each code (labels[code] == key)
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._codes: dict[K, int] = {}
+        self.labels: list[K] = []
+
+    def __len__(self) -> int:
+        """Number of distinct keys seen so far."""
+        return len(self.labels)
+
+    def encode(self, keys: Iterable[K]) -> np.ndarray:
+        """Map keys to their codes, assigning new codes to unseen keys.
+
+        Args:
+            keys: Keys to encode
+
+        Returns:
+            int64 array of codes, one per key
+        """
+        codes = self._codes
+        labels = self.labels
+        get = codes.get
+        out: list[int] = []
+        append = out.append
+        for key in keys:
+            code = get(key)
+            if code is None:
+                code = codes[key] = len(labels)
+                labels.append(key)
+            append(code)
+        return np.array(out, dtype=np.int64)
+
+    def encode_codes(self, values: np.ndarray, codes: np.ndarray) -> np.ndarray:
+        """Encode dictionary-encoded keys (keys[i] == values[codes[i]]).
+
+        Each distinct value is looked up once, in order of first use by
+        codes, so new keys get the same codes encode() would assign.
+
+        Args:
+            values: Distinct keys (object array)
+            codes: Index into values per row
+
+        Returns:
+            int64 array of key codes, one per row
+        """
+        used, first_index = np.unique(codes, return_index=True)
+        used = used[np.argsort(first_index)]
+        mapping = np.zeros(len(values), dtype=np.int64)
+        mapping[used] = self.encode(values[used].tolist())
+        encoded: np.ndarray = mapping[codes]
+        return encoded
+
+
+@dataclass(slots=True)
+class TransactionBatch:
+    """A chunk of transactions stored column-wise.
+
+    Attributes:
+        quantity: Quantity per row
+        amount_cents: Quantity * UnitPrice per row, in cents
+        day_ordinal: InvoiceDate as a proleptic Gregorian ordinal
+        is_return: Whether each row is a return
+        missing_customer_id: Whether each row lacks a CustomerID
+        missing_description: Whether each row lacks a Description
+        country: Country code per row (see country_index)
+        stock_code: StockCode code per row (see stock_index)
+        customer: CustomerID code per row (see customer_index; a missing
+            CustomerID is the key None)
+        description: Description per row
+        invoice_date: InvoiceDate per row
+        invoice_time: InvoiceDate per row as microseconds (see timestamp_us)
+        country_index: KeyIndex decoding country codes
+        stock_index: KeyIndex decoding stock codes
+        customer_index: KeyIndex decoding customer codes
+    """
+
+    quantity: np.ndarray
+    amount_cents: np.ndarray
+    day_ordinal: np.ndarray
+    is_return: np.ndarray
+    missing_customer_id: np.ndarray
+    missing_description: np.ndarray
+    country: np.ndarray
+    stock_code: np.ndarray
+    customer: np.ndarray
+    description: list[str]
+    invoice_date: list[datetime]
+    invoice_time: np.ndarray
+    country_index: KeyIndex[str]
+    stock_index: KeyIndex[str]
+    customer_index: KeyIndex[str | None]
+
+    def __len__(self) -> int:
+        """Number of rows in the batch."""
+        return len(self.quantity)
+
+    @classmethod
+    def from_transactions(
+        cls,
+        transactions: Sequence[Transaction | TransactionRow],
+        country_index: KeyIndex[str] | None = None,
+        stock_index: KeyIndex[str] | None = None,
+        customer_index: KeyIndex[str | None] | None = None,
+    ) -> "TransactionBatch":
+        """Build a batch from validated transactions, one column at a time.
+
+        Batches folded into the same accumulator must share their KeyIndex
+        objects so codes mean the same key in every batch; to_batches()
+        takes care of this.
+
+        Args:
+            transactions: Transactions or TransactionRows to convert (non-empty)
+            country_index: Shared country KeyIndex (new one if None)
+            stock_index: Shared stock code KeyIndex (new one if None)
+            customer_index: Shared CustomerID KeyIndex (new one if None)
+
+        Returns:
+            TransactionBatch holding the same rows
+        """
+        # One comprehension per column: each is a tight specialized loop,
+        # cheaper than building and transposing a tuple per row
+        description = [tx.Description for tx in transactions]
+        # isspace() matches strip() == "" without allocating a new string
+        missing_description = [not d or d.isspace() for d in description]
+        quantity = np.array([tx.Quantity for tx in transactions], dtype=np.int64)
+        unit_cents = np.array([to_cents(tx.UnitPrice) for tx in transactions], dtype=np.int64)
+        day_ordinal = [tx.InvoiceDate.toordinal() for tx in transactions]
+        # Slice compare: about twice as fast as startswith() in a comprehension
+        cancelled = [tx.InvoiceNo[:1] == "C" for tx in transactions]
+        customer_id = [tx.CustomerID for tx in transactions]
+        missing_customer_id = [c is None for c in customer_id]
+        invoice_date = [tx.InvoiceDate for tx in transactions]
+
+        country_index = KeyIndex() if country_index is None else country_index
+        stock_index = KeyIndex() if stock_index is None else stock_index
+        customer_index = KeyIndex() if customer_index is None else customer_index
+
+        return cls(
+            quantity=quantity,
+            amount_cents=quantity * unit_cents,
+            day_ordinal=np.array(day_ordinal, dtype=np.int64),
+            is_return=(quantity < 0) | np.array(cancelled, dtype=bool),
+            missing_customer_id=np.array(missing_customer_id, dtype=bool),
+            missing_description=np.array(missing_description, dtype=bool),
+            country=country_index.encode([tx.Country for tx in transactions]),
+            stock_code=stock_index.encode([tx.StockCode for tx in transactions]),
+            customer=customer_index.encode(customer_id),
+            description=description,
+            invoice_date=invoice_date,
+            invoice_time=timestamps_us(invoice_date),
+            country_index=country_index,
+            stock_index=stock_index,
+            customer_index=customer_index,
+        )
+
+    @classmethod
+    def from_columns(
+        cls,
+        block: ColumnBlock,
+        country_index: KeyIndex[str] | None = None,
+        stock_index: KeyIndex[str] | None = None,
+        customer_index: KeyIndex[str | None] | None = None,
+    ) -> "TransactionBatch":
+        """Build a batch from the valid rows of a column block.
+
+        Holds the same columns as from_transactions() over those rows, but
+        every per-value conversion (cents, ordinals, flags, key lookups) runs
+        once per distinct value and is gathered by code.
+
+        Args:
+            block: ColumnBlock from stream_columns() (at least one valid row)
+            country_index: Shared country KeyIndex (new one if None)
+            stock_index: Shared stock code KeyIndex (new one if None)
+            customer_index: Shared CustomerID KeyIndex (new one if None)
+
+        Returns:
+            TransactionBatch holding the block's valid rows
+        """
+        values = block.values
+        codes = block.codes
+
+        def derive(field: str, convert: Any, dtype: Any) -> np.ndarray:
+            distinct = np.array([convert(v) for v in values[field].tolist()], dtype=dtype)
+            column: np.ndarray = distinct[codes[field]]
+            return column
+
+        quantity = derive("Quantity", int, np.int64)
+        unit_cents = derive("UnitPrice", to_cents, np.int64)
+        cancelled = derive("InvoiceNo", lambda no: no[:1] == "C", bool)
+
+        country_index = KeyIndex() if country_index is None else country_index
+        stock_index = KeyIndex() if stock_index is None else stock_index
+        customer_index = KeyIndex() if customer_index is None else customer_index
+
+        return cls(
+            quantity=quantity,
+            amount_cents=quantity * unit_cents,
+            day_ordinal=derive("InvoiceDate", datetime.toordinal, np.int64),
+            is_return=(quantity < 0) | cancelled,
+            missing_customer_id=derive("CustomerID", lambda c: c is None, bool),
+            # isspace() matches strip() == "" without allocating a new string
+            missing_description=derive("Description", lambda d: not d or d.isspace(), bool),
+            country=country_index.encode_codes(values["Country"], codes["Country"]),
+            stock_code=stock_index.encode_codes(values["StockCode"], codes["StockCode"]),
+            customer=customer_index.encode_codes(values["CustomerID"], codes["CustomerID"]),
+            description=block.column("Description").tolist(),
+            invoice_date=block.column("InvoiceDate").tolist(),
+            invoice_time=derive("InvoiceDate", timestamp_us, np.int64),
+            country_index=country_index,
+            stock_index=stock_index,
+            customer_index=customer_index,
+        )
+
+
+def to_batches(
+    transactions: Iterable[Transaction], batch_size: int = DEFAULT_BATCH_SIZE
+) -> Iterator[TransactionBatch]:
+    """Convert a stream of transactions into columnar batches.
+
+    Args:
+        transactions: Iterable of Transaction objects (already unwrapped)
+        batch_size: Maximum rows per batch
+
+    Yields:
+        TransactionBatch objects of up to batch_size rows
+    """
+    country_index: KeyIndex[str] = KeyIndex()
+    stock_index: KeyIndex[str] = KeyIndex()
+    for chunk in chunk_stream(iter(transactions), batch_size):
+        yield TransactionBatch.from_transactions(chunk, country_index, stock_index)
+
+
+def _top_k_codes(values: np.ndarray, k: int) -> np.ndarray:
+    """Return the codes of the k largest values, largest first.
+
+    An O(n) partition finds the k-th largest value; only codes at or above it
+    are sorted. That sort is stable over first-seen-ordered codes, so ties
+    break the same way heapq.nlargest does over the row-wise dict.
+
+    Args:
+        values: One value per code
+        k: Number of codes to return
+
+    Returns:
+        Array of up to k codes
+    """
+    n = len(values)
+    if 0 < k < n:
+        threshold = np.partition(values, n - k)[n - k]
+        candidates = np.flatnonzero(values >= threshold)
+    else:
+        candidates = np.arange(n)
+    return candidates[np.argsort(-values[candidates], kind="stable")[:k]]
+
+
+def _group(keys: np.ndarray, *values: np.ndarray) -> tuple[list[Any], list[list[int]]]:
+    """Sum value columns per key, keeping keys in first-seen order.
+
+    Args:
+        keys: Group key per row
+        values: Integer columns to sum per group
+
+    Returns:
+        (unique keys in order of first appearance, one list of sums per value column)
+    """
+    unique, first_index, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    order = np.argsort(first_index, kind="stable")
+    sums: list[list[int]] = []
+    for column in values:
+        totals = np.zeros(len(unique), dtype=np.int64)
+        np.add.at(totals, inverse.ravel(), column)
+        sums.append(totals[order].tolist())
+    return unique[order].tolist(), sums
+
+
+def _add_by_code(
+    totals: np.ndarray, size: int, codes: np.ndarray, values: npt.ArrayLike | int
+) -> np.ndarray:
+    """Add values into per-code totals, growing the array to size codes.
+
+    Args:
+        totals: Running int64 totals indexed by code
+        size: Number of codes currently known
+        codes: Code per row
+        values: Value per row, or one int added for every row (e.g. 1 to count)
+
+    Returns:
+        The (possibly reallocated) totals array
+    """
+    if len(totals) < size:
+        totals = np.concatenate([totals, np.zeros(size - len(totals), dtype=np.int64)])
+    np.add.at(totals, codes, values)
+    return totals
+
+
+class RevenueAccumulator:
+    """Columnar accumulator equivalent to analyze_revenue."""
+
+    def __init__(self) -> None:
+        """Initialize empty aggregates (integer cents)."""
+        self.net_cents = 0
+        self.daily_cents: dict[str, int] = defaultdict(int)
+        self.monthly_cents: dict[str, int] = defaultdict(int)
+        self.transaction_count = 0
+        self.return_count = 0
+
+    def update(self, batch: TransactionBatch) -> None:
+        """Fold one batch into the aggregates."""
+        self.transaction_count += len(batch)
+        self.return_count += int(batch.is_return.sum())
+        self.net_cents += int(batch.amount_cents.sum())
+
+        ordinals, (day_sums,) = _group(batch.day_ordinal, batch.amount_cents)
+        for ordinal, total in zip(ordinals, day_sums):
+            day = date.fromordinal(ordinal)
+            month_key = f"{day.year:04d}-{day.month:02d}"
+            self.daily_cents[f"{month_key}-{day.day:02d}"] += total
+            self.monthly_cents[month_key] += total
+
+    def finalize(self) -> RevenueResult:
+        """Build the RevenueResult from the aggregates."""
+        # Returns carry negative amounts, so gross and net sum the same rows
+        gross_revenue = from_cents(self.net_cents)
+        net_revenue = from_cents(self.net_cents)
+
+        logger.info(
+            "revenue_analysis_completed",
+            gross_revenue=str(gross_revenue),
+            net_revenue=str(net_revenue),
+            transaction_count=self.transaction_count,
+            return_count=self.return_count,
+        )
+
+        return RevenueResult(
+            gross_revenue=gross_revenue,
+            net_revenue=net_revenue,
+            daily_revenue={k: from_cents(v) for k, v in self.daily_cents.items()},
+            monthly_revenue={k: from_cents(v) for k, v in self.monthly_cents.items()},
+            transaction_count=self.transaction_count,
+            return_count=self.return_count,
+        )
+
+
+class GeographyAccumulator:
+    """Columnar accumulator equivalent to analyze_geography."""
+
+    def __init__(self) -> None:
+        """Initialize empty aggregates (integer cents, indexed by country code)."""
+        self.country_cents = np.zeros(0, dtype=np.int64)
+        self.country_counts = np.zeros(0, dtype=np.int64)
+        self.labels: list[str] = []
+
+    def update(self, batch: TransactionBatch) -> None:
+        """Fold one batch into the aggregates."""
+        size = len(batch.country_index)
+        self.labels = batch.country_index.labels
+        self.country_cents = _add_by_code(
+            self.country_cents, size, batch.country, batch.amount_cents
+        )
+        self.country_counts = _add_by_code(self.country_counts, size, batch.country, 1)
+
+    def finalize(self) -> GeographyResult:
+        """Build the GeographyResult from the aggregates."""
+        # Codes are first-seen ordered, matching the row-wise dict order
+        country_revenue = {
+            country: from_cents(c)
+            for country, c in zip(self.labels, self.country_cents.tolist())
+        }
+        country_counts = dict(zip(self.labels, self.country_counts.tolist()))
+        total_revenue = from_cents(int(self.country_cents.sum()))
+        ranked = np.argsort(-self.country_cents, kind="stable")
+        countries_by_revenue = [self.labels[code] for code in ranked.tolist()]
+
+        # Calculate revenue share percentages
+        country_revenue_share: dict[str, float] = {}
+        if total_revenue > 0:
+            for country, revenue in country_revenue.items():
+                share = float((revenue / total_revenue) * 100)
+                country_revenue_share[country] = share
+
+        logger.info(
+            "geography_analysis_completed",
+            country_count=len(country_revenue),
+            total_revenue=str(total_revenue),
+        )
+
+        return GeographyResult(
+            country_revenue=country_revenue,
+            country_transaction_counts=country_counts,
+            country_revenue_share=country_revenue_share,
+            total_revenue=total_revenue,
+            countries_by_revenue=countries_by_revenue,
+        )
+
+
+class ProductsAccumulator:
+    """Columnar accumulator equivalent to analyze_products."""
+
+    def __init__(self, top_k: int = 10) -> None:
+        """Initialize empty aggregates (integer cents).
+
+        Args:
+            top_k: Number of top products to return
+        """
+        self.top_k = top_k
+        # Indexed by stock code
+        self.product_cents = np.zeros(0, dtype=np.int64)
+        self.product_quantities = np.zeros(0, dtype=np.int64)
+        self.product_counts = np.zeros(0, dtype=np.int64)
+        self.product_descriptions: dict[int, str] = {}
+        self.labels: list[str] = []
+
+    def update(self, batch: TransactionBatch) -> None:
+        """Fold one batch into the aggregates."""
+        size = len(batch.stock_index)
+        codes = batch.stock_code
+        self.labels = batch.stock_index.labels
+        self.product_cents = _add_by_code(self.product_cents, size, codes, batch.amount_cents)
+        self.product_quantities = _add_by_code(
+            self.product_quantities, size, codes, batch.quantity
+        )
+        self.product_counts = _add_by_code(self.product_counts, size, codes, 1)
+
+        # Keep the most recent description (last non-empty row per code)
+        descriptions = batch.description
+        described = np.flatnonzero([bool(d) for d in descriptions])
+        last_codes, last_index = np.unique(codes[described][::-1], return_index=True)
+        last_rows = described[::-1][last_index]
+        self.product_descriptions.update(
+            zip(last_codes.tolist(), (descriptions[i] for i in last_rows.tolist()))
+        )
+
+    def finalize(self) -> ProductsResult:
+        """Build the ProductsResult from the aggregates."""
+        order = _top_k_codes(self.product_cents, self.top_k)
+
+        top_products = [
+            ProductMetrics(
+                stock_code=self.labels[code],
+                description=self.product_descriptions.get(code, "Unknown"),
+                revenue=from_cents(int(self.product_cents[code])),
+                quantity_sold=int(self.product_quantities[code]),
+                transaction_count=int(self.product_counts[code]),
+            )
+            for code in order.tolist()
+        ]
+        total_revenue = from_cents(int(self.product_cents.sum()))
+        total_product_count = len(self.product_cents)
+
+        logger.info(
+            "products_analysis_completed",
+            total_product_count=total_product_count,
+            top_k=len(top_products),
+            total_revenue=str(total_revenue),
+        )
+
+        return ProductsResult(
+            top_products=top_products,
+            total_product_count=total_product_count,
+            total_revenue=total_revenue,
+        )
+
+
+class ReturnsAccumulator:
+    """Columnar accumulator equivalent to analyze_returns."""
+
+    def __init__(self) -> None:
+        """Initialize empty aggregates (integer cents)."""
+        self.total_transactions = 0
+        self.return_transactions = 0
+        self.return_cents = 0
+        # Indexed by stock code: number of returns, and the sequence number of
+        # the code's first return (for row-wise-compatible tie-breaking)
+        self.returned_counts = np.zeros(0, dtype=np.int64)
+        self.first_returned = np.zeros(0, dtype=np.int64)
+        self.labels: list[str] = []
+
+    def update(self, batch: TransactionBatch) -> None:
+        """Fold one batch into the aggregates."""
+        self.total_transactions += len(batch)
+        mask = batch.is_return
+        returns = int(np.count_nonzero(mask))
+        if returns == 0:
+            return
+
+        size = len(batch.stock_index)
+        self.labels = batch.stock_index.labels
+        codes = batch.stock_code[mask]
+        self.returned_counts = _add_by_code(self.returned_counts, size, codes, 1)
+        if len(self.first_returned) < size:
+            self.first_returned = np.concatenate(
+                [self.first_returned, np.full(size - len(self.first_returned), NOT_RETURNED)]
+            )
+        returned, first_index = np.unique(codes, return_index=True)
+        new = self.first_returned[returned] == NOT_RETURNED
+        self.first_returned[returned[new]] = self.return_transactions + first_index[new]
+
+        self.return_transactions += returns
+        self.return_cents += int(batch.amount_cents[mask].sum())
+
+    def finalize(self) -> ReturnsResult:
+        """Build the ReturnsResult from the aggregates."""
+        return_revenue_impact = from_cents(self.return_cents)
+
+        # Calculate return rate
+        return_rate = (
+            (self.return_transactions / self.total_transactions * 100)
+            if self.total_transactions > 0
+            else 0.0
+        )
+
+        # Top 10 returned products by frequency; ties go to the product
+        # returned first, as with Counter.most_common() in the row-wise path
+        returned = np.flatnonzero(self.returned_counts)
+        counts = self.returned_counts[returned]
+        top = returned[np.lexsort((self.first_returned[returned], -counts))[:10]]
+        top_returned = {self.labels[code]: int(self.returned_counts[code]) for code in top.tolist()}
+
+        logger.info(
+            "returns_analysis_completed",
+            total_transactions=self.total_transactions,
+            return_transactions=self.return_transactions,
+            return_rate=f"{return_rate:.2f}%",
+            return_revenue_impact=str(return_revenue_impact),
+        )
+
+        return ReturnsResult(
+            total_transactions=self.total_transactions,
+            return_transactions=self.return_transactions,
+            return_rate=return_rate,
+            return_revenue_impact=return_revenue_impact,
+            top_returned_products=top_returned,
+        )
+
+
+class DataQualityAccumulator:
+    """Columnar accumulator equivalent to analyze_data_quality."""
+
+    def __init__(self) -> None:
+        """Initialize counters."""
+        self.total_rows = 0
+        self.missing_customer_id = 0
+        self.missing_description = 0
+        self.incomplete_rows = 0
+
+    def update(self, batch: TransactionBatch) -> None:
+        """Fold one batch into the counters."""
+        self.total_rows += len(batch)
+        self.missing_customer_id += int(batch.missing_customer_id.sum())
+        self.missing_description += int(batch.missing_description.sum())
+        self.incomplete_rows += int(
+            np.count_nonzero(batch.missing_customer_id | batch.missing_description)
+        )
+
+    def finalize(self) -> DataQualityResult:
+        """Build the DataQualityResult from the counters."""
+        total_rows = self.total_rows
+
+        # A row is complete if it has both CustomerID and Description
+        complete_rows = total_rows - self.incomplete_rows
+        completeness_rate = (complete_rows / total_rows * 100) if total_rows > 0 else 0.0
+
+        logger.info(
+            "data_quality_analysis_completed",
+            total_rows=total_rows,
+            missing_customer_id=self.missing_customer_id,
+            missing_description=self.missing_description,
+            completeness_rate=f"{completeness_rate:.2f}%",
+        )
+
+        return DataQualityResult(
+            total_rows=total_rows,
+            valid_rows=total_rows,
+            missing_customer_id=self.missing_customer_id,
+            missing_description=self.missing_description,
+            completeness_rate=completeness_rate,
+        )
+
+
+@dataclass(slots=True)
+class CoreAnalyticsResult:
+    """Results of the five core aggregations.
+
+    Attributes:
+        revenue: Revenue analysis results
+        geography: Geographic analysis results
+        products: Product analysis results
+        returns: Returns analysis results
+        data_quality: Data quality results
+    """
+
+    revenue: RevenueResult
+    geography: GeographyResult
+    products: ProductsResult
+    returns: ReturnsResult
+    data_quality: DataQualityResult
+
+
+class MultiAnalyzer:
+    """Runs all five core accumulators together in a single pass.
+
+    Each batch is handed to every accumulator while it is hot in cache, so
+    the input is iterated once instead of once per analyzer (and no tee
+    buffer is needed to replay it).
+    """
+
+    def __init__(self, top_k: int = 10) -> None:
+        """Initialize the accumulators.
+
+        Args:
+            top_k: Number of top products to return
+        """
+        self.revenue = RevenueAccumulator()
+        self.geography = GeographyAccumulator()
+        self.products = ProductsAccumulator(top_k)
+        self.returns = ReturnsAccumulator()
+        self.data_quality = DataQualityAccumulator()
+
+    def update(self, batch: TransactionBatch) -> None:
+        """Fold one batch into every accumulator."""
+        self.revenue.update(batch)
+        self.geography.update(batch)
+        self.products.update(batch)
+        self.returns.update(batch)
+        self.data_quality.update(batch)
+
+    def finalize(self) -> CoreAnalyticsResult:
+        """Build every result from the accumulated aggregates."""
+        return CoreAnalyticsResult(
+            revenue=self.revenue.finalize(),
+            geography=self.geography.finalize(),
+            products=self.products.finalize(),
+            returns=self.returns.finalize(),
+            data_quality=self.data_quality.finalize(),
+        )
+
+
+def analyze_batches(
+    batches: Iterator[TransactionBatch], top_k: int = 10
+) -> CoreAnalyticsResult:
+    """Run all five core analyses over a batch stream in one pass.
+
+    Args:
+        batches: Iterator of TransactionBatch objects
+        top_k: Number of top products to return
+
+    Returns:
+        CoreAnalyticsResult with every core result
+    """
+    logger.info("core_analysis_started", top_k=top_k, mode="columnar")
+
+    analyzer = MultiAnalyzer(top_k)
+    for batch in batches:
+        analyzer.update(batch)
+    return analyzer.finalize()
+
+
+R_co = TypeVar("R_co", covariant=True)
+
+
+class _BatchAccumulator(Protocol[R_co]):
+    """Any of the accumulators above, finalizing to a result of type R_co."""
+
+    def update(self, batch: TransactionBatch) -> None:
+        """Fold one batch into the aggregates."""
+
+    def finalize(self) -> R_co:
+        """Build the result from the aggregates."""
+
+
+def _run(accumulator: _BatchAccumulator[R_co], batches: Iterator[TransactionBatch]) -> R_co:
+    """Feed every batch to a single accumulator and finalize it."""
+    for batch in batches:
+        accumulator.update(batch)
+    return accumulator.finalize()
+
+
+def analyze_revenue_batches(batches: Iterator[TransactionBatch]) -> RevenueResult:
+    """Columnar equivalent of analyze_revenue.
+
+    Args:
+        batches: Iterator of TransactionBatch objects
+
+    Returns:
+        RevenueResult identical to the row-wise analyzer's
+    """
+    return _run(RevenueAccumulator(), batches)
+
+
+def analyze_geography_batches(batches: Iterator[TransactionBatch]) -> GeographyResult:
+    """Columnar equivalent of analyze_geography.
+
+    Args:
+        batches: Iterator of TransactionBatch objects
+
+    Returns:
+        GeographyResult identical to the row-wise analyzer's
+    """
+    return _run(GeographyAccumulator(), batches)
+
+
+def analyze_products_batches(
+    batches: Iterator[TransactionBatch], top_k: int = 10
+) -> ProductsResult:
+    """Columnar equivalent of analyze_products.
+
+    Args:
+        batches: Iterator of TransactionBatch objects
+        top_k: Number of top products to return
+
+    Returns:
+        ProductsResult identical to the row-wise analyzer's
+    """
+    return _run(ProductsAccumulator(top_k), batches)
+
+
+def analyze_returns_batches(batches: Iterator[TransactionBatch]) -> ReturnsResult:
+    """Columnar equivalent of analyze_returns.
+
+    Args:
+        batches: Iterator of TransactionBatch objects
+
+    Returns:
+        ReturnsResult identical to the row-wise analyzer's
+    """
+    return _run(ReturnsAccumulator(), batches)
+
+
+def analyze_data_quality_batches(batches: Iterator[TransactionBatch]) -> DataQualityResult:
+    """Columnar equivalent of analyze_data_quality.
+
+    Args:
+        batches: Iterator of TransactionBatch objects
+
+    Returns:
+        DataQualityResult identical to the row-wise analyzer's
+    """
+    return _run(DataQualityAccumulator(), batches)
@@ -13,7 +13,7 @@ from streamsight.logging_conf import get_logger
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class DataQualityResult:
     """Results from data quality analysis.
 
@@ -55,21 +55,28 @@ def analyze_data_quality(stream: Iterator[Ok[Transaction]]) -> DataQualityResult
     total_rows = 0
     missing_customer_id = 0
     missing_description = 0
+    incomplete_rows = 0
 
     # Single pass through the stream
     for result in stream:
         tx = result.unwrap()
         total_rows += 1
 
-        if tx.CustomerID is None:
+        no_customer = tx.CustomerID is None
+        no_description = not tx.Description or tx.Description.strip() == ""
+
+        if no_customer:
             missing_customer_id += 1
 
-        if not tx.Description or tx.Description.strip() == "":
+        if no_description:
             missing_description += 1
 
+        if no_customer or no_description:
+            incomplete_rows += 1
+
     # Calculate completeness rate
     # A row is complete if it has both CustomerID and Description
-    complete_rows = total_rows - max(missing_customer_id, missing_description)
+    complete_rows = total_rows - incomplete_rows
     completeness_rate = (complete_rows / total_rows * 100) if total_rows > 0 else 0.0
 
     logger.info(
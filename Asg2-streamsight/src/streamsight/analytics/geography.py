@@ -3,12 +3,11 @@
 This module analyzes sales by country/region.
 """
 
-from collections import defaultdict
+from collections import Counter, defaultdict
 from dataclasses import dataclass
-from decimal import Decimal
 from typing import Iterator
 
-from streamsight.core.money import Money, divide_money
+from streamsight.core.money import Money, divide_money, from_cents
 from streamsight.core.types import Ok
 from streamsight.io.schema import Transaction
 from streamsight.logging_conf import get_logger
@@ -16,7 +15,7 @@ from streamsight.logging_conf import get_logger
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class GeographyResult:
     """Results from geographic analysis.
 
@@ -25,12 +24,14 @@ class GeographyResult:
         country_transaction_counts: Transaction count by country
         country_revenue_share: Revenue share percentage by country
         total_revenue: Total revenue across all countries
+        countries_by_revenue: Countries ordered by revenue, highest first
     """
 
     country_revenue: dict[str, Money]
     country_transaction_counts: dict[str, int]
     country_revenue_share: dict[str, float]
     total_revenue: Money
+    countries_by_revenue: list[str]
 
 
 def analyze_geography(stream: Iterator[Ok[Transaction]]) -> GeographyResult:
@@ -53,21 +54,26 @@ def analyze_geography(stream: Iterator[Ok[Transaction]]) -> GeographyResult:
     """
     logger.info("geography_analysis_started")
 
-    # Accumulators
-    country_revenue: dict[str, Decimal] = defaultdict(lambda: Decimal("0"))
-    country_counts: dict[str, int] = defaultdict(int)
-    total_revenue = Decimal("0")
+    # Accumulators (integer cents)
+    country_cents: dict[str, int] = defaultdict(int)
+    country_counts: Counter[str] = Counter()
+    total_cents = 0
 
     # Single pass through the stream
     for result in stream:
         tx = result.unwrap()
 
-        amount = tx.total_amount
+        cents = tx.total_cents
         country = tx.Country
 
-        country_revenue[country] += amount
+        country_cents[country] += cents
         country_counts[country] += 1
-        total_revenue += amount
+        total_cents += cents
+
+    country_revenue = {country: from_cents(c) for country, c in country_cents.items()}
+    # Stable on ties, so equal revenues keep first-seen order
+    countries_by_revenue = sorted(country_cents, key=country_cents.__getitem__, reverse=True)
+    total_revenue = from_cents(total_cents)
 
     # Calculate revenue share percentages
     country_revenue_share: dict[str, float] = {}
@@ -83,9 +89,10 @@ def analyze_geography(stream: Iterator[Ok[Transaction]]) -> GeographyResult:
     )
 
     return GeographyResult(
-        country_revenue=dict(country_revenue),
+        country_revenue=country_revenue,
         country_transaction_counts=dict(country_counts),
         country_revenue_share=country_revenue_share,
         total_revenue=total_revenue,
+        countries_by_revenue=countries_by_revenue,
     )
 
@@ -5,12 +5,11 @@ all products in memory.
 """
 
 import heapq
-from collections import defaultdict
+from collections import Counter, defaultdict
 from dataclasses import dataclass
-from decimal import Decimal
 from typing import Iterator
 
-from streamsight.core.money import Money
+from streamsight.core.money import Money, from_cents
 from streamsight.core.types import Ok
 from streamsight.io.schema import Transaction
 from streamsight.logging_conf import get_logger
@@ -18,7 +17,7 @@ from streamsight.logging_conf import get_logger
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProductMetrics:
     """Metrics for a single product.
 
@@ -37,7 +36,7 @@ class ProductMetrics:
     transaction_count: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ProductsResult:
     """Results from product analysis.
 
@@ -75,58 +74,55 @@ def analyze_products(stream: Iterator[Ok[Transaction]], top_k: int = 10) -> Prod
     logger.info("products_analysis_started", top_k=top_k)
 
     # Accumulators for all products
-    product_revenue: dict[str, Decimal] = defaultdict(lambda: Decimal("0"))
-    product_quantities: dict[str, int] = defaultdict(int)
-    product_counts: dict[str, int] = defaultdict(int)
+    product_cents: dict[str, int] = defaultdict(int)
+    product_quantities: Counter[str] = Counter()
+    product_counts: Counter[str] = Counter()
     product_descriptions: dict[str, str] = {}
-    total_revenue = Decimal("0")
+    total_cents = 0
 
     # Single pass through the stream
     for result in stream:
         tx = result.unwrap()
 
         stock_code = tx.StockCode
-        amount = tx.total_amount
+        cents = tx.total_cents
 
-        product_revenue[stock_code] += amount
+        product_cents[stock_code] += cents
         product_quantities[stock_code] += tx.Quantity
         product_counts[stock_code] += 1
-        total_revenue += amount
+        total_cents += cents
 
         # Keep the most recent description
         if tx.Description:
             product_descriptions[stock_code] = tx.Description
 
-    # Use heapq to find top K products efficiently
-    # We want the largest revenues, so we use negative values for min-heap
-    top_k_items = heapq.nlargest(
-        top_k,
-        product_revenue.items(),
-        key=lambda x: x[1],  # Sort by revenue
-    )
+    # Use heapq to find top K products efficiently, ranking stock codes by
+    # revenue through the dict's own (C-level) lookup rather than a lambda
+    top_k_codes = heapq.nlargest(top_k, product_cents, key=product_cents.__getitem__)
 
     # Build ProductMetrics for top products
     top_products = [
         ProductMetrics(
             stock_code=stock_code,
             description=product_descriptions.get(stock_code, "Unknown"),
-            revenue=revenue,
+            revenue=from_cents(product_cents[stock_code]),
             quantity_sold=product_quantities[stock_code],
             transaction_count=product_counts[stock_code],
         )
-        for stock_code, revenue in top_k_items
+        for stock_code in top_k_codes
     ]
+    total_revenue = from_cents(total_cents)
 
     logger.info(
         "products_analysis_completed",
-        total_product_count=len(product_revenue),
+        total_product_count=len(product_cents),
         top_k=len(top_products),
         total_revenue=str(total_revenue),
     )
 
     return ProductsResult(
         top_products=top_products,
-        total_product_count=len(product_revenue),
+        total_product_count=len(product_cents),
         total_revenue=total_revenue,
     )
 
@@ -3,11 +3,11 @@
 This module analyzes return patterns and calculates return rates.
 """
 
+from collections import Counter
 from dataclasses import dataclass
-from decimal import Decimal
 from typing import Iterator
 
-from streamsight.core.money import Money
+from streamsight.core.money import Money, from_cents
 from streamsight.core.types import Ok
 from streamsight.io.schema import Transaction
 from streamsight.logging_conf import get_logger
@@ -15,7 +15,7 @@ from streamsight.logging_conf import get_logger
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ReturnsResult:
     """Results from returns analysis.
 
@@ -58,8 +58,8 @@ def analyze_returns(stream: Iterator[Ok[Transaction]]) -> ReturnsResult:
     # Accumulators
     total_transactions = 0
     return_transactions = 0
-    return_revenue_impact = Decimal("0")
-    returned_product_counts: dict[str, int] = {}
+    return_cents = 0
+    returned_product_counts: Counter[str] = Counter()
 
     # Single pass through the stream
     for result in stream:
@@ -68,13 +68,10 @@ def analyze_returns(stream: Iterator[Ok[Transaction]]) -> ReturnsResult:
 
         if tx.is_return:
             return_transactions += 1
-            return_revenue_impact += tx.total_amount
+            return_cents += tx.total_cents
 
             # Track which products are returned most
-            stock_code = tx.StockCode
-            returned_product_counts[stock_code] = (
-                returned_product_counts.get(stock_code, 0) + 1
-            )
+            returned_product_counts[tx.StockCode] += 1
 
     # Calculate return rate
     return_rate = (
@@ -84,13 +81,9 @@ def analyze_returns(stream: Iterator[Ok[Transaction]]) -> ReturnsResult:
     )
 
     # Sort returned products by frequency (top 10)
-    top_returned = dict(
-        sorted(
-            returned_product_counts.items(),
-            key=lambda x: x[1],
-            reverse=True,
-        )[:10]
-    )
+    top_returned = dict(returned_product_counts.most_common(10))
+
+    return_revenue_impact = from_cents(return_cents)
 
     logger.info(
         "returns_analysis_completed",
@@ -1,15 +1,16 @@
 """Revenue aggregation and analysis.
 
 This module performs single-pass revenue calculations with financial accuracy.
+Amounts are accumulated as integer cents (exact, and much cheaper than
+Decimal addition) and converted back to Money once at the end.
 """
 
 from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime
-from decimal import Decimal
 from typing import Iterator
 
-from streamsight.core.money import Money
+from streamsight.core.money import Money, from_cents
 from streamsight.core.types import Ok
 from streamsight.io.schema import Transaction
 from streamsight.logging_conf import get_logger
@@ -17,7 +18,7 @@ from streamsight.logging_conf import get_logger
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class RevenueResult:
     """Results from revenue analysis.
 
@@ -58,13 +59,16 @@ def analyze_revenue(stream: Iterator[Ok[Transaction]]) -> RevenueResult:
     """
     logger.info("revenue_analysis_started")
 
-    # Accumulators
-    gross_revenue = Decimal("0")
-    net_revenue = Decimal("0")
-    daily_revenue: dict[str, Decimal] = defaultdict(lambda: Decimal("0"))
-    monthly_revenue: dict[str, Decimal] = defaultdict(lambda: Decimal("0"))
+    # Accumulators (integer cents)
+    gross_cents = 0
+    net_cents = 0
+    daily_cents: dict[str, int] = defaultdict(int)
+    monthly_cents: dict[str, int] = defaultdict(int)
     transaction_count = 0
     return_count = 0
+    # Day ordinal -> (date_key, month_key); rows cluster by day, so each
+    # key pair is formatted once per unique date rather than once per row
+    period_keys: dict[int, tuple[str, str]] = {}
 
     # Single pass through the stream
     for result in stream:
@@ -72,26 +76,36 @@ def analyze_revenue(stream: Iterator[Ok[Transaction]]) -> RevenueResult:
         transaction_count += 1
 
         # Calculate transaction amount
-        amount = tx.total_amount
+        cents = tx.total_cents
 
         # Update gross revenue (includes all transactions)
-        gross_revenue += amount
+        gross_cents += cents
 
         # Update net revenue (positive for sales, negative for returns)
         # Returns have negative amounts, so they reduce net revenue
-        net_revenue += amount
+        net_cents += cents
 
         # Track returns
         if tx.is_return:
             return_count += 1
 
+        # Daily and monthly keys
+        invoice_date = tx.InvoiceDate
+        ordinal = invoice_date.toordinal()
+        keys = period_keys.get(ordinal)
+        if keys is None:
+            month_key = f"{invoice_date.year:04d}-{invoice_date.month:02d}"
+            keys = period_keys[ordinal] = (f"{month_key}-{invoice_date.day:02d}", month_key)
+        date_key, month_key = keys
+
         # Daily aggregation
-        date_key = tx.InvoiceDate.strftime("%Y-%m-%d")
-        daily_revenue[date_key] += amount
+        daily_cents[date_key] += cents
 
         # Monthly aggregation
-        month_key = tx.InvoiceDate.strftime("%Y-%m")
-        monthly_revenue[month_key] += amount
+        monthly_cents[month_key] += cents
+
+    gross_revenue = from_cents(gross_cents)
+    net_revenue = from_cents(net_cents)
 
     logger.info(
         "revenue_analysis_completed",
@@ -104,8 +118,8 @@ def analyze_revenue(stream: Iterator[Ok[Transaction]]) -> RevenueResult:
     return RevenueResult(
         gross_revenue=gross_revenue,
         net_revenue=net_revenue,
-        daily_revenue=dict(daily_revenue),
-        monthly_revenue=dict(monthly_revenue),
+        daily_revenue={k: from_cents(v) for k, v in daily_cents.items()},
+        monthly_revenue={k: from_cents(v) for k, v in monthly_cents.items()},
         transaction_count=transaction_count,
         return_count=return_count,
     )
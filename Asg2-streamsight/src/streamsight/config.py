@@ -5,8 +5,9 @@ for type safety and validation.
 """
 
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -16,15 +17,19 @@ class Config(BaseSettings):
     """Main configuration for StreamSight pipeline.
 
     Attributes:
-        input_file: Path to the input CSV file
+        input_file: Path to the input CSV (or Parquet) file
         output_dir: Base directory for all outputs
         top_k_products: Number of top products to track
         zscore_threshold: Z-score threshold for anomaly detection
+        anomaly_display_k: Number of top anomalies kept in the results
         rfm_whale_percentile: Percentile threshold for whale customers
         rfm_reference_date: Reference date for RFM recency calculation
         chunk_size: Size of chunks for streaming operations
+        csv_engine: CSV reader ("csv" stdlib or "pyarrow" column batches)
+        workers: Processes for row-by-row validation
         enable_anomaly_detection: Whether to run anomaly detection
         enable_rfm_analysis: Whether to run RFM analysis
+        enable_cache: Whether to reuse results from an identical earlier run
         log_level: Logging level
     """
 
@@ -57,6 +62,11 @@ class Config(BaseSettings):
         description="Z-score threshold for anomaly detection",
         gt=0.0,
     )
+    anomaly_display_k: int = Field(
+        default=100,
+        description="Number of top anomalies kept in the results",
+        ge=1,
+    )
     rfm_whale_percentile: int = Field(
         default=99,
         description="Percentile threshold for whale customers (1-100)",
@@ -70,10 +80,19 @@ class Config(BaseSettings):
 
     # Performance tuning
     chunk_size: int = Field(
-        default=1000,
-        description="Chunk size for streaming operations",
+        default=65_536,
+        description="Rows per chunk; bounds peak memory of the streaming pass",
         ge=100,
     )
+    csv_engine: Literal["csv", "pyarrow"] = Field(
+        default="csv",
+        description="CSV reader: stdlib csv row by row, or pyarrow column batches (fast extra)",
+    )
+    workers: int = Field(
+        default=1,
+        description="Processes for row-by-row validation (1 = in-process; unused by pyarrow)",
+        ge=1,
+    )
 
     # Feature flags
     enable_anomaly_detection: bool = Field(
@@ -84,6 +103,10 @@ class Config(BaseSettings):
         default=True,
         description="Enable RFM whale analysis",
     )
+    enable_cache: bool = Field(
+        default=False,
+        description="Reuse cached results when the input and settings are unchanged",
+    )
 
     # Logging
     log_level: str = Field(
@@ -111,6 +134,11 @@ class Config(BaseSettings):
         """Directory for error/DLQ outputs."""
         return self.output_dir / "errors"
 
+    @property
+    def cache_dir(self) -> Path:
+        """Directory for cached pipeline results."""
+        return self.output_dir / "cache"
+
     def ensure_output_dirs(self) -> None:
         """Create all output directories if they don't exist."""
         self.figures_dir.mkdir(parents=True, exist_ok=True)
@@ -118,3 +146,15 @@ class Config(BaseSettings):
         self.reports_dir.mkdir(parents=True, exist_ok=True)
         self.errors_dir.mkdir(parents=True, exist_ok=True)
 
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Return the process-wide Config, loaded from the environment once.
+
+    The instance is shared, so callers that need different settings should
+    derive a copy (e.g. with model_copy(update=...)) rather than mutate it.
+
+    Returns:
+        The cached Config instance
+    """
+    return Config()
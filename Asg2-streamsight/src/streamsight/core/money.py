@@ -17,6 +17,7 @@ True
 """
 
 from decimal import Decimal, ROUND_HALF_UP, InvalidOperation
+from functools import lru_cache
 from typing import Union, Iterator
 
 from streamsight.core.types import Money
@@ -28,6 +29,19 @@ FINANCIAL_ROUNDING = ROUND_HALF_UP
 # Standard precision for currency (2 decimal places)
 CURRENCY_PRECISION = Decimal("0.01")
 
+_quantize = Decimal.quantize
+
+
+@lru_cache(maxsize=8192)
+def _parse_money_text(text: str) -> Money:
+    """Parse and quantize a money string, memoized by string.
+
+    A catalog has thousands of distinct prices, not one per row, so most
+    rows hit the cache. Decimal is immutable, so cached values are shared
+    safely.
+    """
+    return _quantize(Decimal(text), CURRENCY_PRECISION, rounding=FINANCIAL_ROUNDING)
+
 
 def parse_money(value: Union[str, int, float, Decimal]) -> Money:
     """Parse a value into a Money (Decimal) type with financial precision.
@@ -51,13 +65,10 @@ def parse_money(value: Union[str, int, float, Decimal]) -> Money:
     """
     try:
         if isinstance(value, Decimal):
-            decimal_value = value
-        else:
-            # Convert to string first to avoid float precision issues
-            decimal_value = Decimal(str(value))
-
-        # Round to standard currency precision
-        return decimal_value.quantize(CURRENCY_PRECISION, rounding=FINANCIAL_ROUNDING)
+            # Round to standard currency precision
+            return _quantize(value, CURRENCY_PRECISION, rounding=FINANCIAL_ROUNDING)
+        # Convert to string first to avoid float precision issues
+        return _parse_money_text(value if isinstance(value, str) else str(value))
     except (InvalidOperation, ValueError) as e:
         msg = f"Cannot parse '{value}' as Money: {e}"
         raise InvalidOperation(msg) from e
@@ -66,6 +77,8 @@ def parse_money(value: Union[str, int, float, Decimal]) -> Money:
 def sum_money(values: Iterator[Money]) -> Money:
     """Sum monetary values with proper precision.
 
+    Intermediate sums are not rounded; only the total is quantized.
+
     Args:
         values: Iterator of Money (Decimal) values
 
@@ -76,10 +89,9 @@ def sum_money(values: Iterator[Money]) -> Money:
         >>> sum_money(iter([Decimal('10.50'), Decimal('20.25')]))
         Decimal('30.75')
     """
-    total = Decimal("0")
-    for value in values:
-        total += value
-    return total.quantize(CURRENCY_PRECISION, rounding=FINANCIAL_ROUNDING)
+    # Builtin sum runs the same additions, in order, without a Python loop
+    total = sum(values, Decimal("0"))
+    return _quantize(total, CURRENCY_PRECISION, rounding=FINANCIAL_ROUNDING)
 
 
 def multiply_money(amount: Money, quantity: Union[int, Decimal]) -> Money:
@@ -96,13 +108,11 @@ def multiply_money(amount: Money, quantity: Union[int, Decimal]) -> Money:
         >>> multiply_money(Decimal('10.50'), 3)
         Decimal('31.50')
     """
-    if isinstance(quantity, int):
-        quantity_decimal = Decimal(quantity)
-    else:
-        quantity_decimal = quantity
-
-    result = amount * quantity_decimal
-    return result.quantize(CURRENCY_PRECISION, rounding=FINANCIAL_ROUNDING)
+    # Decimal * int converts the int exactly, so no Decimal(quantity) is
+    # needed; the rounding mode is passed positionally, which skips keyword
+    # argument parsing in the C implementation
+    result = amount * quantity
+    return _quantize(result, CURRENCY_PRECISION, FINANCIAL_ROUNDING)
 
 
 def divide_money(amount: Money, divisor: Union[int, Decimal]) -> Money:
@@ -135,6 +145,45 @@ def divide_money(amount: Money, divisor: Union[int, Decimal]) -> Money:
     return result.quantize(CURRENCY_PRECISION, rounding=FINANCIAL_ROUNDING)
 
 
+def to_cents(amount: Money) -> int:
+    """Convert a currency-precision amount to integer cents.
+
+    Integer addition is far cheaper than Decimal addition, so hot
+    aggregation loops accumulate cents and convert back once at the end.
+
+    Args:
+        amount: Amount with at most 2 decimal places
+
+    Returns:
+        The amount in cents
+
+    Examples:
+        >>> to_cents(Decimal('10.50'))
+        1050
+        >>> to_cents(Decimal('-2.55'))
+        -255
+    """
+    return int(amount.scaleb(2))
+
+
+def from_cents(cents: int) -> Money:
+    """Convert integer cents back to a Money (Decimal) amount.
+
+    Args:
+        cents: Amount in cents
+
+    Returns:
+        Decimal value with 2 decimal places
+
+    Examples:
+        >>> from_cents(1050)
+        Decimal('10.50')
+        >>> from_cents(0)
+        Decimal('0.00')
+    """
+    return Decimal(cents) * CURRENCY_PRECISION
+
+
 def format_money(amount: Money, currency_symbol: str = "$") -> str:
     """Format a monetary amount for display.
 
@@ -40,19 +40,23 @@ def broadcast(stream: Iterator[T], n: int) -> tuple[Iterator[T], ...]:
 
 
 def partition(
-    stream: Iterator[T], predicate: Callable[[T], bool]
+    stream: Iterator[T], predicate: Callable[[T], bool], lazy: bool = True
 ) -> tuple[Iterator[T], Iterator[T]]:
     """Partition a stream into two iterators based on a predicate.
 
     Returns:
         (true_iterator, false_iterator) - Elements where predicate is True/False
 
-    Note: This consumes the entire stream and stores results in memory.
-    Use only when the split is necessary and datasets are manageable.
+    By default both sides are lazy views over one tee of the stream, so
+    consumers that advance them roughly in lockstep keep O(1) memory. As with
+    broadcast, the tee buffers whatever one side has read ahead of the
+    other, and the predicate runs once per item on each side. Pass
+    lazy=False to consume the stream up front into two lists instead.
 
     Args:
         stream: Source iterator to partition
-        predicate: Function to test each element
+        predicate: Function to test each element (must be pure when lazy)
+        lazy: Split on demand instead of materializing both sides
 
     Returns:
         Tuple of (true_items, false_items)
@@ -65,7 +69,11 @@ def partition(
         >>> list(odds)
         [1, 3, 5]
     """
-    # We need to consume the stream once and split it
+    if lazy:
+        true_source, false_source = itertools.tee(stream, 2)
+        return filter(predicate, true_source), itertools.filterfalse(predicate, false_source)
+
+    # Consume the stream once and split it
     true_items = []
     false_items = []
 
@@ -193,9 +201,7 @@ def chunk_stream(stream: Iterator[T], size: int) -> Iterator[list[T]]:
         [[0, 1, 2], [3, 4, 5], [6, 7, 8], [9]]
     """
     iterator = iter(stream)
-    while True:
-        chunk = list(itertools.islice(iterator, size))
-        if not chunk:
-            break
-        yield chunk
+    # Each chunk is filled by islice in C; iter() with a None sentinel stops
+    # at the first empty chunk without a generator frame per chunk
+    return iter(lambda: list(itertools.islice(iterator, size)) or None, None)
 
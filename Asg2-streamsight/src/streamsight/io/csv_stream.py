@@ -1,33 +1,172 @@
 """Generator-based CSV streaming with validation and Dead Letter Queue.
 
 This module provides memory-efficient streaming of CSV data, validating
-each row and routing invalid rows to a Dead Letter Queue (DLQ).
+each row and routing invalid rows to a Dead Letter Queue (DLQ). Parquet
+files (written by the Excel converter's polars engine) are streamed the
+same way, one record batch at a time.
+
+CSV tokenizing uses the stdlib csv module by default. The ``pyarrow`` engine
+(``fast`` extra) parses blocks with Arrow's multithreaded C++ reader instead
+and validates them column-wise: each distinct value of a column is validated
+once per block through the Transaction field validators, and rows whose
+fields all pass are assembled without re-running them. Rows with any
+failing field are validated again as a whole, so the DLQ sees exactly the
+errors the row-by-row path would report. stream_columns() yields those
+blocks as validated columns (structure of arrays) instead of one object per
+row, for consumers that aggregate column-wise.
+
+Validation (pydantic plus date parsing) is the most expensive step and holds
+the GIL, so ``workers > 1`` spreads it over a process pool. Rows are sent in
+chunks and results come back in input order, so downstream aggregation is
+unaffected.
 """
 
 import csv
+import itertools
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterator, Any
+from typing import Any, Callable, Generator, Iterable, Iterator
 
+import numpy as np
+import orjson
 from pydantic import ValidationError
+from pydantic_core import SchemaError, SchemaValidator
 
+from streamsight.core.stream_utils import chunk_stream
 from streamsight.core.types import Result, Ok, Err
-from streamsight.io.schema import Transaction
+from streamsight.io.schema import Transaction, TransactionRow
 from streamsight.logging_conf import get_logger
 
 logger = get_logger(__name__)
 
+CSV_ENGINES = ("csv", "pyarrow")
 
-def stream_transactions(filepath: Path) -> Iterator[Result[Transaction, tuple[int, dict[str, Any], ValidationError]]]:
+# Row number of the first data row (row 1 is the header)
+FIRST_ROW_NUM = 2
+
+# Rows per task sent to a validation worker
+VALIDATION_CHUNK_SIZE = 4096
+
+# Read buffer for CSV input
+CSV_BUFFER_SIZE = 1 << 20
+
+# Bytes per Arrow record batch for the pyarrow engine (pyarrow's default)
+ARROW_BLOCK_SIZE = 1 << 20
+
+# Write buffer for the DLQ file
+DLQ_BUFFER_SIZE = 1 << 20
+
+# Transaction fields in declaration order (the order of TransactionRow)
+TRANSACTION_FIELDS = tuple(Transaction.model_fields)
+
+# Transaction.model_validate without its Python wrapper: the compiled
+# pydantic-core validator, called once per row on the ingest path
+_validate_transaction = Transaction.__pydantic_validator__.validate_python
+
+
+def _field_validators() -> dict[str, Callable[[object], object]]:
+    """Build one validator per Transaction field.
+
+    Each is compiled from the field's entry in the model's core schema, so it
+    applies the model's constraints, config and field validators at
+    pydantic-core speed. That schema layout is internal to pydantic: if it
+    does not match, each field is instead validated with the model's public
+    validate_assignment() on a scratch instance, which gives the same
+    results for about 1 us more per value. Neither variant is thread-safe.
+
+    Returns:
+        Validator for each field name, raising ValidationError on bad input
+    """
+    schema = Transaction.__pydantic_core_schema__
+    try:
+        fields = schema["schema"]["fields"]
+        return {
+            name: SchemaValidator(fields[name]["schema"], schema["config"]).validate_python
+            for name in TRANSACTION_FIELDS
+        }
+    except (KeyError, TypeError, SchemaError) as e:
+        logger.warning("field_validators_fallback", error=repr(e))
+
+    validate_assignment = Transaction.__pydantic_validator__.validate_assignment
+    scratch = Transaction.model_construct()
+
+    def field_validator(name: str) -> Callable[[object], object]:
+        def validate(raw: object) -> object:
+            return validate_assignment(scratch, name, raw).__dict__[name]
+
+        return validate
+
+    return {name: field_validator(name) for name in TRANSACTION_FIELDS}
+
+
+_FIELD_VALIDATORS = _field_validators()
+
+DLQEntry = tuple[int, dict[str, Any], ValidationError]
+TransactionResult = Result[Transaction, DLQEntry]
+
+
+# (True, Transaction) or (False, DLQEntry): the allocation-free form of a
+# TransactionResult used on the ingest hot path (valid rows may also be
+# TransactionRow, see stream_validated)
+TaggedResult = tuple[bool, Any]
+
+
+@dataclass(slots=True)
+class ColumnBlock:
+    """The validated rows of one input block, dictionary-encoded per field.
+
+    Row i of the block is valid when valid[i]; valid rows are stored by
+    field as an index (codes) into that field's parsed distinct values, so
+    per-value work such as converting prices to cents is done once per
+    distinct value and gathered with NumPy.
+
+    Attributes:
+        first_row_num: Row number of the block's first row
+        valid: Whether each row of the block passed validation
+        values: Per field, the parsed values referenced by codes
+        codes: Per field, the index into values for each valid row
+        errors: DLQ entries for the invalid rows, in file order
+    """
+
+    first_row_num: int
+    valid: np.ndarray
+    values: dict[str, np.ndarray]
+    codes: dict[str, np.ndarray]
+    errors: list[DLQEntry]
+
+    def __len__(self) -> int:
+        """Number of valid rows."""
+        return len(self.codes[TRANSACTION_FIELDS[0]])
+
+    @property
+    def row_nums(self) -> np.ndarray:
+        """Row number of each valid row."""
+        return np.flatnonzero(self.valid) + self.first_row_num
+
+    def column(self, field: str) -> np.ndarray:
+        """Return one field's value for every valid row (object array)."""
+        column: np.ndarray = self.values[field][self.codes[field]]
+        return column
+
+
+def stream_transactions(
+    filepath: Path, engine: str = "csv", workers: int = 1
+) -> Iterator[TransactionResult]:
     """Stream transactions from a CSV file with lazy evaluation.
 
-    This generator reads the CSV line-by-line, never loading the entire
-    dataset into memory. Invalid rows are yielded as Err results containing
+    This generator reads the CSV line-by-line (or a ``.parquet`` file batch by
+    batch), never loading the entire dataset into memory. Invalid rows are yielded as Err results containing
     the row number, raw data, and validation error.
 
     Memory Complexity: O(1) - only one row in memory at a time
 
     Args:
-        filepath: Path to the CSV file
+        filepath: Path to the CSV or Parquet file
+        engine: CSV tokenizer, one of CSV_ENGINES (ignored for Parquet)
+        workers: Validation processes for row-by-row validation; 1 validates
+            in this process (the pyarrow CSV engine validates column-wise)
 
     Yields:
         Result[Transaction, Error] - Ok(Transaction) or Err((row_num, row_data, error))
@@ -35,6 +174,7 @@ def stream_transactions(filepath: Path) -> Iterator[Result[Transaction, tuple[in
     Raises:
         FileNotFoundError: If the CSV file doesn't exist
         IOError: If the file cannot be read
+        ValueError: If engine is not one of CSV_ENGINES, or workers < 1
 
     Examples:
         >>> for result in stream_transactions(Path("data.csv")):
@@ -45,49 +185,80 @@ def stream_transactions(filepath: Path) -> Iterator[Result[Transaction, tuple[in
         ...         row_num, data, error = result.unwrap_err()
         ...         # Handle validation error
     """
+    for ok, value in stream_validated(filepath, engine, workers):
+        yield Ok(value) if ok else Err(value)
+
+
+def stream_validated(
+    filepath: Path, engine: str = "csv", workers: int = 1, as_rows: bool = False
+) -> Iterator[TaggedResult]:
+    """Stream validation results as (ok, value) tuples.
+
+    Same rows, order and errors as stream_transactions(), without an Ok or
+    Err object per row: valid rows are (True, Transaction) and invalid ones
+    (False, (row_num, row_data, error)). For throughput-sensitive consumers
+    such as the pipeline runner.
+
+    With as_rows, the pyarrow CSV engine yields valid rows as TransactionRow
+    tuples, which are cheaper to build than models; the row-by-row paths
+    still yield Transaction (converting would only add work), so consumers
+    must accept either type.
+
+    Args:
+        filepath: Path to the CSV or Parquet file
+        engine: CSV tokenizer, one of CSV_ENGINES (ignored for Parquet)
+        workers: Validation processes for row-by-row validation
+        as_rows: Allow TransactionRow for valid rows
+
+    Yields:
+        (True, Transaction) or (False, (row_num, row_data, error))
+
+    Raises:
+        FileNotFoundError: If the CSV file doesn't exist
+        IOError: If the file cannot be read
+        ValueError: If engine is not one of CSV_ENGINES, or workers < 1
+    """
     if not filepath.exists():
         msg = f"CSV file not found: {filepath}"
         raise FileNotFoundError(msg)
 
-    logger.info("streaming_started", filepath=str(filepath))
+    if workers < 1:
+        msg = f"workers must be at least 1, got {workers}"
+        raise ValueError(msg)
+
+    rows = _read_rows(filepath, engine)
+
+    logger.info("streaming_started", filepath=str(filepath), workers=workers)
 
     valid_count = 0
     error_count = 0
 
+    if engine == "pyarrow" and filepath.suffix != ".parquet":
+        # Column-wise validation; already vectorized, so workers don't apply
+        results = _validate_arrow_batches(filepath, as_rows)
+    elif workers > 1:
+        results = _validate_parallel(rows, workers)
+    else:
+        results = (
+            _validate_row(row_num, row)
+            for row_num, row in enumerate(rows, start=FIRST_ROW_NUM)
+        )
+
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            # Use DictReader for automatic header parsing
-            reader = csv.DictReader(f)
-
-            # Validate that we have a header
-            if reader.fieldnames is None:
-                msg = "CSV file is empty or has no header"
-                raise ValueError(msg)
-
-            logger.debug(
-                "csv_header_parsed",
-                fields=reader.fieldnames,
-                field_count=len(reader.fieldnames),
-            )
-
-            # Stream each row
-            for row_num, row in enumerate(reader, start=2):  # Start at 2 (after header)
-                try:
-                    # Validate and parse the transaction
-                    tx = Transaction.model_validate(row)
-                    valid_count += 1
-                    yield Ok(tx)
-
-                except ValidationError as e:
-                    # Route to DLQ
-                    error_count += 1
-                    logger.debug(
-                        "validation_error",
-                        row_num=row_num,
-                        error_count=error_count,
-                        errors=e.error_count(),
-                    )
-                    yield Err((row_num, row, e))
+        for result in results:
+            if result[0]:
+                valid_count += 1
+            else:
+                # Route to DLQ
+                error_count += 1
+                row_num, _, e = result[1]
+                logger.debug(
+                    "validation_error",
+                    row_num=row_num,
+                    error_count=error_count,
+                    errors=e.error_count(),
+                )
+            yield result
 
     except Exception as e:
         logger.error("streaming_failed", error=str(e), filepath=str(filepath))
@@ -105,8 +276,537 @@ def stream_transactions(filepath: Path) -> Iterator[Result[Transaction, tuple[in
     )
 
 
+def _validate_row(row_num: int, row: dict[str, Any]) -> TaggedResult:
+    """Validate one raw row into (True, Transaction) or (False, (row_num, row, error))."""
+    try:
+        return True, _validate_transaction(row)
+    except ValidationError as e:
+        return False, (row_num, row, e)
+
+
+def _validate_chunk(first_row_num: int, rows: list[dict[str, Any]]) -> list[TaggedResult]:
+    """Validate a chunk of consecutive rows (runs in a worker process)."""
+    return [_validate_row(row_num, row) for row_num, row in enumerate(rows, start=first_row_num)]
+
+
+def _validate_parallel(
+    rows: Iterator[dict[str, Any]], workers: int
+) -> Iterator[TaggedResult]:
+    """Validate rows in a process pool, yielding results in input order.
+
+    At most two chunks per worker are in flight, so memory stays bounded by
+    the window rather than the file.
+
+    Args:
+        rows: Raw row dicts, in file order
+        workers: Number of worker processes
+
+    Yields:
+        The same results _validate_row would, in the same order
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: deque[Future[list[TaggedResult]]] = deque()
+        row_num = FIRST_ROW_NUM
+        for chunk in chunk_stream(rows, VALIDATION_CHUNK_SIZE):
+            pending.append(executor.submit(_validate_chunk, row_num, chunk))
+            row_num += len(chunk)
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def _validate_arrow_batches(filepath: Path, as_rows: bool = False) -> Iterator[TaggedResult]:
+    """Validate a CSV block by block with Arrow, yielding results in file order.
+
+    Produces the same results as validating every row dict from
+    _read_csv_rows_arrow() with Transaction.model_validate().
+
+    Args:
+        filepath: Path to the CSV file
+        as_rows: Yield valid rows as TransactionRow instead of Transaction
+
+    Yields:
+        (True, Transaction) or (False, (row_num, row, error)) per data row
+    """
+    from_validated = Transaction.from_validated
+    make_row = TransactionRow._make
+
+    for block in _arrow_column_blocks(filepath):
+        rows = zip(*(block.column(field).tolist() for field in TRANSACTION_FIELDS))
+        errors = iter(block.errors)
+        for ok in block.valid.tolist():
+            if not ok:
+                yield False, next(errors)
+            elif as_rows:
+                yield True, make_row(next(rows))
+            else:
+                yield True, from_validated(dict(zip(TRANSACTION_FIELDS, next(rows))))
+
+
+def stream_columns(filepath: Path) -> Iterator[ColumnBlock]:
+    """Stream a CSV as validated column blocks (structure of arrays).
+
+    The column-wise counterpart of stream_validated() for the pyarrow engine:
+    the same rows pass or fail, with the same DLQ entries, but valid rows
+    come out as dictionary-encoded columns rather than one object each.
+    Requires the optional ``pyarrow`` dependency (``fast`` extra).
+
+    Args:
+        filepath: Path to the CSV file
+
+    Yields:
+        One ColumnBlock per Arrow record batch (or re-read chunk), in file order
+
+    Raises:
+        FileNotFoundError: If the CSV file doesn't exist
+        ValueError: If the file is empty or has no header
+    """
+    if not filepath.exists():
+        msg = f"CSV file not found: {filepath}"
+        raise FileNotFoundError(msg)
+
+    logger.info("streaming_started", filepath=str(filepath), columnar=True)
+
+    valid_count = 0
+    error_count = 0
+    for block in _arrow_column_blocks(filepath):
+        valid_count += len(block)
+        error_count += len(block.errors)
+        yield block
+
+    logger.info(
+        "streaming_completed",
+        filepath=str(filepath),
+        valid_count=valid_count,
+        error_count=error_count,
+        total_count=valid_count + error_count,
+        error_rate=f"{error_count / (valid_count + error_count) * 100:.2f}%"
+        if (valid_count + error_count) > 0
+        else "0.00%",
+    )
+
+
+def _arrow_column_blocks(filepath: Path) -> Iterator[ColumnBlock]:
+    """Validate a CSV column-wise, one Arrow record batch at a time.
+
+    Each distinct value of a column is validated once per batch; rows with
+    any failing field are validated again as a whole for their DLQ entry.
+
+    Args:
+        filepath: Path to the CSV file
+
+    Yields:
+        One ColumnBlock per record batch
+    """
+    fields_set = set(TRANSACTION_FIELDS)
+    row_num = FIRST_ROW_NUM
+
+    for batch in _arrow_csv_batches(filepath):
+        if isinstance(batch, list):
+            # Rows re-read by csv.reader after a parse error
+            yield _block_from_rows(row_num, batch)
+            row_num += len(batch)
+            continue
+
+        size = batch.num_rows
+        if not fields_set <= set(batch.schema.names):
+            # Missing columns: let full validation report them row by row
+            yield _block_from_rows(row_num, batch.to_pylist())
+            row_num += size
+            continue
+
+        valid = np.ones(size, dtype=bool)
+        parsed = {}
+        for field in TRANSACTION_FIELDS:
+            encoded = batch.column(field).dictionary_encode()
+            codes = encoded.indices.to_numpy(zero_copy_only=False)
+            values, value_ok = _validate_distinct(field, encoded.dictionary.to_pylist())
+            valid &= value_ok[codes]
+            parsed[field] = (values, codes)
+
+        errors: list[DLQEntry] = []
+        fallback = False
+        for i in np.flatnonzero(~valid).tolist():
+            ok, error = _validate_row(row_num + i, batch.slice(i, 1).to_pylist()[0])
+            if ok:
+                # The field checks and model_validate disagree: trust the latter
+                fallback = True
+                break
+            errors.append(error)
+        if fallback:
+            yield _block_from_rows(row_num, batch.to_pylist())
+            row_num += size
+            continue
+
+        values_by_field = {}
+        codes_by_field = {}
+        for field, (values, codes) in parsed.items():
+            # Keep only the values valid rows use, renumbering their codes
+            codes = codes[valid]
+            used = np.zeros(len(values), dtype=bool)
+            used[codes] = True
+            values_by_field[field] = values[used]
+            codes_by_field[field] = (np.cumsum(used) - 1)[codes]
+
+        yield ColumnBlock(row_num, valid, values_by_field, codes_by_field, errors)
+        row_num += size
+
+
+def _block_from_rows(first_row_num: int, rows: list[dict[str, Any]]) -> ColumnBlock:
+    """Validate rows one by one into a ColumnBlock (one code per valid row).
+
+    Args:
+        first_row_num: Row number of the first row
+        rows: Raw row dicts, in file order
+
+    Returns:
+        ColumnBlock holding the same results as _validate_row() per row
+    """
+    results = [_validate_row(first_row_num + i, row) for i, row in enumerate(rows)]
+    transactions = [value for ok, value in results if ok]
+    values = {}
+    for field in TRANSACTION_FIELDS:
+        column = np.empty(len(transactions), dtype=object)
+        column[:] = [getattr(tx, field) for tx in transactions]
+        values[field] = column
+    identity = np.arange(len(transactions))
+    return ColumnBlock(
+        first_row_num=first_row_num,
+        valid=np.array([ok for ok, _ in results], dtype=bool),
+        values=values,
+        codes=dict.fromkeys(TRANSACTION_FIELDS, identity),
+        errors=[value for ok, value in results if not ok],
+    )
+
+
+def _validate_distinct(field: str, raw_values: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    """Validate distinct raw values of one Transaction field.
+
+    Uses the field's validator from _field_validators() (constraints,
+    whitespace stripping and field_validators), so a value passes here
+    exactly when it passes inside model_validate().
+
+    Args:
+        field: Transaction field name
+        raw_values: Distinct raw strings from the CSV column
+
+    Returns:
+        (parsed values as an object array, whether each value is valid)
+    """
+    validate = _FIELD_VALIDATORS[field]
+    parsed = np.empty(len(raw_values), dtype=object)
+    valid = np.zeros(len(raw_values), dtype=bool)
+    for i, raw in enumerate(raw_values):
+        try:
+            parsed[i] = validate(raw)
+        except ValidationError:
+            continue
+        valid[i] = True
+    return parsed, valid
+
+
+def fetch_transactions(
+    filepath: Path, row_nums: Iterable[int], engine: str = "csv"
+) -> dict[int, Transaction]:
+    """Re-read specific valid rows from a file.
+
+    Used by a second pass that only needs a few rows back (e.g. flagged
+    anomalies): rows are tokenized again but only the requested ones are
+    validated, and reading stops after the last one. The file must not
+    change between passes.
+
+    Args:
+        filepath: Path to the CSV or Parquet file
+        row_nums: Row numbers as reported by stream_transactions()
+        engine: CSV tokenizer, one of CSV_ENGINES (ignored for Parquet)
+
+    Returns:
+        Dictionary mapping row number to Transaction
+
+    Raises:
+        ValueError: If a requested row is missing or no longer valid
+    """
+    wanted = set(row_nums)
+    found: dict[int, Transaction] = {}
+    if not wanted:
+        return found
+
+    if engine == "csv" and filepath.suffix != ".parquet":
+        rows = _scan_csv_rows(filepath, wanted)
+    else:
+        rows = (
+            (row_num, row)
+            for row_num, row in enumerate(_read_rows(filepath, engine), start=FIRST_ROW_NUM)
+            if row_num in wanted
+        )
+
+    for row_num, row in rows:
+        # Raises ValidationError (a ValueError) if the file changed underneath
+        found[row_num] = Transaction.model_validate(row)
+        if len(found) == len(wanted):
+            break
+
+    if len(found) != len(wanted):
+        msg = f"Rows not found in {filepath}: {sorted(wanted - found.keys())[:10]}"
+        raise ValueError(msg)
+
+    return found
+
+
+def _scan_csv_rows(
+    filepath: Path, wanted: set[int]
+) -> Iterator[tuple[int, dict[str, Any]]]:
+    """Yield (row_num, row dict) for the wanted CSV rows only.
+
+    Tokenizes with csv.reader and builds a dict only for wanted rows, which
+    is about twice as fast as csv.DictReader over the whole file. Row
+    numbering and dict contents match _read_csv_rows().
+
+    Args:
+        filepath: Path to the CSV file
+        wanted: Row numbers to return
+
+    Yields:
+        (row_num, row) pairs in file order
+
+    Raises:
+        ValueError: If the file is empty or has no header
+    """
+    with open(filepath, "r", encoding="utf-8", buffering=CSV_BUFFER_SIZE) as f:
+        reader = csv.reader(f)
+        fieldnames = next(reader, None)
+        if fieldnames is None:
+            msg = "CSV file is empty or has no header"
+            raise ValueError(msg)
+
+        row_num = FIRST_ROW_NUM - 1
+        for values in reader:
+            # csv.DictReader skips blank lines without numbering them
+            if not values:
+                continue
+            row_num += 1
+            if row_num not in wanted:
+                continue
+            yield row_num, _row_dict(fieldnames, values)
+
+
+def _row_dict(fieldnames: list[str], values: list[str]) -> dict[Any, Any]:
+    """Key a csv.reader row by the header, exactly as csv.DictReader does.
+
+    Extra values go to a list under the None key and missing trailing
+    fields are None (DictReader's default restkey and restval).
+
+    Args:
+        fieldnames: Header row
+        values: Data row
+
+    Returns:
+        The row as a dict
+    """
+    row: dict[Any, Any] = dict(zip(fieldnames, values))
+    if len(values) > len(fieldnames):
+        row[None] = values[len(fieldnames):]
+    elif len(values) < len(fieldnames):
+        row.update(dict.fromkeys(fieldnames[len(values):]))
+    return row
+
+
+def _read_rows(filepath: Path, engine: str) -> Iterator[dict[str, Any]]:
+    """Pick the row reader for a file and CSV engine.
+
+    Args:
+        filepath: Path to the CSV or Parquet file
+        engine: CSV tokenizer, one of CSV_ENGINES (ignored for Parquet)
+
+    Returns:
+        Iterator of raw row dicts
+
+    Raises:
+        ValueError: If engine is not one of CSV_ENGINES
+    """
+    if engine not in CSV_ENGINES:
+        msg = f"Unknown CSV engine: {engine!r} (expected one of {CSV_ENGINES})"
+        raise ValueError(msg)
+
+    if filepath.suffix == ".parquet":
+        return _read_parquet_rows(filepath)
+    if engine == "pyarrow":
+        return _read_csv_rows_arrow(filepath)
+    return _read_csv_rows(filepath)
+
+
+def _read_csv_rows(filepath: Path) -> Iterator[dict[str, Any]]:
+    """Yield CSV rows as dicts keyed by the header.
+
+    Args:
+        filepath: Path to the CSV file
+
+    Yields:
+        One dict per data row
+
+    Raises:
+        ValueError: If the file is empty or has no header
+    """
+    with open(filepath, "r", encoding="utf-8", buffering=CSV_BUFFER_SIZE) as f:
+        # csv.reader yields lists from C; dicts are built here rather than by
+        # csv.DictReader, whose per-row __next__ runs in Python
+        reader = csv.reader(f)
+        fieldnames = next(reader, None)
+
+        # Validate that we have a header
+        if fieldnames is None:
+            msg = "CSV file is empty or has no header"
+            raise ValueError(msg)
+
+        logger.debug(
+            "csv_header_parsed",
+            fields=fieldnames,
+            field_count=len(fieldnames),
+        )
+
+        field_count = len(fieldnames)
+        for values in reader:
+            if len(values) == field_count:
+                yield dict(zip(fieldnames, values))
+            elif values:
+                # Blank lines are skipped, as csv.DictReader does
+                yield _row_dict(fieldnames, values)
+
+
+def _read_csv_rows_arrow(filepath: Path) -> Iterator[dict[str, Any]]:
+    """Yield CSV rows as dicts, parsed block by block with pyarrow.
+
+    Every column is read as a non-null string, exactly as csv.DictReader
+    returns it, so validation sees identical input. Requires the optional
+    ``pyarrow`` dependency (``fast`` extra).
+
+    Args:
+        filepath: Path to the CSV file
+
+    Yields:
+        One dict per data row
+
+    Raises:
+        ValueError: If the file is empty or has no header
+    """
+    for batch in _arrow_csv_batches(filepath):
+        if isinstance(batch, list):
+            yield from batch
+            continue
+        # Decode column by column, then zip into row dicts
+        names = batch.schema.names
+        columns = [column.to_pylist() for column in batch.columns]
+        for values in zip(*columns):
+            yield dict(zip(names, values))
+
+
+def _arrow_csv_batches(filepath: Path) -> Iterator[Any]:
+    """Yield a CSV's Arrow record batches, falling back to csv.reader rows.
+
+    pyarrow rejects a row with the wrong number of fields outright, and its
+    invalid_row_handler cannot say where that row was once values may span
+    lines. The csv engine instead keys such a row as csv.DictReader does and
+    lets validation send it to the DLQ. So on a parse error the file is
+    re-read with _read_csv_rows() from the first row not yet yielded, and
+    the rest of it comes out as lists of row dicts, numbered as before.
+
+    Args:
+        filepath: Path to the CSV file
+
+    Yields:
+        pyarrow.RecordBatch, then lists of row dicts after a parse error
+
+    Raises:
+        ValueError: If the file is empty or has no header
+    """
+    import pyarrow as pa
+
+    rows_read = 0
+    try:
+        for batch in _open_arrow_csv(filepath):
+            yield batch
+            rows_read += batch.num_rows
+    except pa.ArrowInvalid as e:
+        logger.warning(
+            "csv_parse_fallback",
+            filepath=str(filepath),
+            row_num=FIRST_ROW_NUM + rows_read,
+            error=str(e),
+        )
+        rows = itertools.islice(_read_csv_rows(filepath), rows_read, None)
+        yield from chunk_stream(rows, VALIDATION_CHUNK_SIZE)
+
+
+def _open_arrow_csv(filepath: Path) -> Any:
+    """Open a streaming pyarrow CSV reader with every column read as a string.
+
+    Values are non-null strings, exactly as csv.DictReader returns them.
+    Requires the optional ``pyarrow`` dependency (``fast`` extra).
+
+    Args:
+        filepath: Path to the CSV file
+
+    Returns:
+        pyarrow.csv.CSVStreamingReader yielding record batches
+
+    Raises:
+        ValueError: If the file is empty or has no header
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+
+    with open(filepath, "r", encoding="utf-8", newline="") as f:
+        fieldnames = next(csv.reader(f), None)
+
+    if not fieldnames:
+        msg = "CSV file is empty or has no header"
+        raise ValueError(msg)
+
+    logger.debug(
+        "csv_header_parsed",
+        fields=fieldnames,
+        field_count=len(fieldnames),
+    )
+
+    return pa_csv.open_csv(
+        filepath,
+        read_options=pa_csv.ReadOptions(block_size=ARROW_BLOCK_SIZE),
+        parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+        convert_options=pa_csv.ConvertOptions(
+            column_types={name: pa.string() for name in fieldnames},
+            strings_can_be_null=False,
+        ),
+    )
+
+
+def _read_parquet_rows(filepath: Path) -> Iterator[dict[str, Any]]:
+    """Yield Parquet rows as dicts, decoding one record batch at a time.
+
+    Requires the optional ``pyarrow`` dependency (``fast`` extra).
+
+    Args:
+        filepath: Path to the Parquet file
+
+    Yields:
+        One dict per row
+    """
+    import pyarrow.parquet as pq
+
+    parquet_file = pq.ParquetFile(filepath)
+
+    logger.debug(
+        "parquet_schema_parsed",
+        fields=parquet_file.schema_arrow.names,
+        row_groups=parquet_file.num_row_groups,
+    )
+
+    for batch in parquet_file.iter_batches():
+        yield from batch.to_pylist()
+
+
 def write_dlq(
-    dlq_stream: Iterator[tuple[int, dict[str, Any], ValidationError]],
+    dlq_stream: Iterator[DLQEntry],
     output_path: Path,
 ) -> int:
     """Write Dead Letter Queue entries to a JSONL file.
@@ -121,34 +821,64 @@ def write_dlq(
     Examples:
         >>> dlq_count = write_dlq(error_stream, Path("errors/bad_rows.jsonl"))
     """
-    import orjson
+    sink = dlq_sink(output_path)
+    count = next(sink)
+    try:
+        for entry in dlq_stream:
+            count = sink.send(entry)
+    finally:
+        sink.close()
+    return count
+
+
+def dlq_sink(output_path: Path) -> Generator[int, DLQEntry, None]:
+    """Write Dead Letter Queue entries to a JSONL file as they are sent.
+
+    A coroutine: prime it with next(), send() each (row_number, row_data,
+    error) tuple as the stream produces it, and close() it to flush the
+    file. Entries are written one at a time, so nothing is buffered beyond
+    the file's write buffer.
+
+    Args:
+        output_path: Path to write DLQ JSONL file
 
+    Yields:
+        Number of DLQ entries written so far (0 when primed)
+
+    Examples:
+        >>> sink = dlq_sink(Path("errors/bad_rows.jsonl"))
+        >>> next(sink)
+        0
+        >>> dlq_count = sink.send(entry)
+        >>> sink.close()
+    """
     logger.info("dlq_write_started", output_path=str(output_path))
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
     count = 0
 
-    with open(output_path, "wb") as f:
-        for row_num, row_data, error in dlq_stream:
-            # Format error details
-            error_details = {
-                "row_number": row_num,
-                "data": row_data,
-                "errors": [
-                    {
-                        "field": ".".join(str(loc) for loc in err["loc"]),
-                        "message": err["msg"],
-                        "type": err["type"],
-                    }
-                    for err in error.errors()
-                ],
-            }
-
-            # Write as JSONL (one JSON object per line)
-            f.write(orjson.dumps(error_details))
-            f.write(b"\n")
-            count += 1
-
-    logger.info("dlq_write_completed", output_path=str(output_path), count=count)
-    return count
-
+    try:
+        # One write per entry (orjson appends the newline) into a 1 MiB buffer
+        with open(output_path, "wb", buffering=DLQ_BUFFER_SIZE) as f:
+            while True:
+                row_num, row_data, error = yield count
+
+                # Format error details
+                error_details = {
+                    "row_number": row_num,
+                    "data": row_data,
+                    "errors": [
+                        {
+                            "field": ".".join(str(loc) for loc in err["loc"]),
+                            "message": err["msg"],
+                            "type": err["type"],
+                        }
+                        for err in error.errors()
+                    ],
+                }
+
+                # Write as JSONL (one JSON object per line)
+                f.write(orjson.dumps(error_details, option=orjson.OPT_APPEND_NEWLINE))
+                count += 1
+    finally:
+        logger.info("dlq_write_completed", output_path=str(output_path), count=count)
@@ -4,13 +4,100 @@ This module defines the Transaction model with proper validation,
 ensuring data quality at the ingestion layer.
 """
 
+import sys
 from datetime import datetime
+from functools import lru_cache
 from decimal import Decimal, InvalidOperation
-from typing import Optional
+from typing import Any, NamedTuple, Optional
 
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 
-from streamsight.core.money import parse_money, Money
+from streamsight.core.money import from_cents, parse_money, to_cents, Money
+
+_object_setattr = object.__setattr__
+
+# Instance slots of every pydantic 2.x BaseModel. from_validated() fills them
+# directly, and falls back to model_construct() if a release changes them.
+_MODEL_SLOTS = ("__dict__", "__pydantic_fields_set__", "__pydantic_extra__", "__pydantic_private__")
+_FAST_CONSTRUCT = BaseModel.__slots__ == _MODEL_SLOTS
+
+# Accepted InvoiceDate formats, in precedence order (month-first wins over
+# day-first when both fit)
+DATE_FORMATS = (
+    "%Y-%m-%d %H:%M:%S",
+    "%m/%d/%Y %H:%M",
+    "%d/%m/%Y %H:%M",
+    "%Y-%m-%d",
+    "%m/%d/%Y",
+    "%d/%m/%Y",
+)
+
+
+def _parse_common_date(text: str) -> datetime | None:
+    """Parse the common InvoiceDate shapes without strptime.
+
+    Only fixed, fully numeric shapes are accepted, so any result is the one
+    the DATE_FORMATS walk would give; anything else (including an invalid
+    month, which may still parse day-first) returns None for that walk.
+
+    Args:
+        text: Raw date string
+
+    Returns:
+        The parsed datetime, or None if the string needs the strptime walk
+    """
+    try:
+        if len(text) == 19 and text[4] == "-" and text[10] == " ":
+            # "%Y-%m-%d %H:%M:%S"
+            if text[7] == "-" and text[13] == ":" and text[16] == ":":
+                return datetime.fromisoformat(text)
+        elif len(text) == 10 and text[4] == "-" and text[7] == "-":
+            # "%Y-%m-%d"
+            return datetime.fromisoformat(text)
+        elif "/" in text[:3] and text.isascii():
+            # "%m/%d/%Y %H:%M" and "%m/%d/%Y", month first as in DATE_FORMATS
+            date, _, time = text.partition(" ")
+            month, day, year = date.split("/")
+            if not (
+                len(month) <= 2 and len(day) <= 2 and len(year) == 4
+                and (month + day + year).isdigit()
+            ):
+                return None
+            if not time:
+                return datetime(int(year), int(month), int(day))
+            hour, minute = time.split(":")
+            if len(hour) <= 2 and len(minute) <= 2 and (hour + minute).isdigit():
+                return datetime(int(year), int(month), int(day), int(hour), int(minute))
+    except ValueError:
+        pass
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(text: str) -> datetime | None:
+    """Parse a date string with the first matching DATE_FORMATS entry.
+
+    Memoized by string: every line of an invoice repeats its timestamp, so
+    most rows skip strptime (and its failed attempts) entirely. Results are
+    cached per value rather than per winning format, because a format cache
+    would change which of two ambiguous formats wins (e.g. "1/2/2011" read
+    day-first after a "13/1/2011" row).
+
+    Args:
+        text: Raw date string
+
+    Returns:
+        The parsed datetime, or None if no format matches
+    """
+    parsed = _parse_common_date(text)
+    if parsed is not None:
+        return parsed
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+    return None
 
 
 class Transaction(BaseModel):
@@ -111,24 +198,30 @@ class Transaction(BaseModel):
 
         if isinstance(v, str):
             # Try common date formats
-            formats = [
-                "%Y-%m-%d %H:%M:%S",
-                "%m/%d/%Y %H:%M",
-                "%d/%m/%Y %H:%M",
-                "%Y-%m-%d",
-                "%m/%d/%Y",
-                "%d/%m/%Y",
-            ]
-
-            for fmt in formats:
-                try:
-                    return datetime.strptime(v, fmt)
-                except ValueError:
-                    continue
+            parsed = _parse_date(v)
+            if parsed is not None:
+                return parsed
 
         msg = f"Cannot parse date: {v!r}"
         raise ValueError(msg)
 
+    @field_validator("StockCode", "Country")
+    @classmethod
+    def intern_key(cls, v: str) -> str:
+        """Intern low-cardinality grouping keys.
+
+        Every row for a given country or stock code then shares one string
+        object, so dict lookups in the aggregators hit the identity fast
+        path and buffered transactions don't hold duplicate strings.
+
+        Args:
+            v: Validated (stripped) value
+
+        Returns:
+            The interned string
+        """
+        return sys.intern(v)
+
     @field_validator("CustomerID", mode="before")
     @classmethod
     def validate_customer_id(cls, v: object) -> Optional[str]:
@@ -138,11 +231,36 @@ class Transaction(BaseModel):
             v: Raw value from CSV
 
         Returns:
-            Customer ID string or None
+            Customer ID string (interned, like the other grouping keys) or None
         """
         if v is None or v == "" or (isinstance(v, str) and v.strip() == ""):
             return None
-        return str(v).strip()
+        return sys.intern(str(v).strip())
+
+    @classmethod
+    def from_validated(cls, values: dict[str, Any]) -> "Transaction":
+        """Assemble a Transaction from already-validated field values.
+
+        Equivalent to model_construct(**values) for this model, which has no
+        aliases, extras, private attributes or post-init hook, without its
+        per-field alias bookkeeping. Only the field names are checked, and
+        only when assertions are enabled.
+
+        Args:
+            values: Final value for every field, keyed by field name
+
+        Returns:
+            Transaction holding exactly those values
+        """
+        assert values.keys() == _FIELD_NAMES, f"expected fields {sorted(_FIELD_NAMES)}"
+        if not _FAST_CONSTRUCT:
+            return cls.model_construct(**values)
+        tx = cls.__new__(cls)
+        _object_setattr(tx, "__dict__", values)
+        _object_setattr(tx, "__pydantic_fields_set__", set(values))
+        _object_setattr(tx, "__pydantic_extra__", None)
+        _object_setattr(tx, "__pydantic_private__", None)
+        return tx
 
     @property
     def is_return(self) -> bool:
@@ -152,18 +270,32 @@ class Transaction(BaseModel):
         - Negative quantity
         - Invoice number starting with 'C' (cancellation)
         """
-        return self.Quantity < 0 or self.InvoiceNo.startswith("C")
+        # A one-character slice compare is cheaper than startswith()
+        return self.Quantity < 0 or self.InvoiceNo[:1] == "C"
 
     @property
     def total_amount(self) -> Money:
         """Calculate the total transaction amount.
 
+        Derived from total_cents, which is exact because UnitPrice is
+        already quantized to cents.
+
         Returns:
             Quantity * UnitPrice (negative for returns)
         """
-        from streamsight.core.money import multiply_money
+        return from_cents(self.total_cents)
+
+    @property
+    def total_cents(self) -> int:
+        """Calculate the total transaction amount in integer cents.
 
-        return multiply_money(self.UnitPrice, self.Quantity)
+        Exact, since UnitPrice is already quantized to cents. Used by the
+        streaming aggregators, which sum ints instead of Decimals.
+
+        Returns:
+            Quantity * UnitPrice in cents (negative for returns)
+        """
+        return to_cents(self.UnitPrice) * self.Quantity
 
     def __repr__(self) -> str:
         """String representation for debugging."""
@@ -175,3 +307,48 @@ class Transaction(BaseModel):
             f"CustomerID={self.CustomerID!r})"
         )
 
+
+_FIELD_NAMES = frozenset(Transaction.model_fields)
+
+
+class TransactionRow(NamedTuple):
+    """A validated transaction as a plain tuple.
+
+    Same fields, in the same order, and the same derived properties as
+    Transaction, for the ingest hot path: building one from already
+    validated values costs about a third of Transaction.from_validated(),
+    and it is a third of the size. Code that only reads fields and the
+    properties accepts either type.
+    """
+
+    InvoiceNo: str
+    StockCode: str
+    Description: str
+    Quantity: int
+    InvoiceDate: datetime
+    UnitPrice: Money
+    CustomerID: Optional[str]
+    Country: str
+
+    @property
+    def is_return(self) -> bool:
+        """Check if this transaction is a return (see Transaction.is_return)."""
+        return self.Quantity < 0 or self.InvoiceNo[:1] == "C"
+
+    @property
+    def total_amount(self) -> Money:
+        """Calculate the total transaction amount (see Transaction.total_amount)."""
+        return from_cents(self.total_cents)
+
+    @property
+    def total_cents(self) -> int:
+        """Calculate the total amount in integer cents (see Transaction.total_cents)."""
+        return to_cents(self.UnitPrice) * self.Quantity
+
+    def to_transaction(self) -> Transaction:
+        """Convert back to a Transaction without re-validating.
+
+        Returns:
+            The equivalent Transaction
+        """
+        return Transaction.from_validated(self._asdict())
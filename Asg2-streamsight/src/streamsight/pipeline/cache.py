@@ -0,0 +1,156 @@
+"""On-disk cache of pipeline results for incremental reruns.
+
+Re-running the same code on an unchanged input file with unchanged analytics
+settings produces identical results, so the finished PipelineResults are
+pickled under the output directory, together with the run's DLQ file, and
+reused instead of re-streaming the whole dataset.
+"""
+
+import hashlib
+import pickle
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+import orjson
+
+from streamsight import __version__
+from streamsight.config import Config
+from streamsight.logging_conf import get_logger
+
+if TYPE_CHECKING:
+    from streamsight.pipeline.runner import PipelineResults
+
+logger = get_logger(__name__)
+
+def file_sha256(path: Path) -> str:
+    """Return the hex SHA-256 digest of a file, read in 1 MiB chunks.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex digest string
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=1)
+def _source_digest() -> str:
+    """Return a digest of the streamsight package's own source files.
+
+    Part of the cache key, so that changing any analyzer (or the layout of
+    the pickled result classes) invalidates earlier entries without a
+    version bump. Computed once per process.
+
+    Returns:
+        Hex digest string
+    """
+    package_dir = Path(__file__).resolve().parent.parent
+    digest = hashlib.sha256()
+    for path in sorted(package_dir.rglob("*.py")):
+        digest.update(path.relative_to(package_dir).as_posix().encode())
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+class PipelineCache:
+    """Pickled PipelineResults keyed by input content and analytics settings.
+
+    The key combines the input file's SHA-256, every config field that can
+    change a result, the package version and a digest of the package's
+    source. Any change to those produces a new key, so stale entries are
+    never read.
+    """
+
+    def __init__(self, config: Config) -> None:
+        """Initialize the cache for a configuration.
+
+        Args:
+            config: Pipeline configuration (input file must exist)
+        """
+        self.config = config
+        self.key = self._compute_key()
+
+    @property
+    def path(self) -> Path:
+        """File holding the cached results for this key."""
+        return self.config.cache_dir / f"results-{self.key}.pickle"
+
+    def _compute_key(self) -> str:
+        """Build the cache key from input content and result-affecting settings."""
+        config = self.config
+        settings = orjson.dumps(
+            {
+                "top_k_products": config.top_k_products,
+                "zscore_threshold": config.zscore_threshold,
+                "anomaly_display_k": config.anomaly_display_k,
+                "rfm_whale_percentile": config.rfm_whale_percentile,
+                "rfm_reference_date": config.rfm_reference_date,
+                "enable_anomaly_detection": config.enable_anomaly_detection,
+                "enable_rfm_analysis": config.enable_rfm_analysis,
+                "version": __version__,
+                "source": _source_digest(),
+            },
+            option=orjson.OPT_SORT_KEYS,
+        )
+        input_digest = file_sha256(config.input_file)[:16]
+        settings_digest = hashlib.sha256(settings).hexdigest()[:16]
+        return f"{input_digest}-{settings_digest}"
+
+    def load(self) -> Optional[tuple["PipelineResults", bytes]]:
+        """Return the cached results and DLQ file contents.
+
+        Returns:
+            (results, dlq_rows), or None on a miss or unreadable entry
+        """
+        if not self.path.exists():
+            logger.info("pipeline_cache_miss", key=self.key)
+            return None
+
+        try:
+            with open(self.path, "rb") as f:
+                results: PipelineResults
+                dlq_rows: bytes
+                results, dlq_rows = pickle.load(f)
+        except (
+            OSError,
+            EOFError,
+            ValueError,
+            TypeError,
+            AttributeError,
+            ImportError,
+            pickle.UnpicklingError,
+        ) as e:
+            # A torn file, an unsupported protocol or classes that moved since
+            # the entry was written (ModuleNotFoundError, ...) is a miss
+            logger.warning("pipeline_cache_unreadable", path=str(self.path), error=repr(e))
+            return None
+
+        logger.info("pipeline_cache_hit", key=self.key)
+        return results, dlq_rows
+
+    def save(self, results: "PipelineResults", dlq_rows: bytes) -> None:
+        """Store results for this key, replacing older entries.
+
+        Args:
+            results: Results of a full pipeline run
+            dlq_rows: Contents of the DLQ file the run wrote, restored on a hit
+        """
+        cache_dir = self.config.cache_dir
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        for old in cache_dir.glob("results-*.pickle"):
+            old.unlink()
+
+        # Write then rename, so an interrupted run never leaves a torn entry
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump((results, dlq_rows), f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path.replace(self.path)
+
+        logger.info("pipeline_cache_saved", key=self.key, path=str(self.path))
@@ -8,11 +8,17 @@ from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any, Iterator
 
+from streamsight.analytics.anomaly import detect_anomalies
+from streamsight.analytics.data_quality import analyze_data_quality
+from streamsight.analytics.geography import analyze_geography
+from streamsight.analytics.products import analyze_products
+from streamsight.analytics.returns import analyze_returns
+from streamsight.analytics.revenue import analyze_revenue
 from streamsight.core.types import Ok
 from streamsight.io.schema import Transaction
 
 
-@dataclass
+@dataclass(slots=True)
 class Aggregator:
     """Metadata for an analytics aggregator.
 
@@ -116,16 +122,12 @@ class AnalyticsRegistry:
 def create_default_registry() -> AnalyticsRegistry:
     """Create a registry with all default aggregators.
 
+    Each call builds a fresh registry: callers enable and disable entries
+    on their own copy.
+
     Returns:
         Configured AnalyticsRegistry
     """
-    from streamsight.analytics.data_quality import analyze_data_quality
-    from streamsight.analytics.geography import analyze_geography
-    from streamsight.analytics.products import analyze_products
-    from streamsight.analytics.returns import analyze_returns
-    from streamsight.analytics.revenue import analyze_revenue
-    from streamsight.analytics.anomaly import detect_anomalies
-
     registry = AnalyticsRegistry()
 
     # Register core analytics
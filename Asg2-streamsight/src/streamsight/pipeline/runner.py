@@ -1,33 +1,42 @@
 """Pipeline orchestration and execution.
 
 This module is the heart of StreamSight, orchestrating the streaming
-pipeline with broadcasting to multiple aggregators.
+pipeline that feeds every aggregator from a single chunked pass.
 """
 
 from dataclasses import dataclass
+from decimal import Decimal
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 import orjson
 
-from streamsight.analytics.anomaly import AnomalyResult
+from streamsight.analytics.anomaly import AnomalyAccumulator, AnomalyResult
+from streamsight.analytics.columnar import KeyIndex, MultiAnalyzer, TransactionBatch
 from streamsight.analytics.data_quality import DataQualityResult
 from streamsight.analytics.geography import GeographyResult
 from streamsight.analytics.products import ProductsResult
 from streamsight.analytics.returns import ReturnsResult
 from streamsight.analytics.revenue import RevenueResult
 from streamsight.config import Config
-from streamsight.core.stream_utils import broadcast, partition
-from streamsight.io.csv_stream import stream_transactions, write_dlq
+from streamsight.core.stream_utils import chunk_stream
+from streamsight.io.csv_stream import (
+    FIRST_ROW_NUM,
+    DLQEntry,
+    dlq_sink,
+    fetch_transactions,
+    stream_columns,
+    stream_validated,
+)
 from streamsight.logging_conf import get_logger
-from streamsight.pipeline.registry import create_default_registry
-from streamsight.rfm.calculator import build_customer_profiles
+from streamsight.pipeline.cache import PipelineCache
+from streamsight.rfm.calculator import ProfileBuilder
 from streamsight.rfm.segmentation import segment_customers, SegmentationResult
 
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineResults:
     """Complete results from the analytics pipeline.
 
@@ -57,14 +66,21 @@ def run_pipeline(config: Config) -> PipelineResults:
 
     This function orchestrates the entire streaming pipeline:
     1. Stream CSV data with validation
-    2. Partition valid/invalid rows (DLQ)
-    3. Broadcast valid stream to N aggregators
-    4. Execute all aggregators in parallel (conceptually)
+    2. Split each chunk into valid rows and DLQ errors, write the errors to
+       the DLQ and feed the valid rows to every aggregator (the core
+       analytics run together as one vectorized update over a columnar batch)
+    3. Finalize the aggregators
+    4. Optionally detect anomalies (flagged rows are re-read from the input)
     5. Optionally run RFM analysis (two-pass on aggregates)
     6. Write results to disk
 
-    Memory Efficiency: The pipeline uses generator broadcasting to process
-    the dataset once, with O(unique_keys) memory for aggregates.
+    When config.enable_cache is set and an earlier run used the same input
+    content and analytics settings, its results and DLQ file are restored
+    from config.cache_dir instead (see PipelineCache).
+
+    Memory Efficiency: The dataset is processed once, config.chunk_size rows
+    at a time, with O(unique_keys) memory for aggregates plus 16 bytes per
+    row for anomaly detection. Invalid rows go straight to the DLQ file.
 
     Args:
         config: Configuration object
@@ -86,73 +102,87 @@ def run_pipeline(config: Config) -> PipelineResults:
     # Ensure output directories exist
     config.ensure_output_dirs()
 
+    dlq_path = config.errors_dir / "bad_rows.jsonl"
+
+    # Unchanged input and settings: reuse the previous run's results
+    cache = PipelineCache(config) if config.enable_cache else None
+    if cache is not None:
+        entry = cache.load()
+        if entry is not None:
+            cached, dlq_rows = entry
+            dlq_path.write_bytes(dlq_rows)
+            _write_results(config, cached.revenue, cached.geography, cached.products,
+                           cached.returns, cached.data_quality, cached.anomaly, cached.rfm)
+            logger.info("pipeline_completed", cached=True)
+            return cached
+
     # Step 1: Stream and validate transactions
     logger.info("step_1_streaming_data", input_file=str(config.input_file))
-    stream = stream_transactions(config.input_file)
 
-    # Step 2: Partition into valid and error streams
-    logger.info("step_2_partitioning_stream")
-    valid_stream, error_stream = partition(stream, lambda r: r.is_ok())
-
-    # Convert error stream to tuples and write DLQ
-    error_list = [result.unwrap_err() for result in error_stream]
-    dlq_count = write_dlq(
-        iter(error_list), config.errors_dir / "bad_rows.jsonl"
+    # Step 2: Feed every aggregator chunk by chunk in a single pass. Each
+    # chunk is dropped after use, so peak memory is O(chunk_size + unique
+    # keys) rather than O(rows).
+    logger.info("step_2_streaming_aggregation", chunk_size=config.chunk_size)
+
+    # Core analytics (always enabled): one fused, vectorized pass
+    core = MultiAnalyzer(config.top_k_products)
+    anomaly = (
+        AnomalyAccumulator(config.zscore_threshold, config.anomaly_display_k)
+        if config.enable_anomaly_detection
+        else None
     )
-
-    # Step 3: Broadcast valid stream to multiple aggregators
-    # We need 5 core aggregators + optionally anomaly detection + RFM
-    num_streams = 6 if config.enable_anomaly_detection else 5
-    num_streams += 1 if config.enable_rfm_analysis else 0
-
-    logger.info("step_3_broadcasting_stream", num_streams=num_streams)
-    streams = broadcast(valid_stream, num_streams)
-
-    # Step 4: Execute aggregators
-    logger.info("step_4_executing_aggregators")
-
-    stream_idx = 0
-
-    # Core analytics (always enabled)
-    from streamsight.analytics.revenue import analyze_revenue
-    from streamsight.analytics.geography import analyze_geography
-    from streamsight.analytics.products import analyze_products
-    from streamsight.analytics.returns import analyze_returns
-    from streamsight.analytics.data_quality import analyze_data_quality
-
-    revenue_result = analyze_revenue(streams[stream_idx])
-    stream_idx += 1
-
-    geography_result = analyze_geography(streams[stream_idx])
-    stream_idx += 1
-
-    products_result = analyze_products(streams[stream_idx], top_k=config.top_k_products)
-    stream_idx += 1
-
-    returns_result = analyze_returns(streams[stream_idx])
-    stream_idx += 1
-
-    data_quality_result = analyze_data_quality(streams[stream_idx])
-    stream_idx += 1
-
-    # Optional: Anomaly detection
+    profiles = ProfileBuilder() if config.enable_rfm_analysis else None
+
+    # Invalid rows are written to the DLQ as they arrive
+    dlq = dlq_sink(dlq_path)
+    dlq_count = next(dlq)
+
+    try:
+        for row_nums, batch, errors in _stream_batches(config):
+            for error in errors:
+                dlq_count = dlq.send(error)
+            if batch is None:
+                continue
+
+            core.update(batch)
+            if anomaly is not None:
+                anomaly.update_cents(row_nums, batch.amount_cents)
+            if profiles is not None:
+                profiles.update_batch(batch)
+    finally:
+        dlq.close()
+
+    # Step 3: Finalize aggregators
+    logger.info("step_3_finalizing_aggregators")
+    core_result = core.finalize()
+
+    revenue_result = core_result.revenue
+    geography_result = core_result.geography
+    products_result = core_result.products
+    returns_result = core_result.returns
+    data_quality_result = core_result.data_quality
+
+    # Optional: Anomaly detection. Only values were kept per row, so the
+    # flagged rows are read back from the input (a cheap partial second pass).
     anomaly_result = None
-    if config.enable_anomaly_detection:
-        from streamsight.analytics.anomaly import detect_anomalies
-
-        anomaly_result = detect_anomalies(
-            streams[stream_idx], threshold=config.zscore_threshold
+    if anomaly is not None:
+        logger.info("step_4_anomaly_detection")
+        flagged = fetch_transactions(
+            config.input_file,
+            (row_num for row_num, _ in anomaly.top_flagged()),
+            engine=config.csv_engine,
         )
-        stream_idx += 1
+        anomaly_result = anomaly.finalize(flagged)
 
     # Optional: RFM analysis (two-pass on aggregates)
     rfm_result = None
-    if config.enable_rfm_analysis:
+    if profiles is not None:
         logger.info("step_5_rfm_analysis")
-        profiles = build_customer_profiles(streams[stream_idx])
+        # The builder tracked the latest date already; no need to rescan profiles
+        reference_date = config.rfm_reference_date or profiles.max_date
         rfm_result = segment_customers(
-            profiles,
-            reference_date=config.rfm_reference_date,
+            profiles.finalize(),
+            reference_date=reference_date,
             whale_percentile=config.rfm_whale_percentile,
         )
 
@@ -161,9 +191,7 @@ def run_pipeline(config: Config) -> PipelineResults:
     _write_results(config, revenue_result, geography_result, products_result,
                    returns_result, data_quality_result, anomaly_result, rfm_result)
 
-    logger.info("pipeline_completed")
-
-    return PipelineResults(
+    results = PipelineResults(
         revenue=revenue_result,
         geography=geography_result,
         products=products_result,
@@ -173,6 +201,66 @@ def run_pipeline(config: Config) -> PipelineResults:
         rfm=rfm_result,
         dlq_count=dlq_count,
     )
+    if cache is not None:
+        cache.save(results, dlq_path.read_bytes())
+
+    logger.info("pipeline_completed")
+
+    return results
+
+
+def _stream_batches(
+    config: Config,
+) -> Iterator[tuple[list[int], TransactionBatch | None, list[DLQEntry]]]:
+    """Stream the input as columnar batches of valid rows plus DLQ entries.
+
+    The pyarrow engine validates CSV blocks column-wise (stream_columns), so
+    its batches are built straight from the validated columns. Other inputs
+    arrive as (ok, value) tuples and are split here, config.chunk_size rows
+    at a time.
+
+    Args:
+        config: Configuration object
+
+    Yields:
+        (row numbers of the valid rows, their batch or None if there are
+        none, DLQ entries), in file order
+    """
+    country_index: KeyIndex[str] = KeyIndex()
+    stock_index: KeyIndex[str] = KeyIndex()
+    customer_index: KeyIndex[str | None] = KeyIndex()
+
+    if config.csv_engine == "pyarrow" and config.input_file.suffix != ".parquet":
+        for block in stream_columns(config.input_file):
+            batch = (
+                TransactionBatch.from_columns(block, country_index, stock_index, customer_index)
+                if len(block)
+                else None
+            )
+            yield block.row_nums.tolist(), batch, block.errors
+        return
+
+    stream = stream_validated(
+        config.input_file, engine=config.csv_engine, workers=config.workers, as_rows=True
+    )
+    for chunk in chunk_stream(enumerate(stream, start=FIRST_ROW_NUM), config.chunk_size):
+        row_nums = []
+        transactions = []
+        errors = []
+        for row_num, (ok, value) in chunk:
+            if ok:
+                row_nums.append(row_num)
+                transactions.append(value)
+            else:
+                errors.append(value)
+        batch = (
+            TransactionBatch.from_transactions(
+                transactions, country_index, stock_index, customer_index
+            )
+            if transactions
+            else None
+        )
+        yield row_nums, batch, errors
 
 
 def _write_results(
@@ -200,142 +288,148 @@ def _write_results(
     tables_dir = config.tables_dir
 
     # Revenue
-    with open(tables_dir / "revenue.json", "wb") as f:
-        f.write(
-            orjson.dumps(
-                {
-                    "gross_revenue": str(revenue.gross_revenue),
-                    "net_revenue": str(revenue.net_revenue),
-                    "transaction_count": revenue.transaction_count,
-                    "return_count": revenue.return_count,
-                    "daily_revenue": {
-                        k: str(v) for k, v in revenue.daily_revenue.items()
-                    },
-                    "monthly_revenue": {
-                        k: str(v) for k, v in revenue.monthly_revenue.items()
-                    },
-                },
-                option=orjson.OPT_INDENT_2,
-            )
-        )
+    _write_json(
+        tables_dir / "revenue.json",
+        {
+            "gross_revenue": revenue.gross_revenue,
+            "net_revenue": revenue.net_revenue,
+            "transaction_count": revenue.transaction_count,
+            "return_count": revenue.return_count,
+            "daily_revenue": revenue.daily_revenue,
+            "monthly_revenue": revenue.monthly_revenue,
+        },
+    )
 
     # Geography
-    with open(tables_dir / "geography.json", "wb") as f:
-        f.write(
-            orjson.dumps(
-                {
-                    "country_revenue": {
-                        k: str(v) for k, v in geography.country_revenue.items()
-                    },
-                    "country_transaction_counts": geography.country_transaction_counts,
-                    "country_revenue_share": geography.country_revenue_share,
-                    "total_revenue": str(geography.total_revenue),
-                },
-                option=orjson.OPT_INDENT_2,
-            )
-        )
+    _write_json(
+        tables_dir / "geography.json",
+        {
+            "country_revenue": geography.country_revenue,
+            "country_transaction_counts": geography.country_transaction_counts,
+            "country_revenue_share": geography.country_revenue_share,
+            "total_revenue": geography.total_revenue,
+        },
+    )
 
     # Products
-    with open(tables_dir / "products.json", "wb") as f:
-        f.write(
-            orjson.dumps(
+    _write_json(
+        tables_dir / "products.json",
+        {
+            "top_products": [
                 {
-                    "top_products": [
-                        {
-                            "stock_code": p.stock_code,
-                            "description": p.description,
-                            "revenue": str(p.revenue),
-                            "quantity_sold": p.quantity_sold,
-                            "transaction_count": p.transaction_count,
-                        }
-                        for p in products.top_products
-                    ],
-                    "total_product_count": products.total_product_count,
-                    "total_revenue": str(products.total_revenue),
-                },
-                option=orjson.OPT_INDENT_2,
-            )
-        )
+                    "stock_code": p.stock_code,
+                    "description": p.description,
+                    "revenue": p.revenue,
+                    "quantity_sold": p.quantity_sold,
+                    "transaction_count": p.transaction_count,
+                }
+                for p in products.top_products
+            ],
+            "total_product_count": products.total_product_count,
+            "total_revenue": products.total_revenue,
+        },
+    )
 
     # Returns
-    with open(tables_dir / "returns.json", "wb") as f:
-        f.write(
-            orjson.dumps(
-                {
-                    "total_transactions": returns.total_transactions,
-                    "return_transactions": returns.return_transactions,
-                    "return_rate": returns.return_rate,
-                    "return_revenue_impact": str(returns.return_revenue_impact),
-                    "top_returned_products": returns.top_returned_products,
-                },
-                option=orjson.OPT_INDENT_2,
-            )
-        )
+    _write_json(
+        tables_dir / "returns.json",
+        {
+            "total_transactions": returns.total_transactions,
+            "return_transactions": returns.return_transactions,
+            "return_rate": returns.return_rate,
+            "return_revenue_impact": returns.return_revenue_impact,
+            "top_returned_products": returns.top_returned_products,
+        },
+    )
 
     # Data Quality
-    with open(tables_dir / "data_quality.json", "wb") as f:
-        f.write(
-            orjson.dumps(
-                {
-                    "total_rows": data_quality.total_rows,
-                    "valid_rows": data_quality.valid_rows,
-                    "missing_customer_id": data_quality.missing_customer_id,
-                    "missing_description": data_quality.missing_description,
-                    "completeness_rate": data_quality.completeness_rate,
-                },
-                option=orjson.OPT_INDENT_2,
-            )
-        )
+    _write_json(
+        tables_dir / "data_quality.json",
+        {
+            "total_rows": data_quality.total_rows,
+            "valid_rows": data_quality.valid_rows,
+            "missing_customer_id": data_quality.missing_customer_id,
+            "missing_description": data_quality.missing_description,
+            "completeness_rate": data_quality.completeness_rate,
+        },
+    )
 
     # Anomaly (optional)
     if anomaly is not None:
-        with open(tables_dir / "anomalies.json", "wb") as f:
-            f.write(
-                orjson.dumps(
+        _write_json(
+            tables_dir / "anomalies.json",
+            {
+                "total_transactions": anomaly.total_transactions,
+                "anomaly_count": anomaly.anomaly_count,
+                "mean_transaction_value": anomaly.mean_transaction_value,
+                "stddev_transaction_value": anomaly.stddev_transaction_value,
+                "anomalies": [
                     {
-                        "total_transactions": anomaly.total_transactions,
-                        "anomaly_count": anomaly.anomaly_count,
-                        "mean_transaction_value": anomaly.mean_transaction_value,
-                        "stddev_transaction_value": anomaly.stddev_transaction_value,
-                        "anomalies": [
-                            {
-                                "invoice_no": a.transaction.InvoiceNo,
-                                "customer_id": a.transaction.CustomerID,
-                                "amount": str(a.transaction_value),
-                                "z_score": a.z_score,
-                            }
-                            for a in anomaly.anomalies[:100]  # Limit to top 100
-                        ],
-                    },
-                    option=orjson.OPT_INDENT_2,
-                )
-            )
+                        "invoice_no": a.transaction.InvoiceNo,
+                        "customer_id": a.transaction.CustomerID,
+                        "amount": a.transaction_value,
+                        "z_score": a.z_score,
+                    }
+                    for a in anomaly.anomalies
+                ],
+            },
+        )
 
     # RFM (optional)
     if rfm is not None:
-        with open(tables_dir / "rfm_whales.json", "wb") as f:
-            f.write(
-                orjson.dumps(
+        _write_json(
+            tables_dir / "rfm_whales.json",
+            {
+                "total_customers": rfm.total_customers,
+                "whale_count": rfm.whale_count,
+                "whale_revenue": rfm.whale_revenue,
+                "whale_revenue_share": rfm.whale_revenue_share,
+                "total_revenue": rfm.total_revenue,
+                "whale_customers": [
                     {
-                        "total_customers": rfm.total_customers,
-                        "whale_count": rfm.whale_count,
-                        "whale_revenue": str(rfm.whale_revenue),
-                        "whale_revenue_share": rfm.whale_revenue_share,
-                        "total_revenue": str(rfm.total_revenue),
-                        "whale_customers": [
-                            {
-                                "customer_id": w.customer_id,
-                                "recency_days": w.recency_days,
-                                "frequency": w.frequency,
-                                "monetary": str(w.monetary),
-                                "rfm_score": w.rfm_score,
-                            }
-                            for w in rfm.whale_customers[:50]  # Top 50 whales
-                        ],
-                    },
-                    option=orjson.OPT_INDENT_2,
-                )
-            )
+                        "customer_id": w.customer_id,
+                        "recency_days": w.recency_days,
+                        "frequency": w.frequency,
+                        "monetary": w.monetary,
+                        "rfm_score": w.rfm_score,
+                    }
+                    for w in rfm.whale_customers[:50]  # Top 50 whales
+                ],
+            },
+        )
 
     logger.info("results_written", output_dir=str(config.tables_dir))
 
+
+def _write_json(path: Path, data: dict[str, Any]) -> None:
+    """Write one results table as indented JSON.
+
+    Money values (Decimal) are written as strings by orjson's default hook,
+    so result dicts are serialized as they are instead of being copied
+    with every value stringified first.
+
+    Args:
+        path: Output file
+        data: Table to write
+    """
+    with open(path, "wb") as f:
+        f.write(orjson.dumps(data, default=_json_default, option=orjson.OPT_INDENT_2))
+
+
+def _json_default(value: Any) -> str:
+    """Serialize the types orjson does not handle natively (Decimal money).
+
+    Args:
+        value: Value orjson could not serialize
+
+    Returns:
+        The value as a string, as str() formats it
+
+    Raises:
+        TypeError: For any other type (orjson reports it as a JSONEncodeError)
+    """
+    if isinstance(value, Decimal):
+        return str(value)
+    msg = f"Type is not JSON serializable: {type(value).__name__}"
+    raise TypeError(msg)
+
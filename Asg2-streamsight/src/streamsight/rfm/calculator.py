@@ -6,10 +6,18 @@ from the transaction stream without loading all transactions into memory.
 
 from dataclasses import dataclass
 from datetime import datetime
-from decimal import Decimal
-from typing import Iterator, Optional
-
-from streamsight.core.money import Money
+from typing import Iterable, Iterator, Optional
+
+import numpy as np
+
+from streamsight.analytics.columnar import (
+    DEFAULT_BATCH_SIZE,
+    KeyIndex,
+    TransactionBatch,
+    timestamps_us,
+)
+from streamsight.core.money import Money, from_cents
+from streamsight.core.stream_utils import chunk_stream
 from streamsight.core.types import Ok
 from streamsight.io.schema import Transaction
 from streamsight.logging_conf import get_logger
@@ -17,7 +25,7 @@ from streamsight.logging_conf import get_logger
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomerProfile:
     """Aggregate profile for a single customer.
 
@@ -59,53 +67,212 @@ def build_customer_profiles(
         >>> profiles = build_customer_profiles(transaction_stream)
         >>> print(f"Total customers: {len(profiles)}")
     """
-    logger.info("rfm_profile_building_started")
+    return build_profiles_from_transactions(map(Ok.unwrap, stream))
+
+
+def build_profiles_from_transactions(
+    transactions: Iterable[Transaction],
+) -> dict[str, CustomerProfile]:
+    """Build customer profiles from bare Transactions (Pass 1).
+
+    Same as build_customer_profiles(), for callers that have already
+    unwrapped their results, so the hot loop skips the per-row unwrap() call.
 
-    profiles: dict[str, CustomerProfile] = {}
-    transactions_processed = 0
-    skipped_no_customer_id = 0
+    Args:
+        transactions: Iterable of Transaction objects
+
+    Returns:
+        Dictionary mapping CustomerID to CustomerProfile
+    """
+    builder = ProfileBuilder()
+    builder.update(transactions)
+    return builder.finalize()
+
+
+class ProfileBuilder:
+    """Incremental state for building customer profiles (Pass 1).
+
+    Lets a caller feed transactions chunk by chunk, e.g. from a single
+    streaming pass shared with other analyzers, instead of handing over
+    one iterable.
+
+    Profiles are kept column-wise, indexed by customer code (see KeyIndex),
+    and each chunk is folded in with array operations: the chunk's rows are
+    sorted by customer and time, then counts and spend (integer cents) are
+    reduced per customer run and first and last seen read off its ends.
+    Batches passed to update_batch() must share one customer KeyIndex, as
+    for MultiAnalyzer.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty profiles."""
+        logger.info("rfm_profile_building_started")
+
+        self.customer_index: KeyIndex[str | None] = KeyIndex()
+        # Indexed by customer code (capacity may exceed len(customer_index))
+        self.transaction_counts = np.zeros(0, dtype=np.int64)
+        self.spend_cents = np.zeros(0, dtype=np.int64)
+        self.first_time = np.zeros(0, dtype=np.int64)
+        self.last_time = np.zeros(0, dtype=np.int64)
+        self.first_seen: list[datetime | None] = []
+        self.last_seen: list[datetime | None] = []
+        self.transactions_processed = 0
+        self.skipped_no_customer_id = 0
+
+    def update(self, transactions: Iterable[Transaction]) -> None:
+        """Fold transactions into the profiles.
+
+        Args:
+            transactions: Iterable of Transaction objects
+        """
+        for chunk in chunk_stream(iter(transactions), DEFAULT_BATCH_SIZE):
+            customer_ids = [tx.CustomerID for tx in chunk]
+            invoice_dates = [tx.InvoiceDate for tx in chunk]
+            self._fold(
+                self.customer_index.encode(customer_ids),
+                np.array([c is None for c in customer_ids], dtype=bool),
+                invoice_dates,
+                timestamps_us(invoice_dates),
+                np.array([tx.total_cents for tx in chunk], dtype=np.int64),
+            )
 
-    for result in stream:
-        tx = result.unwrap()
-        transactions_processed += 1
+    def update_batch(self, batch: TransactionBatch) -> None:
+        """Fold a columnar batch (see TransactionBatch) into the profiles.
+
+        Args:
+            batch: Batch whose customer codes come from the shared customer KeyIndex
+        """
+        self.customer_index = batch.customer_index
+        self._fold(
+            batch.customer,
+            batch.missing_customer_id,
+            batch.invoice_date,
+            batch.invoice_time,
+            batch.amount_cents,
+        )
+
+    def _fold(
+        self,
+        codes: np.ndarray,
+        missing: np.ndarray,
+        invoice_dates: list[datetime],
+        invoice_times: np.ndarray,
+        amount_cents: np.ndarray,
+    ) -> None:
+        """Fold one chunk of rows, given column-wise.
+
+        Args:
+            codes: Customer code per row (from self.customer_index)
+            missing: Whether each row lacks a CustomerID (skipped)
+            invoice_dates: InvoiceDate per row
+            invoice_times: InvoiceDate per row as integer microseconds
+            amount_cents: Quantity * UnitPrice in cents per row
+        """
+        self.transactions_processed += len(codes)
+        skipped = int(np.count_nonzero(missing))
+        self.skipped_no_customer_id += skipped
 
         # Skip transactions without CustomerID
-        if tx.CustomerID is None:
-            skipped_no_customer_id += 1
-            continue
-
-        customer_id = tx.CustomerID
-
-        if customer_id in profiles:
-            # Update existing profile
-            profile = profiles[customer_id]
-            profile.transaction_count += 1
-            profile.total_spend += tx.total_amount
-
-            # Update time boundaries
-            if tx.InvoiceDate < profile.first_seen:
-                profile.first_seen = tx.InvoiceDate
-            if tx.InvoiceDate > profile.last_seen:
-                profile.last_seen = tx.InvoiceDate
-
-        else:
-            # Create new profile
+        rows = np.flatnonzero(~missing) if skipped else np.arange(len(codes))
+        if len(rows) == 0:
+            return
+        codes = codes[rows]
+        times = invoice_times[rows]
+
+        # Stable sort by customer, then time: each customer's run starts at
+        # its earliest row and ends at its latest
+        order = np.lexsort((times, codes))
+        sorted_codes = codes[order]
+        starts = np.flatnonzero(np.diff(sorted_codes, prepend=-1))
+        ends = np.append(starts[1:], len(order)) - 1
+        customers = sorted_codes[starts]
+
+        # One reduction per customer run; customers are distinct, so plain
+        # fancy-indexed adds are safe (no np.add.at needed)
+        self._grow(len(self.customer_index))
+        self.transaction_counts[customers] += ends - starts + 1
+        self.spend_cents[customers] += np.add.reduceat(amount_cents[rows[order]], starts)
+
+        # Update time boundaries
+        first = order[starts]
+        earlier = times[first] < self.first_time[customers]
+        self.first_time[customers[earlier]] = times[first[earlier]]
+        for code, row in zip(customers[earlier].tolist(), rows[first[earlier]].tolist()):
+            self.first_seen[code] = invoice_dates[row]
+
+        last = order[ends]
+        later = times[last] > self.last_time[customers]
+        self.last_time[customers[later]] = times[last[later]]
+        for code, row in zip(customers[later].tolist(), rows[last[later]].tolist()):
+            self.last_seen[code] = invoice_dates[row]
+
+    def _grow(self, size: int) -> None:
+        """Make room in the per-customer arrays for size customer codes.
+
+        Capacity at least doubles, so new customers cost amortized O(1)
+        copies however many batches they arrive over. Slots past
+        len(customer_index) stay unused (zero counts).
+        """
+        capacity = len(self.transaction_counts)
+        if size <= capacity:
+            return
+        extra = max(size, 2 * capacity) - capacity
+        self.transaction_counts = np.concatenate(
+            [self.transaction_counts, np.zeros(extra, dtype=np.int64)]
+        )
+        self.spend_cents = np.concatenate([self.spend_cents, np.zeros(extra, dtype=np.int64)])
+        self.first_time = np.concatenate(
+            [self.first_time, np.full(extra, np.iinfo(np.int64).max)]
+        )
+        self.last_time = np.concatenate([self.last_time, np.full(extra, np.iinfo(np.int64).min)])
+        self.first_seen.extend([None] * extra)
+        self.last_seen.extend([None] * extra)
+
+    @property
+    def max_date(self) -> datetime | None:
+        """Latest InvoiceDate folded so far (None before any customer is seen).
+
+        Equal to calculate_max_date() of the finalized profiles, without
+        another pass over them.
+        """
+        if not len(self.last_time):
+            return None
+        return self.last_seen[int(np.argmax(self.last_time))]
+
+    def finalize(self) -> dict[str, CustomerProfile]:
+        """Build the profiles, in order of each customer's first transaction.
+
+        Returns:
+            Dictionary mapping CustomerID to CustomerProfile
+        """
+        profiles: dict[str, CustomerProfile] = {}
+        for customer_id, count, cents, first_seen, last_seen in zip(
+            self.customer_index.labels,
+            self.transaction_counts.tolist(),
+            self.spend_cents.tolist(),
+            self.first_seen,
+            self.last_seen,
+        ):
+            # Missing CustomerIDs are encoded too (as None) but never counted,
+            # and every counted customer has both dates set
+            if not count or customer_id is None or first_seen is None or last_seen is None:
+                continue
             profiles[customer_id] = CustomerProfile(
                 customer_id=customer_id,
-                first_seen=tx.InvoiceDate,
-                last_seen=tx.InvoiceDate,
-                transaction_count=1,
-                total_spend=tx.total_amount,
+                first_seen=first_seen,
+                last_seen=last_seen,
+                transaction_count=count,
+                total_spend=from_cents(cents),
             )
 
-    logger.info(
-        "rfm_profile_building_completed",
-        transactions_processed=transactions_processed,
-        unique_customers=len(profiles),
-        skipped_no_customer_id=skipped_no_customer_id,
-    )
+        logger.info(
+            "rfm_profile_building_completed",
+            transactions_processed=self.transactions_processed,
+            unique_customers=len(profiles),
+            skipped_no_customer_id=self.skipped_no_customer_id,
+        )
 
-    return profiles
+        return profiles
 
 
 def calculate_max_date(profiles: dict[str, CustomerProfile]) -> datetime:
@@ -6,18 +6,18 @@ and identifying high-value "whale" customers.
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Sequence
 
 import numpy as np
 
-from streamsight.core.money import Money
+from streamsight.core.money import Money, from_cents, to_cents
 from streamsight.logging_conf import get_logger
 from streamsight.rfm.calculator import CustomerProfile
 
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class RFMScore:
     """RFM scores for a customer.
 
@@ -44,7 +44,7 @@ class RFMScore:
     is_whale: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class SegmentationResult:
     """Results from RFM segmentation.
 
@@ -67,30 +67,32 @@ class SegmentationResult:
     total_revenue: Money
 
 
-def calculate_quintiles(values: list[float]) -> list[float]:
+# Percentiles at the quintile boundaries used for scoring
+QUINTILE_PERCENTILES = (20, 40, 60, 80, 100)
+
+
+def calculate_quintiles(values: Sequence[float] | np.ndarray) -> list[float]:
     """Calculate quintile boundaries for scoring.
 
     Args:
-        values: List of values to calculate quintiles from
+        values: Values to calculate quintiles from
 
     Returns:
         List of 5 quintile boundaries (20th, 40th, 60th, 80th, 100th percentiles)
     """
-    if not values:
+    if len(values) == 0:
         return [0.0, 0.0, 0.0, 0.0, 0.0]
 
-    return [
-        float(np.percentile(values, 20)),
-        float(np.percentile(values, 40)),
-        float(np.percentile(values, 60)),
-        float(np.percentile(values, 80)),
-        float(np.percentile(values, 100)),
-    ]
+    # One call sorts the values once for all five boundaries
+    quintiles: list[float] = np.percentile(values, QUINTILE_PERCENTILES).tolist()
+    return quintiles
 
 
 def score_value(value: float, quintiles: list[float], reverse: bool = False) -> int:
     """Score a value based on quintile boundaries.
 
+    The scalar reference for score_values(), which segment_customers() uses.
+
     Args:
         value: Value to score
         quintiles: Quintile boundaries
@@ -105,6 +107,23 @@ def score_value(value: float, quintiles: list[float], reverse: bool = False) ->
     return 5 if not reverse else 1
 
 
+def score_values(values: np.ndarray, quintiles: list[float], reverse: bool = False) -> np.ndarray:
+    """Score every value at once; element-wise equal to score_value().
+
+    Args:
+        values: Values to score
+        quintiles: Quintile boundaries (ascending)
+        reverse: If True, lower values get higher scores (for recency)
+
+    Returns:
+        int8 array of scores from 1 to 5
+    """
+    # Index of the first of the lower four boundaries >= value, i.e. score - 1.
+    # side="left" keeps a value equal to a boundary in the lower score.
+    scores = np.searchsorted(quintiles[:4], values, side="left").astype(np.int8) + 1
+    return (6 - scores) if reverse else scores
+
+
 def segment_customers(
     profiles: dict[str, CustomerProfile],
     reference_date: Optional[datetime] = None,
@@ -151,68 +170,65 @@ def segment_customers(
 
         reference_date = calculate_max_date(profiles)
 
-    # Calculate RFM values for all customers
-    recency_days_list: list[float] = []
-    frequency_list: list[float] = []
-    monetary_list: list[float] = []
-
-    for profile in profiles.values():
-        recency_days = (reference_date - profile.last_seen).days
-        frequency = profile.transaction_count
-        monetary = float(profile.total_spend)
-
-        recency_days_list.append(float(recency_days))
-        frequency_list.append(float(frequency))
-        monetary_list.append(monetary)
+    # Calculate RFM values for all customers, one array per dimension
+    customers = list(profiles.values())
+    count = len(customers)
+    recency = np.fromiter(
+        ((reference_date - profile.last_seen).days for profile in customers), np.int64, count
+    )
+    frequency = np.fromiter((profile.transaction_count for profile in customers), np.int64, count)
+    spend_cents = np.fromiter((to_cents(profile.total_spend) for profile in customers), np.int64, count)
+    # Same doubles as float(total_spend): both round the exact value once
+    monetary = spend_cents / 100
 
     # Calculate quintiles for scoring
-    recency_quintiles = calculate_quintiles(recency_days_list)
-    frequency_quintiles = calculate_quintiles(frequency_list)
-    monetary_quintiles = calculate_quintiles(monetary_list)
+    recency_quintiles = calculate_quintiles(recency.astype(np.float64))
+    frequency_quintiles = calculate_quintiles(frequency.astype(np.float64))
+    monetary_quintiles = calculate_quintiles(monetary)
 
     # Calculate whale threshold (top percentile by monetary value)
-    whale_threshold = float(np.percentile(monetary_list, whale_percentile))
+    whale_threshold = float(np.percentile(monetary, whale_percentile))
 
-    # Score each customer
-    rfm_scores: list[RFMScore] = []
-    total_revenue = Money("0")
+    # Score RFM (1-5 scale)
+    # Recency: Lower is better (reverse=True)
+    # Frequency: Higher is better
+    # Monetary: Higher is better
+    r_scores = score_values(recency, recency_quintiles, reverse=True)
+    f_scores = score_values(frequency, frequency_quintiles, reverse=False)
+    m_scores = score_values(monetary, monetary_quintiles, reverse=False)
 
-    for profile in profiles.values():
-        recency_days = (reference_date - profile.last_seen).days
-        frequency = profile.transaction_count
-        monetary = float(profile.total_spend)
+    # Identify whales (top percentile by monetary value)
+    is_whale = monetary >= whale_threshold
 
-        # Score RFM (1-5 scale)
-        # Recency: Lower is better (reverse=True)
-        # Frequency: Higher is better
-        # Monetary: Higher is better
-        r_score = score_value(float(recency_days), recency_quintiles, reverse=True)
-        f_score = score_value(float(frequency), frequency_quintiles, reverse=False)
-        m_score = score_value(monetary, monetary_quintiles, reverse=False)
-
-        # Identify whales (top percentile by monetary value)
-        is_whale = monetary >= whale_threshold
-
-        rfm_score = RFMScore(
+    rfm_scores = [
+        RFMScore(
             customer_id=profile.customer_id,
             recency_days=recency_days,
-            frequency=frequency,
+            frequency=profile.transaction_count,
             monetary=profile.total_spend,
             recency_score=r_score,
             frequency_score=f_score,
             monetary_score=m_score,
             rfm_score=f"{r_score}{f_score}{m_score}",
-            is_whale=is_whale,
+            is_whale=whale,
         )
+        for profile, recency_days, r_score, f_score, m_score, whale in zip(
+            customers,
+            recency.tolist(),
+            r_scores.tolist(),
+            f_scores.tolist(),
+            m_scores.tolist(),
+            is_whale.tolist(),
+        )
+    ]
+    total_revenue = from_cents(int(spend_cents.sum()))
 
-        rfm_scores.append(rfm_score)
-        total_revenue += profile.total_spend
-
-    # Extract whale customers
-    whale_customers = [score for score in rfm_scores if score.is_whale]
-    whale_customers.sort(key=lambda x: x.monetary, reverse=True)
+    # Extract whale customers, largest spend first (ties keep profile order)
+    whales = np.flatnonzero(is_whale)
+    whales = whales[np.argsort(-spend_cents[whales], kind="stable")]
+    whale_customers = [rfm_scores[i] for i in whales.tolist()]
 
-    whale_revenue = sum((whale.monetary for whale in whale_customers), Money("0"))
+    whale_revenue = from_cents(int(spend_cents[whales].sum()))
     whale_revenue_share = (
         float(whale_revenue / total_revenue * 100) if total_revenue > 0 else 0.0
     )
@@ -1,19 +1,27 @@
 """Visualization module for creating plots and charts.
 
-This module uses Pandas for data formatting and Matplotlib/Seaborn for plotting.
-This is the ONLY place in the codebase where Pandas is used.
+This module shapes results with NumPy and plots them with Matplotlib/Seaborn.
 """
 
 from pathlib import Path
 
+import matplotlib
+
+# Plots are only ever written to files: select the non-interactive backend
+# before pyplot (or seaborn, which imports it) loads, so headless runs never
+# probe for GUI toolkits
+matplotlib.use("Agg")
+
 import matplotlib.pyplot as plt
-import pandas as pd
+import numpy as np
 import seaborn as sns
+from matplotlib.ticker import StrMethodFormatter
 
 from streamsight.analytics.geography import GeographyResult
 from streamsight.analytics.products import ProductsResult
 from streamsight.analytics.revenue import RevenueResult
 from streamsight.config import Config
+from streamsight.core.money import to_cents
 from streamsight.logging_conf import get_logger
 from streamsight.rfm.segmentation import SegmentationResult
 
@@ -34,20 +42,18 @@ def plot_revenue_trend(revenue: RevenueResult, output_path: Path) -> None:
     """
     logger.info("plotting_revenue_trend", output_path=str(output_path))
 
-    # Convert to DataFrame (Pandas allowed here for visualization)
-    df = pd.DataFrame(
-        [
-            {"date": date, "revenue": float(amount)}
-            for date, amount in revenue.daily_revenue.items()
-        ]
-    )
-    df["date"] = pd.to_datetime(df["date"])
-    df = df.sort_values("date")
+    # Two plain arrays are all the line needs; keys are ISO dates (YYYY-MM-DD)
+    daily = revenue.daily_revenue
+    dates = np.array(list(daily), dtype="datetime64[D]")
+    amounts = np.fromiter(map(float, daily.values()), dtype=np.float64, count=len(daily))
+    order = np.argsort(dates, kind="stable")
+    dates = dates[order]
+    amounts = amounts[order]
 
     # Create plot
     fig, ax = plt.subplots(figsize=(14, 6))
-    ax.plot(df["date"], df["revenue"], linewidth=2, color="#2E86AB")
-    ax.fill_between(df["date"], df["revenue"], alpha=0.3, color="#2E86AB")
+    ax.plot(dates, amounts, linewidth=2, color="#2E86AB")
+    ax.fill_between(dates, amounts, alpha=0.3, color="#2E86AB")
 
     ax.set_title("Daily Revenue Trend", fontsize=16, fontweight="bold")
     ax.set_xlabel("Date", fontsize=12)
@@ -55,14 +61,14 @@ def plot_revenue_trend(revenue: RevenueResult, output_path: Path) -> None:
     ax.grid(True, alpha=0.3)
 
     # Format y-axis as currency
-    ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f"${x:,.0f}"))
+    ax.yaxis.set_major_formatter(StrMethodFormatter("${x:,.0f}"))
 
     # Rotate x-axis labels
     plt.xticks(rotation=45)
     plt.tight_layout()
 
     # Save
-    plt.savefig(output_path, dpi=300, bbox_inches="tight")
+    plt.savefig(output_path, dpi=150)
     plt.close()
 
     logger.info("revenue_trend_plotted", output_path=str(output_path))
@@ -77,18 +83,13 @@ def plot_country_performance(geography: GeographyResult, output_path: Path) -> N
     """
     logger.info("plotting_country_performance", output_path=str(output_path))
 
-    # Convert to DataFrame and get top 10 countries
-    df = pd.DataFrame(
-        [
-            {"country": country, "revenue": float(revenue)}
-            for country, revenue in geography.country_revenue.items()
-        ]
-    )
-    df = df.sort_values("revenue", ascending=False).head(10)
+    # Top 10 countries from the analyzer's ranking, largest revenue first
+    countries = geography.countries_by_revenue[:10]
+    revenues = [float(geography.country_revenue[country]) for country in countries]
 
     # Create plot
     fig, ax = plt.subplots(figsize=(12, 8))
-    bars = ax.barh(df["country"], df["revenue"], color="#A23B72")
+    bars = ax.barh(countries, revenues, color="#A23B72")
 
     ax.set_title("Top 10 Countries by Revenue", fontsize=16, fontweight="bold")
     ax.set_xlabel("Revenue ($)", fontsize=12)
@@ -96,7 +97,7 @@ def plot_country_performance(geography: GeographyResult, output_path: Path) -> N
     ax.grid(True, alpha=0.3, axis="x")
 
     # Format x-axis as currency
-    ax.xaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f"${x:,.0f}"))
+    ax.xaxis.set_major_formatter(StrMethodFormatter("${x:,.0f}"))
 
     # Add value labels on bars
     for bar in bars:
@@ -112,7 +113,7 @@ def plot_country_performance(geography: GeographyResult, output_path: Path) -> N
         )
 
     plt.tight_layout()
-    plt.savefig(output_path, dpi=300, bbox_inches="tight")
+    plt.savefig(output_path, dpi=150)
     plt.close()
 
     logger.info("country_performance_plotted", output_path=str(output_path))
@@ -127,22 +128,16 @@ def plot_top_products(products: ProductsResult, output_path: Path) -> None:
     """
     logger.info("plotting_top_products", output_path=str(output_path))
 
-    # Convert to DataFrame
-    df = pd.DataFrame(
-        [
-            {
-                "description": p.description[:40] + "..."
-                if len(p.description) > 40
-                else p.description,
-                "revenue": float(p.revenue),
-            }
-            for p in products.top_products
-        ]
-    )
+    # top_products is already ordered by revenue
+    descriptions = [
+        p.description[:40] + "..." if len(p.description) > 40 else p.description
+        for p in products.top_products
+    ]
+    revenues = [float(p.revenue) for p in products.top_products]
 
     # Create plot
     fig, ax = plt.subplots(figsize=(12, 8))
-    bars = ax.barh(df["description"], df["revenue"], color="#F18F01")
+    bars = ax.barh(descriptions, revenues, color="#F18F01")
 
     ax.set_title("Top Products by Revenue", fontsize=16, fontweight="bold")
     ax.set_xlabel("Revenue ($)", fontsize=12)
@@ -150,10 +145,10 @@ def plot_top_products(products: ProductsResult, output_path: Path) -> None:
     ax.grid(True, alpha=0.3, axis="x")
 
     # Format x-axis as currency
-    ax.xaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f"${x:,.0f}"))
+    ax.xaxis.set_major_formatter(StrMethodFormatter("${x:,.0f}"))
 
     plt.tight_layout()
-    plt.savefig(output_path, dpi=300, bbox_inches="tight")
+    plt.savefig(output_path, dpi=150)
     plt.close()
 
     logger.info("top_products_plotted", output_path=str(output_path))
@@ -170,33 +165,30 @@ def plot_whale_pareto(rfm: SegmentationResult, output_path: Path) -> None:
     """
     logger.info("plotting_whale_pareto", output_path=str(output_path))
 
-    # Sort customers by monetary value
-    sorted_customers = sorted(rfm.rfm_scores, key=lambda x: x.monetary, reverse=True)
+    # Spend in integer cents, largest first (ties keep score order, as a
+    # stable reverse sort would), so the running total stays exact
+    spend_cents = np.fromiter(
+        (to_cents(c.monetary) for c in rfm.rfm_scores), dtype=np.int64, count=len(rfm.rfm_scores)
+    )
+    spend_cents = spend_cents[np.argsort(-spend_cents, kind="stable")]
 
     # Calculate cumulative percentages
-    total_revenue = sum(c.monetary for c in sorted_customers)
-    cumulative_revenue = 0
-    data = []
-
-    for i, customer in enumerate(sorted_customers, 1):
-        cumulative_revenue += customer.monetary
-        customer_pct = (i / len(sorted_customers)) * 100
-        revenue_pct = (float(cumulative_revenue) / float(total_revenue)) * 100
-        data.append({"customer_pct": customer_pct, "revenue_pct": revenue_pct})
-
-    df = pd.DataFrame(data)
+    cumulative_cents = np.cumsum(spend_cents)
+    revenue_pct = cumulative_cents / cumulative_cents[-1] * 100
+    customer_pct = np.arange(1, len(spend_cents) + 1) / len(spend_cents) * 100
 
     # Create plot
     fig, ax = plt.subplots(figsize=(12, 8))
-    ax.plot(df["customer_pct"], df["revenue_pct"], linewidth=2, color="#6A4C93")
+    ax.plot(customer_pct, revenue_pct, linewidth=2, color="#6A4C93")
     ax.plot([0, 100], [0, 100], "k--", alpha=0.3, label="Perfect Equality")
 
     # Highlight whale zone
     whale_pct = (100 - rfm.whale_count / rfm.total_customers * 100)
     ax.axvline(x=whale_pct, color="red", linestyle="--", alpha=0.5, label="Whale Threshold")
+    in_whale_zone = customer_pct >= whale_pct
     ax.fill_between(
-        df[df["customer_pct"] >= whale_pct]["customer_pct"],
-        df[df["customer_pct"] >= whale_pct]["revenue_pct"],
+        customer_pct[in_whale_zone],
+        revenue_pct[in_whale_zone],
         alpha=0.2,
         color="red",
     )
@@ -217,7 +209,7 @@ def plot_whale_pareto(rfm: SegmentationResult, output_path: Path) -> None:
     )
 
     plt.tight_layout()
-    plt.savefig(output_path, dpi=300, bbox_inches="tight")
+    plt.savefig(output_path, dpi=150)
     plt.close()
 
     logger.info("whale_pareto_plotted", output_path=str(output_path))
@@ -23,7 +23,7 @@ def generate_summary_report(config: Config, results: "PipelineResults") -> None:
 
     report_path = config.reports_dir / "SUMMARY.md"
 
-    with open(report_path, "w") as f:
+    with open(report_path, "w", encoding="utf-8") as f:
         f.write("# StreamSight Analytics Report\n\n")
         f.write("** Summary of Sales Data Analysis**\n\n")
         f.write("---\n\n")
@@ -39,13 +39,10 @@ def generate_summary_report(config: Config, results: "PipelineResults") -> None:
         # Geographic Performance
         f.write("## Geographic Performance\n\n")
         f.write("### Top 5 Countries by Revenue\n\n")
-        top_countries = sorted(
-            results.geography.country_revenue.items(),
-            key=lambda x: x[1],
-            reverse=True,
-        )[:5]
-        for i, (country, revenue) in enumerate(top_countries, 1):
-            share = results.geography.country_revenue_share.get(country, 0)
+        geography = results.geography
+        for i, country in enumerate(geography.countries_by_revenue[:5], 1):
+            revenue = geography.country_revenue[country]
+            share = geography.country_revenue_share.get(country, 0)
             f.write(
                 f"{i}. **{country}**: {format_money(revenue)} ({share:.1f}% of total)\n"
             )
@@ -65,25 +62,25 @@ def generate_summary_report(config: Config, results: "PipelineResults") -> None:
             )
 
         # RFM & Whale Analysis
-        if results.rfm is not None:
+        rfm = results.rfm
+        if rfm is not None:
+            whale_pct = rfm.whale_count / rfm.total_customers * 100
             f.write("## Whale Customer Analysis\n\n")
-            f.write(f"- **Total Customers**: {results.rfm.total_customers:,}\n")
-            f.write(f"- **Whale Customers**: {results.rfm.whale_count:,}\n")
-            f.write(f"- **Whale Percentage**: {(results.rfm.whale_count / results.rfm.total_customers * 100):.2f}%\n")
-            f.write(f"- **Whale Revenue**: {format_money(results.rfm.whale_revenue)}\n")
-            f.write(
-                f"- **Whale Revenue Share**: {results.rfm.whale_revenue_share:.2f}%\n\n"
-            )
+            f.write(f"- **Total Customers**: {rfm.total_customers:,}\n")
+            f.write(f"- **Whale Customers**: {rfm.whale_count:,}\n")
+            f.write(f"- **Whale Percentage**: {whale_pct:.2f}%\n")
+            f.write(f"- **Whale Revenue**: {format_money(rfm.whale_revenue)}\n")
+            f.write(f"- **Whale Revenue Share**: {rfm.whale_revenue_share:.2f}%\n\n")
 
             f.write("**Key Insight**: ")
             f.write(
-                f"The top {results.rfm.whale_count} customers ({(results.rfm.whale_count / results.rfm.total_customers * 100):.1f}% of the customer base) "
-                f"contribute {results.rfm.whale_revenue_share:.1f}% of total revenue.\n\n"
+                f"The top {rfm.whale_count} customers ({whale_pct:.1f}% of the customer base) "
+                f"contribute {rfm.whale_revenue_share:.1f}% of total revenue.\n\n"
             )
 
             # Top 3 Whales
             f.write("### Top 3 Whale Customers\n\n")
-            for i, whale in enumerate(results.rfm.whale_customers[:3], 1):
+            for i, whale in enumerate(rfm.whale_customers[:3], 1):
                 f.write(
                     f"{i}. **Customer {whale.customer_id}**\n"
                     f"   - Total Spend: {format_money(whale.monetary)}\n"
@@ -93,23 +90,19 @@ def generate_summary_report(config: Config, results: "PipelineResults") -> None:
                 )
 
         # Anomaly Detection
-        if results.anomaly is not None:
+        anomalies = results.anomaly
+        if anomalies is not None:
+            anomaly_rate = anomalies.anomaly_count / anomalies.total_transactions * 100
             f.write("## Anomaly Detection\n\n")
-            f.write(f"- **Transactions Analyzed**: {results.anomaly.total_transactions:,}\n")
-            f.write(f"- **Anomalies Detected**: {results.anomaly.anomaly_count:,}\n")
-            f.write(
-                f"- **Anomaly Rate**: {(results.anomaly.anomaly_count / results.anomaly.total_transactions * 100):.2f}%\n"
-            )
-            f.write(
-                f"- **Mean Transaction Value**: ${results.anomaly.mean_transaction_value:.2f}\n"
-            )
-            f.write(
-                f"- **Std Dev**: ${results.anomaly.stddev_transaction_value:.2f}\n\n"
-            )
+            f.write(f"- **Transactions Analyzed**: {anomalies.total_transactions:,}\n")
+            f.write(f"- **Anomalies Detected**: {anomalies.anomaly_count:,}\n")
+            f.write(f"- **Anomaly Rate**: {anomaly_rate:.2f}%\n")
+            f.write(f"- **Mean Transaction Value**: ${anomalies.mean_transaction_value:.2f}\n")
+            f.write(f"- **Std Dev**: ${anomalies.stddev_transaction_value:.2f}\n\n")
 
-            if results.anomaly.anomalies:
+            if anomalies.anomalies:
                 f.write("### Top 3 Anomalous Transactions\n\n")
-                for i, anomaly in enumerate(results.anomaly.anomalies[:3], 1):
+                for i, anomaly in enumerate(anomalies.anomalies[:3], 1):
                     f.write(
                         f"{i}. **Invoice {anomaly.transaction.InvoiceNo}**\n"
                         f"   - Amount: {format_money(anomaly.transaction_value)}\n"
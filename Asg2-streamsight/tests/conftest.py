@@ -131,3 +131,19 @@ def invalid_csv_file(tmp_path: Path) -> Path:
 
     return csv_path
 
+
+@pytest.fixture
+def ragged_csv_file(tmp_path: Path) -> Path:
+    """Create a CSV file with rows of the wrong width for DLQ testing."""
+    csv_path = tmp_path / "ragged_data.csv"
+
+    with open(csv_path, "w") as f:
+        f.write("InvoiceNo,StockCode,Description,Quantity,InvoiceDate,UnitPrice,CustomerID,Country\n")
+        f.write("12345,ABC123,Product,5,2023-01-15 10:00:00,10.00,CUST001,UK\n")
+        # Too few fields
+        f.write("12346,ABC124,Product,3,2023-01-16 11:00:00\n")
+        # Too many fields
+        f.write("12347,ABC125,Product,2,2023-01-17 12:00:00,15.00,CUST003,France,extra\n")
+        f.write('12348,ABC126,"Multi\nline",1,2023-01-18 13:00:00,1.50,CUST004,UK\n')
+
+    return csv_path
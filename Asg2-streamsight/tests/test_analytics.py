@@ -1,16 +1,26 @@
 """Tests for analytics modules."""
 
+import dataclasses
 from decimal import Decimal
+from pathlib import Path
 from typing import Iterator
 
+import numpy as np
 import pytest
 
+from streamsight.analytics import columnar
+from streamsight.analytics.anomaly import (
+    AnomalyAccumulator,
+    WelfordAccumulator,
+    detect_anomalies,
+)
 from streamsight.analytics.data_quality import analyze_data_quality
 from streamsight.analytics.geography import analyze_geography
 from streamsight.analytics.products import analyze_products
 from streamsight.analytics.returns import analyze_returns
 from streamsight.analytics.revenue import analyze_revenue
 from streamsight.core.types import Ok
+from streamsight.io.csv_stream import stream_columns, stream_transactions
 from streamsight.io.schema import Transaction
 
 
@@ -19,9 +29,7 @@ class TestRevenueAnalytics:
 
     def test_revenue_analysis(self, sample_stream: Iterator[Ok[Transaction]]) -> None:
         """Test basic revenue analysis."""
-        # Need to materialize stream for testing
-        transactions = list(sample_stream)
-        result = analyze_revenue(iter(transactions))
+        result = analyze_revenue(sample_stream)
 
         # Expected: 5*10 + 3*20 + 2*10 + (-1)*10 = 50 + 60 + 20 - 10 = 120
         assert result.net_revenue == Decimal("120.00")
@@ -30,8 +38,7 @@ class TestRevenueAnalytics:
 
     def test_daily_revenue(self, sample_stream: Iterator[Ok[Transaction]]) -> None:
         """Test daily revenue breakdown."""
-        transactions = list(sample_stream)
-        result = analyze_revenue(iter(transactions))
+        result = analyze_revenue(sample_stream)
 
         assert "2023-01-15" in result.daily_revenue
         assert "2023-01-16" in result.daily_revenue
@@ -39,8 +46,7 @@ class TestRevenueAnalytics:
 
     def test_monthly_revenue(self, sample_stream: Iterator[Ok[Transaction]]) -> None:
         """Test monthly revenue breakdown."""
-        transactions = list(sample_stream)
-        result = analyze_revenue(iter(transactions))
+        result = analyze_revenue(sample_stream)
 
         assert "2023-01" in result.monthly_revenue
         assert result.monthly_revenue["2023-01"] == Decimal("120.00")
@@ -51,18 +57,17 @@ class TestGeographyAnalytics:
 
     def test_geography_analysis(self, sample_stream: Iterator[Ok[Transaction]]) -> None:
         """Test geographic analysis."""
-        transactions = list(sample_stream)
-        result = analyze_geography(iter(transactions))
+        result = analyze_geography(sample_stream)
 
         assert "UK" in result.country_revenue
         assert "France" in result.country_revenue
         assert result.country_revenue["UK"] == Decimal("110.00")  # 50 + 60
         assert result.country_revenue["France"] == Decimal("10.00")  # 20 - 10
+        assert result.countries_by_revenue == ["UK", "France"]
 
     def test_revenue_share(self, sample_stream: Iterator[Ok[Transaction]]) -> None:
         """Test revenue share calculation."""
-        transactions = list(sample_stream)
-        result = analyze_geography(iter(transactions))
+        result = analyze_geography(sample_stream)
 
         # UK should have ~91.67% share (110/120)
         assert abs(result.country_revenue_share["UK"] - 91.67) < 0.1
@@ -75,16 +80,14 @@ class TestProductsAnalytics:
 
     def test_products_analysis(self, sample_stream: Iterator[Ok[Transaction]]) -> None:
         """Test product analysis."""
-        transactions = list(sample_stream)
-        result = analyze_products(iter(transactions), top_k=2)
+        result = analyze_products(sample_stream, top_k=2)
 
         assert result.total_product_count == 2  # ABC123 and ABC124
         assert len(result.top_products) == 2
 
     def test_top_products_order(self, sample_stream: Iterator[Ok[Transaction]]) -> None:
         """Test that top products are sorted by revenue."""
-        transactions = list(sample_stream)
-        result = analyze_products(iter(transactions), top_k=10)
+        result = analyze_products(sample_stream, top_k=10)
 
         # Product A (ABC123): 5*10 + 2*10 - 1*10 = 60
         # Product B (ABC124): 3*20 = 60
@@ -99,8 +102,7 @@ class TestReturnsAnalytics:
 
     def test_returns_analysis(self, sample_stream: Iterator[Ok[Transaction]]) -> None:
         """Test returns analysis."""
-        transactions = list(sample_stream)
-        result = analyze_returns(iter(transactions))
+        result = analyze_returns(sample_stream)
 
         assert result.total_transactions == 4
         assert result.return_transactions == 1
@@ -108,8 +110,7 @@ class TestReturnsAnalytics:
 
     def test_return_revenue_impact(self, sample_stream: Iterator[Ok[Transaction]]) -> None:
         """Test return revenue impact calculation."""
-        transactions = list(sample_stream)
-        result = analyze_returns(iter(transactions))
+        result = analyze_returns(sample_stream)
 
         assert result.return_revenue_impact == Decimal("-10.00")
 
@@ -119,10 +120,180 @@ class TestDataQuality:
 
     def test_data_quality(self, sample_stream: Iterator[Ok[Transaction]]) -> None:
         """Test data quality analysis."""
-        transactions = list(sample_stream)
-        result = analyze_data_quality(iter(transactions))
+        result = analyze_data_quality(sample_stream)
 
         assert result.total_rows == 4
         assert result.valid_rows == 4
         assert result.missing_customer_id == 0
 
+    def test_completeness_counts_overlap_once(self, sample_transaction: Transaction) -> None:
+        """Test that a row missing both fields is one incomplete row, not zero."""
+        transactions = [
+            sample_transaction,
+            sample_transaction.model_copy(update={"CustomerID": None}),
+            sample_transaction.model_copy(update={"CustomerID": None, "Description": ""}),
+            sample_transaction.model_copy(update={"Description": " "}),
+        ]
+        result = analyze_data_quality(Ok(tx) for tx in transactions)
+
+        assert result.missing_customer_id == 2
+        assert result.missing_description == 2
+        assert result.completeness_rate == 25.0
+        assert columnar.analyze_data_quality_batches(
+            columnar.to_batches(transactions, batch_size=3)
+        ) == result
+
+
+class TestAnomalyDetection:
+    """Tests for anomaly detection."""
+
+    def test_flags_outlier(self, sample_transaction: Transaction) -> None:
+        """Test that a single extreme transaction is flagged with its Z-score."""
+        normal = [sample_transaction] * 50
+        outlier = sample_transaction.model_copy(update={"Quantity": 1000})
+        result = detect_anomalies(iter([Ok(tx) for tx in normal + [outlier]]), threshold=3.0)
+
+        assert result.total_transactions == 51
+        assert result.anomaly_count == 1
+        assert result.anomalies[0].transaction is outlier
+        assert result.anomalies[0].z_score > 3.0
+
+    def test_max_anomalies(self, sample_transaction: Transaction) -> None:
+        """Test that max_anomalies keeps the top of the full ranking, ties in input order."""
+        normal = [sample_transaction] * 200
+        outliers = [
+            sample_transaction.model_copy(update={"Quantity": q}) for q in (500, 900, 500, 700)
+        ]
+        transactions = normal[:100] + outliers + normal[100:]
+
+        full = detect_anomalies(iter([Ok(tx) for tx in transactions]), threshold=3.0)
+        top = detect_anomalies(
+            iter([Ok(tx) for tx in transactions]), threshold=3.0, max_anomalies=3
+        )
+
+        assert full.anomaly_count == top.anomaly_count == 4
+        assert top.anomalies == full.anomalies[:3]
+        assert [a.transaction for a in top.anomalies] == [outliers[1], outliers[3], outliers[0]]
+
+    def test_empty_stream(self) -> None:
+        """Test anomaly detection on an empty stream."""
+        result = detect_anomalies(iter([]))
+
+        assert result.total_transactions == 0
+        assert result.anomalies == []
+
+
+    def test_batched_updates_match_per_row(self, sample_transaction: Transaction) -> None:
+        """Test that batch updates give bit-identical statistics to per-row updates."""
+        values = [abs((i * 7919) % 1000 - 500) / 100 for i in range(1000)]
+        per_row = WelfordAccumulator()
+        for value in values:
+            per_row.update(value)
+        batched = WelfordAccumulator()
+        batched.update_many(values[:300])
+        batched.update_many(values[300:])
+        assert (batched.count, batched.mean, batched.m2) == (
+            per_row.count,
+            per_row.mean,
+            per_row.m2,
+        )
+
+        transactions = [
+            sample_transaction.model_copy(update={"Quantity": q}) for q in (1, -3, 7, 1000)
+        ]
+        by_row = AnomalyAccumulator(threshold=1.0)
+        by_row.update(enumerate(transactions))
+        by_batch = AnomalyAccumulator(threshold=1.0)
+        batch = columnar.TransactionBatch.from_transactions(transactions)
+        by_batch.update_cents(range(len(transactions)), batch.amount_cents)
+        assert by_batch.values == by_row.values
+        assert by_batch.flagged() == by_row.flagged()
+        assert by_batch.finalize(transactions) == by_row.finalize(transactions)
+
+
+class TestColumnarAnalytics:
+    """Tests that the vectorized analyzers match the row-wise ones."""
+
+    @pytest.mark.parametrize("batch_size", [1, 3, 1000])
+    def test_matches_row_wise(
+        self, sample_transactions: list[Transaction], batch_size: int
+    ) -> None:
+        """Test every columnar analyzer against its row-wise counterpart.
+
+        Small batch sizes exercise merging partial aggregates across batches.
+        """
+        pairs = [
+            (analyze_revenue, columnar.analyze_revenue_batches),
+            (analyze_geography, columnar.analyze_geography_batches),
+            (analyze_products, columnar.analyze_products_batches),
+            (analyze_returns, columnar.analyze_returns_batches),
+            (analyze_data_quality, columnar.analyze_data_quality_batches),
+        ]
+
+        for row_wise, vectorized in pairs:
+            expected = row_wise(Ok(tx) for tx in sample_transactions)
+            batches = columnar.to_batches(sample_transactions, batch_size=batch_size)
+            assert vectorized(batches) == expected
+
+    def test_fused_pass_matches_row_wise(
+        self, sample_transactions: list[Transaction]
+    ) -> None:
+        """Test that the single-pass MultiAnalyzer matches each row-wise analyzer."""
+        batches = columnar.to_batches(sample_transactions, batch_size=2)
+        core = columnar.analyze_batches(batches, top_k=5)
+
+        def rows() -> Iterator[Ok[Transaction]]:
+            return (Ok(tx) for tx in sample_transactions)
+
+        assert core.revenue == analyze_revenue(rows())
+        assert core.geography == analyze_geography(rows())
+        assert core.products == analyze_products(rows(), top_k=5)
+        assert core.returns == analyze_returns(rows())
+        assert core.data_quality == analyze_data_quality(rows())
+
+    @pytest.mark.parametrize("top_k", [1, 3, 5, 20])
+    def test_top_products_ties(self, sample_transaction: Transaction, top_k: int) -> None:
+        """Test that products with equal revenue rank in the same order as row-wise."""
+        transactions = [
+            sample_transaction.model_copy(
+                update={"StockCode": f"SKU{i}", "Quantity": (i % 3) + 1}
+            )
+            for i in range(12)
+        ]
+
+        expected = analyze_products((Ok(tx) for tx in transactions), top_k=top_k)
+        batches = columnar.to_batches(transactions, batch_size=5)
+        assert columnar.analyze_products_batches(batches, top_k=top_k) == expected
+
+    def test_top_returned_ties(self, sample_transaction: Transaction) -> None:
+        """Test that equally returned products rank by first return, as row-wise."""
+        sold = [
+            sample_transaction.model_copy(update={"StockCode": f"SKU{i}"}) for i in range(12)
+        ]
+        # Returned in the reverse of first-seen order, every product once
+        returned = [tx.model_copy(update={"Quantity": -1}) for tx in reversed(sold)]
+        transactions = sold + returned
+
+        expected = analyze_returns(Ok(tx) for tx in transactions)
+        batches = columnar.to_batches(transactions, batch_size=5)
+        result = columnar.analyze_returns_batches(batches)
+        assert result == expected
+        assert list(result.top_returned_products) == [f"SKU{i}" for i in range(11, 1, -1)]
+
+    def test_from_columns_matches_from_transactions(self, temp_csv_file: Path) -> None:
+        """Test that a batch built from column blocks equals one built per row."""
+        pytest.importorskip("pyarrow")
+        transactions = [r.unwrap() for r in stream_transactions(temp_csv_file)]
+        expected = columnar.TransactionBatch.from_transactions(transactions)
+
+        (block,) = stream_columns(temp_csv_file)
+        batch = columnar.TransactionBatch.from_columns(block)
+
+        for field in (f.name for f in dataclasses.fields(expected)):
+            value = getattr(expected, field)
+            if isinstance(value, np.ndarray):
+                assert np.array_equal(getattr(batch, field), value), field
+            elif isinstance(value, columnar.KeyIndex):
+                assert getattr(batch, field).labels == value.labels, field
+            else:
+                assert getattr(batch, field) == value, field
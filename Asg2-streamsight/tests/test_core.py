@@ -3,7 +3,7 @@
 from decimal import Decimal
 
 import pytest
-from hypothesis import given
+from hypothesis import given, settings
 from hypothesis import strategies as st
 
 from streamsight.core.money import (
@@ -12,8 +12,17 @@ from streamsight.core.money import (
     multiply_money,
     divide_money,
     format_money,
+    to_cents,
+    from_cents,
+)
+from streamsight.core.stream_utils import (
+    broadcast,
+    chunk_stream,
+    drop,
+    fold,
+    partition,
+    take,
 )
-from streamsight.core.stream_utils import broadcast, partition, fold, take, drop
 from streamsight.core.types import Ok, Err
 
 
@@ -58,6 +67,14 @@ class TestMoneyOperations:
         with pytest.raises(Exception):
             parse_money("invalid")
 
+    def test_parse_money_repeated_values(self) -> None:
+        """Test that memoized parsing keeps rounding and still rejects bad input."""
+        for _ in range(2):
+            assert parse_money("2.555") == Decimal("2.56")
+            assert str(parse_money("-0")) == "-0.00"
+            with pytest.raises(Exception):
+                parse_money("invalid")
+
     def test_sum_money(self) -> None:
         """Test summing money values."""
         values = [Decimal("10.50"), Decimal("20.25"), Decimal("5.00")]
@@ -84,6 +101,29 @@ class TestMoneyOperations:
         result = format_money(Decimal("1234.56"))
         assert result == "$1,234.56"
 
+    def test_cents_conversion(self) -> None:
+        """Test converting money to integer cents and back."""
+        assert to_cents(Decimal("10.50")) == 1050
+        assert to_cents(Decimal("-2.55")) == -255
+        assert from_cents(1050) == Decimal("10.50")
+        assert str(from_cents(0)) == "0.00"
+
+    @settings(deadline=None)
+    @given(
+        st.lists(
+            st.decimals(
+                min_value=Decimal("-10000.00"),
+                max_value=Decimal("10000.00"),
+                places=2,
+            ),
+            max_size=100,
+        )
+    )
+    def test_cents_sum_matches_decimal_sum(self, values: list[Decimal]) -> None:
+        """Property test: Summing cents is exact and matches Decimal summation."""
+        assert from_cents(sum(to_cents(v) for v in values)) == sum_money(iter(values))
+
+    @settings(deadline=None)
     @given(
         st.lists(
             st.decimals(
@@ -131,6 +171,15 @@ class TestStreamUtils:
         assert list(evens) == [2, 4]
         assert list(odds) == [1, 3, 5]
 
+    @pytest.mark.parametrize("lazy", [True, False])
+    def test_partition_lockstep(self, lazy: bool) -> None:
+        """Test that a lazy partition does not consume the stream up front."""
+        source = iter(range(1, 6))
+        evens, odds = partition(source, lambda x: x % 2 == 0, lazy=lazy)
+
+        assert (next(odds), next(evens)) == (1, 2)
+        assert next(source, None) == (3 if lazy else None)
+
     def test_fold(self) -> None:
         """Test folding (reducing) a stream."""
         source = iter([1, 2, 3, 4])
@@ -149,3 +198,8 @@ class TestStreamUtils:
         result = list(drop(source, 5))
         assert result == [5, 6, 7, 8, 9]
 
+    def test_chunk_stream(self) -> None:
+        """Test chunking, including an exact multiple and an empty stream."""
+        assert list(chunk_stream(iter(range(7)), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+        assert list(chunk_stream(iter(range(6)), 3)) == [[0, 1, 2], [3, 4, 5]]
+        assert list(chunk_stream(iter([]), 3)) == []
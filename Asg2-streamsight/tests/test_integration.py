@@ -81,3 +81,88 @@ class TestPipelineIntegration:
         assert results.anomaly is None
         assert results.rfm is None
 
+
+    def test_pipeline_cache(
+        self, temp_csv_file: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that an unchanged rerun is served from the cache."""
+        config = Config(
+            input_file=temp_csv_file,
+            output_dir=tmp_path / "results",
+            rfm_whale_percentile=50,
+            enable_cache=True,
+        )
+        first = run_pipeline(config)
+        assert list(config.cache_dir.glob("results-*.pickle"))
+
+        def fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError("input was re-streamed")
+
+        monkeypatch.setattr("streamsight.pipeline.runner.stream_validated", fail)
+        assert run_pipeline(config) == first
+
+        # Changing a result-affecting setting invalidates the entry
+        with pytest.raises(AssertionError, match="re-streamed"):
+            run_pipeline(config.model_copy(update={"top_k_products": 3}))
+
+        # So does changing the code
+        monkeypatch.setattr("streamsight.pipeline.cache._source_digest", lambda: "changed")
+        with pytest.raises(AssertionError, match="re-streamed"):
+            run_pipeline(config)
+
+    def test_pipeline_cache_unreadable_entry(self, temp_csv_file: Path, tmp_path: Path) -> None:
+        """Test that an entry pickled from classes that no longer exist is a miss."""
+        config = Config(
+            input_file=temp_csv_file, output_dir=tmp_path / "results", enable_cache=True
+        )
+        first = run_pipeline(config)
+
+        (cache_path,) = config.cache_dir.glob("results-*.pickle")
+        cache_path.write_bytes(b"cstreamsight.removed_module\nPipelineResults\n.")
+
+        assert run_pipeline(config) == first
+
+    def test_pipeline_cache_restores_dlq(self, invalid_csv_file: Path, tmp_path: Path) -> None:
+        """Test that a cache hit rewrites the DLQ file of the run it replays."""
+        config = Config(
+            input_file=invalid_csv_file, output_dir=tmp_path / "results", enable_cache=True
+        )
+        first = run_pipeline(config)
+        dlq_path = config.errors_dir / "bad_rows.jsonl"
+        dlq_rows = dlq_path.read_bytes()
+        assert first.dlq_count == 2
+        assert dlq_rows
+
+        # e.g. an uncached run on another file overwrote it in between
+        dlq_path.write_bytes(b"")
+        assert run_pipeline(config) == first
+        assert dlq_path.read_bytes() == dlq_rows
+
+    def test_pipeline_chunking(self, tmp_path: Path) -> None:
+        """Test that results do not depend on how the input is chunked."""
+        csv_path = tmp_path / "many_rows.csv"
+        with open(csv_path, "w") as f:
+            f.write("InvoiceNo,StockCode,Description,Quantity,InvoiceDate,UnitPrice,CustomerID,Country\n")
+            for i in range(450):
+                price = "BAD" if i % 97 == 0 else f"{(i % 13) + 0.5:.2f}"
+                quantity = 500 if i % 150 == 7 else (i % 7) - 1
+                f.write(
+                    f"{10000 + i},SKU{i % 17},Product {i % 17},{quantity},"
+                    f"2023-01-{(i % 28) + 1:02d} 10:00:00,{price},CUST{i % 11},C{i % 5}\n"
+                )
+
+        def run(chunk_size: int) -> object:
+            return run_pipeline(
+                Config(
+                    input_file=csv_path,
+                    output_dir=tmp_path / f"results-{chunk_size}",
+                    chunk_size=chunk_size,
+                    enable_cache=False,
+                    rfm_whale_percentile=50,
+                )
+            )
+
+        chunked = run(100)
+        assert chunked.anomaly is not None and chunked.anomaly.anomaly_count > 0
+        assert chunked.dlq_count == 5
+        assert chunked == run(10_000)
@@ -4,10 +4,20 @@ from datetime import datetime
 from decimal import Decimal
 from pathlib import Path
 
+import numpy as np
 import pytest
+from pydantic import ValidationError
 
-from streamsight.io.csv_stream import stream_transactions, write_dlq
-from streamsight.io.schema import Transaction
+from streamsight.io import csv_stream
+from streamsight.io.csv_stream import (
+    dlq_sink,
+    fetch_transactions,
+    stream_columns,
+    stream_transactions,
+    stream_validated,
+    write_dlq,
+)
+from streamsight.io.schema import Transaction, TransactionRow
 
 
 class TestTransactionSchema:
@@ -70,6 +80,92 @@ class TestTransactionSchema:
         )
         assert tx.CustomerID is None
 
+    def test_grouping_keys_interned(self, sample_transaction: Transaction) -> None:
+        """Test that grouping keys share one string object across rows."""
+        raw = sample_transaction.model_dump()
+        raw["StockCode"] = "".join(["ABC", "123 "])  # built at runtime, not a literal
+        raw["Country"] = "".join(["United ", "Kingdom"])
+        raw["CustomerID"] = " " + sample_transaction.CustomerID
+        tx = Transaction(**raw)
+
+        assert tx.StockCode == "ABC123"
+        assert tx.StockCode is sample_transaction.StockCode
+        assert tx.Country is sample_transaction.Country
+        assert tx.CustomerID is sample_transaction.CustomerID
+
+    def test_invoice_date_precedence(self, sample_transaction: Transaction) -> None:
+        """Test that month-first still wins for ambiguous dates after a day-first one."""
+        raw = sample_transaction.model_dump()
+        parsed = [
+            Transaction(**{**raw, "InvoiceDate": text}).InvoiceDate
+            for text in ("13/1/2011 8:26", "1/2/2011 8:26", "13/1/2011 8:26")
+        ]
+
+        assert parsed == [
+            datetime(2011, 1, 13, 8, 26),
+            datetime(2011, 1, 2, 8, 26),
+            datetime(2011, 1, 13, 8, 26),
+        ]
+        with pytest.raises(Exception, match="Cannot parse date"):
+            Transaction(**{**raw, "InvoiceDate": "13/13/2011"})
+
+    @pytest.mark.parametrize(
+        ("text", "fmt"),
+        [
+            ("2010-12-01 08:26:05", "%Y-%m-%d %H:%M:%S"),
+            ("2010-12-01", "%Y-%m-%d"),
+            ("12/1/2010 8:26", "%m/%d/%Y %H:%M"),
+            ("02/29/2012 23:59", "%m/%d/%Y %H:%M"),
+            ("29/02/2012 23:59", "%d/%m/%Y %H:%M"),
+            ("12/1/2010  8:26", "%m/%d/%Y %H:%M"),
+            ("12/1/2010", "%m/%d/%Y"),
+            ("2010-1-1 8:26:5", "%Y-%m-%d %H:%M:%S"),
+        ],
+    )
+    def test_invoice_date_shapes(
+        self, sample_transaction: Transaction, text: str, fmt: str
+    ) -> None:
+        """Test that fast-path and strptime-only date shapes parse like strptime."""
+        tx = Transaction(**{**sample_transaction.model_dump(), "InvoiceDate": text})
+        assert tx.InvoiceDate == datetime.strptime(text, fmt)
+
+
+    def test_from_validated(self, sample_transaction: Transaction) -> None:
+        """Test that from_validated builds the same model as model_construct."""
+        values = sample_transaction.model_dump()
+        tx = Transaction.from_validated(dict(values))
+        expected = Transaction.model_construct(**values)
+
+        assert tx == expected == sample_transaction
+        assert tx.model_fields_set == expected.model_fields_set
+        assert tx.model_dump() == values
+
+        # A missing field fails here, not later as an AttributeError
+        del values["Country"]
+        with pytest.raises(AssertionError, match="expected fields"):
+            Transaction.from_validated(values)
+
+    def test_from_validated_fallback(
+        self, sample_transaction: Transaction, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that from_validated uses model_construct if BaseModel's slots change."""
+        monkeypatch.setattr("streamsight.io.schema._FAST_CONSTRUCT", False)
+        values = sample_transaction.model_dump()
+        tx = Transaction.from_validated(dict(values))
+
+        assert tx == sample_transaction
+        assert tx.model_fields_set == set(values)
+
+    def test_transaction_row(self, return_transaction: Transaction) -> None:
+        """Test that TransactionRow mirrors Transaction's fields and properties."""
+        row = TransactionRow(**return_transaction.model_dump())
+
+        assert TransactionRow._fields == tuple(Transaction.model_fields)
+        assert row.is_return == return_transaction.is_return
+        assert row.total_cents == return_transaction.total_cents
+        assert row.total_amount == return_transaction.total_amount
+        assert row.to_transaction() == return_transaction
+
 
 class TestCSVStreaming:
     """Tests for CSV streaming functionality."""
@@ -111,6 +207,267 @@ class TestCSVStreaming:
             lines = f.readlines()
             assert len(lines) == 2
 
+    def test_dlq_sink(self, invalid_csv_file: Path, tmp_path: Path) -> None:
+        """Test that entries sent to the sink are written as write_dlq writes them."""
+        errors = [r.unwrap_err() for r in stream_transactions(invalid_csv_file) if r.is_err()]
+        write_dlq(iter(errors), tmp_path / "expected.jsonl")
+
+        sink = dlq_sink(tmp_path / "dlq.jsonl")
+        assert next(sink) == 0
+        assert [sink.send(error) for error in errors] == [1, 2]
+        sink.close()
+
+        assert (tmp_path / "dlq.jsonl").read_bytes() == (tmp_path / "expected.jsonl").read_bytes()
+
+    def test_stream_parquet(self, temp_csv_file: Path, tmp_path: Path) -> None:
+        """Test streaming a Parquet copy yields the same transactions as the CSV."""
+        pa = pytest.importorskip("pyarrow")
+        import csv
+
+        import pyarrow.parquet as pq
+
+        with open(temp_csv_file, "r", encoding="utf-8") as f:
+            table = pa.Table.from_pylist(list(csv.DictReader(f)))
+        parquet_path = tmp_path / "test_data.parquet"
+        pq.write_table(table, parquet_path)
+
+        from_csv = [r.unwrap() for r in stream_transactions(temp_csv_file)]
+        from_parquet = [r.unwrap() for r in stream_transactions(parquet_path)]
+
+        assert from_parquet == from_csv
+
+    @pytest.mark.parametrize("fixture", ["temp_csv_file", "invalid_csv_file", "ragged_csv_file"])
+    def test_stream_pyarrow_engine(self, fixture: str, request: pytest.FixtureRequest) -> None:
+        """Test that the pyarrow CSV engine yields the same results as the stdlib one."""
+        pytest.importorskip("pyarrow")
+        path = request.getfixturevalue(fixture)
+
+        def summarize(engine: str) -> list[object]:
+            return [
+                r.unwrap() if r.is_ok() else r.unwrap_err()[:2]
+                for r in stream_transactions(path, engine=engine)
+            ]
+
+        assert summarize("pyarrow") == summarize("csv")
+
+    def test_stream_pyarrow_engine_ragged_row_after_first_block(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a malformed row in a later Arrow block keeps DLQ row numbers."""
+        pytest.importorskip("pyarrow")
+        monkeypatch.setattr(csv_stream, "ARROW_BLOCK_SIZE", 256)
+        path = tmp_path / "ragged.csv"
+        valid = "1,A1,Mug,2,2023-01-15 10:00:00,2.50,17850,UK\n"
+        path.write_text(
+            "InvoiceNo,StockCode,Description,Quantity,InvoiceDate,UnitPrice,CustomerID,Country\n"
+            + valid * 20
+            + "2,A1,Mug,2\n"
+            + valid * 5,
+            encoding="utf-8",
+        )
+
+        def summarize(engine: str) -> list[object]:
+            return [
+                r.unwrap() if r.is_ok() else r.unwrap_err()[:2]
+                for r in stream_transactions(path, engine=engine)
+            ]
+
+        results = summarize("pyarrow")
+        assert results == summarize("csv")
+        assert len(results) == 26
+        assert results[20][0] == 22
+        rows = [row for block in stream_columns(path) for row in block.row_nums]
+        assert rows == [n for n in range(2, 28) if n != 22]
+
+    def test_stream_pyarrow_engine_edge_values(self, tmp_path: Path) -> None:
+        """Test that column-wise validation matches model_validate on awkward values."""
+        pytest.importorskip("pyarrow")
+        path = tmp_path / "edge.csv"
+        path.write_text(
+            "InvoiceNo,StockCode,Description,Quantity,InvoiceDate,UnitPrice,CustomerID,"
+            "Country,Extra\n"
+            "1, A1 ,  Mug ,2,12/1/2010 8:26,2.5, 17850 ,UK,x\n"
+            "1,A1,Mug, 2 ,12/1/2010 8:26,2.50,,UK,y\n"
+            "C2,A1,Mug,-1,13/1/2010 8:26,-0,17850,UK,z\n"
+            "3,A1,   ,2,12/1/2010 8:26,2.5,17850,UK,x\n"
+            "4,B2,Tasse,3,2010-12-01 08:26:00,1e1,17850,Deutschland ,x\n"
+            "5,B2,Café,1.0,2010-12-01,abc,17850,UK,x\n"
+            "6,B2,Café,1,not a date,1,17850,UK,x\n",
+            encoding="utf-8",
+        )
+
+        def summarize(engine: str) -> list[object]:
+            summary: list[object] = []
+            for r in stream_transactions(path, engine=engine):
+                if r.is_ok():
+                    summary.append(r.unwrap())
+                else:
+                    row_num, row, error = r.unwrap_err()
+                    summary.append((row_num, row, error.errors(include_context=False)))
+            return summary
+
+        results = summarize("pyarrow")
+        assert results == summarize("csv")
+        assert [isinstance(r, Transaction) for r in results] == [
+            True, True, True, False, True, False, False
+        ]
+
+    def test_read_csv_rows_matches_dictreader(self, tmp_path: Path) -> None:
+        """Test that rows built from csv.reader match csv.DictReader's dicts."""
+        import csv
+
+        path = tmp_path / "ragged.csv"
+        path.write_text(
+            'A,B,C\n1,2,3\n\n4,5\n6,7,8,9,10\n"x\ny",z,\n',
+            encoding="utf-8",
+        )
+
+        with open(path, "r", encoding="utf-8") as f:
+            expected = list(csv.DictReader(f))
+        assert list(csv_stream._read_csv_rows(path)) == expected
+        assert [row for _, row in csv_stream._scan_csv_rows(path, {2, 3, 4, 5})] == expected
+
+    @pytest.mark.parametrize(("engine", "workers"), [("csv", 1), ("csv", 2), ("pyarrow", 1)])
+    def test_stream_validated_tuples(
+        self, invalid_csv_file: Path, engine: str, workers: int
+    ) -> None:
+        """Test that tagged tuples carry exactly what the Ok/Err results do."""
+        if engine == "pyarrow":
+            pytest.importorskip("pyarrow")
+        tagged = list(stream_validated(invalid_csv_file, engine=engine, workers=workers))
+        results = list(stream_transactions(invalid_csv_file, engine=engine, workers=workers))
+
+        assert [ok for ok, _ in tagged] == [r.is_ok() for r in results] == [True, False, False]
+        assert tagged[0][1] == results[0].unwrap()
+        assert [value[:2] for _, value in tagged[1:]] == [r.unwrap_err()[:2] for r in results[1:]]
+
+    @pytest.mark.parametrize("engine", ["csv", "pyarrow"])
+    def test_stream_validated_as_rows(self, invalid_csv_file: Path, engine: str) -> None:
+        """Test that as_rows only changes the container of valid rows."""
+        if engine == "pyarrow":
+            pytest.importorskip("pyarrow")
+        tagged = list(stream_validated(invalid_csv_file, engine=engine, as_rows=True))
+        (expected,) = [r.unwrap() for r in stream_transactions(invalid_csv_file) if r.is_ok()]
+
+        assert [ok for ok, _ in tagged] == [True, False, False]
+        value = tagged[0][1]
+        assert isinstance(value, TransactionRow if engine == "pyarrow" else Transaction)
+        if isinstance(value, TransactionRow):
+            value = value.to_transaction()
+        assert value == expected
+
+    @pytest.mark.parametrize("fixture", ["temp_csv_file", "invalid_csv_file"])
+    @pytest.mark.parametrize("fallback", [False, True])
+    def test_stream_columns(
+        self,
+        fixture: str,
+        fallback: bool,
+        request: pytest.FixtureRequest,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that column blocks hold the same rows and errors as stream_validated."""
+        pytest.importorskip("pyarrow")
+        path = request.getfixturevalue(fixture)
+        if fallback:
+            # Every field check fails but whole rows validate: blocks are rebuilt row by row
+            monkeypatch.setattr(
+                csv_stream,
+                "_validate_distinct",
+                lambda field, raw: (np.empty(len(raw), dtype=object), np.zeros(len(raw), bool)),
+            )
+
+        row_nums, rows, errors = [], [], []
+        for block in stream_columns(path):
+            row_nums.extend(block.row_nums.tolist())
+            rows.extend(zip(*(block.column(f).tolist() for f in csv_stream.TRANSACTION_FIELDS)))
+            errors.extend(error[:2] for error in block.errors)
+
+        tagged = list(enumerate(stream_validated(path), start=csv_stream.FIRST_ROW_NUM))
+        assert row_nums == [row_num for row_num, (ok, _) in tagged if ok]
+        assert [TransactionRow._make(row).to_transaction() for row in rows] == [
+            value for _, (ok, value) in tagged if ok
+        ]
+        assert errors == [value[:2] for _, (ok, value) in tagged if not ok]
+
+    def test_field_validators_fallback(
+        self, invalid_csv_file: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that per-field validators still work if the core schema layout changes."""
+        pytest.importorskip("pyarrow")
+        compiled = csv_stream._field_validators()
+        monkeypatch.setattr(Transaction, "__pydantic_core_schema__", {"type": "model"})
+        public = csv_stream._field_validators()
+        assert public.keys() == compiled.keys()
+
+        samples = {
+            "Quantity": ["6", " -2 ", "x", ""],
+            "UnitPrice": ["2.50", "BAD", ""],
+            "InvoiceDate": ["12/1/2010 8:26", "2023-13-45"],
+            "CustomerID": ["17850.0", ""],
+            "Country": [" UK ", ""],
+        }
+        for field, raws in samples.items():
+            for raw in raws:
+                outcomes = []
+                for validate in (compiled[field], public[field]):
+                    try:
+                        outcomes.append(validate(raw))
+                    except ValidationError:
+                        outcomes.append("invalid")
+                assert outcomes[0] == outcomes[1], (field, raw)
+
+        def blocks() -> list[object]:
+            fields = csv_stream.TRANSACTION_FIELDS
+            return [
+                (block.row_nums.tolist(), [block.column(f).tolist() for f in fields])
+                for block in stream_columns(invalid_csv_file)
+            ]
+
+        expected = blocks()
+        monkeypatch.setattr(csv_stream, "_FIELD_VALIDATORS", public)
+        assert blocks() == expected
+
+    def test_stream_unknown_engine(self, temp_csv_file: Path) -> None:
+        """Test that an unknown CSV engine is rejected."""
+        with pytest.raises(ValueError, match="Unknown CSV engine"):
+            list(stream_transactions(temp_csv_file, engine="pandas"))
+
+    @pytest.mark.parametrize("fixture", ["temp_csv_file", "invalid_csv_file"])
+    def test_stream_parallel_validation(
+        self, fixture: str, request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that validating in worker processes keeps results and their order."""
+        path = request.getfixturevalue(fixture)
+        # One row per task, so results from several chunks must be reordered
+        monkeypatch.setattr(csv_stream, "VALIDATION_CHUNK_SIZE", 1)
+
+        def summarize(workers: int) -> list[object]:
+            return [
+                r.unwrap() if r.is_ok() else r.unwrap_err()[:2]
+                for r in stream_transactions(path, workers=workers)
+            ]
+
+        assert summarize(2) == summarize(1)
+
+        with pytest.raises(ValueError, match="workers"):
+            list(stream_transactions(path, workers=0))
+
+    @pytest.mark.parametrize("engine", ["csv", "pyarrow"])
+    def test_fetch_transactions(self, invalid_csv_file: Path, engine: str) -> None:
+        """Test re-reading valid rows by the row numbers stream_transactions reports."""
+        if engine == "pyarrow":
+            pytest.importorskip("pyarrow")
+        (valid,) = [r.unwrap() for r in stream_transactions(invalid_csv_file) if r.is_ok()]
+
+        assert fetch_transactions(invalid_csv_file, [], engine=engine) == {}
+        assert fetch_transactions(invalid_csv_file, [2], engine=engine) == {2: valid}
+
+        # Row 3 is invalid and row 9 does not exist
+        with pytest.raises(ValueError):
+            fetch_transactions(invalid_csv_file, [3], engine=engine)
+        with pytest.raises(ValueError, match="Rows not found"):
+            fetch_transactions(invalid_csv_file, [2, 9], engine=engine)
+
     def test_stream_nonexistent_file(self) -> None:
         """Test streaming nonexistent file raises error."""
         with pytest.raises(FileNotFoundError):
@@ -3,12 +3,23 @@
 from datetime import datetime
 from typing import Iterator
 
+import numpy as np
 import pytest
 
+from streamsight.analytics.columnar import KeyIndex, TransactionBatch
 from streamsight.core.types import Ok
 from streamsight.io.schema import Transaction
-from streamsight.rfm.calculator import build_customer_profiles, calculate_max_date
-from streamsight.rfm.segmentation import segment_customers
+from streamsight.rfm.calculator import (
+    ProfileBuilder,
+    build_customer_profiles,
+    calculate_max_date,
+)
+from streamsight.rfm.segmentation import (
+    calculate_quintiles,
+    score_value,
+    score_values,
+    segment_customers,
+)
 
 
 class TestRFMCalculator:
@@ -16,8 +27,7 @@ class TestRFMCalculator:
 
     def test_build_profiles(self, sample_stream: Iterator[Ok[Transaction]]) -> None:
         """Test building customer profiles."""
-        transactions = list(sample_stream)
-        profiles = build_customer_profiles(iter(transactions))
+        profiles = build_customer_profiles(sample_stream)
 
         assert len(profiles) == 2  # CUST001 and CUST002
         assert "CUST001" in profiles
@@ -25,8 +35,7 @@ class TestRFMCalculator:
 
     def test_profile_aggregation(self, sample_stream: Iterator[Ok[Transaction]]) -> None:
         """Test that profiles correctly aggregate transactions."""
-        transactions = list(sample_stream)
-        profiles = build_customer_profiles(iter(transactions))
+        profiles = build_customer_profiles(sample_stream)
 
         cust001 = profiles["CUST001"]
         assert cust001.transaction_count == 2  # Two transactions
@@ -36,10 +45,28 @@ class TestRFMCalculator:
         assert cust002.transaction_count == 2  # Two transactions
         assert cust002.total_spend == (2 * 10 - 1 * 10)  # 20 - 10 = 10
 
+    @pytest.mark.parametrize("batch_size", [1, 2, 1000])
+    def test_update_batch_matches_update(
+        self, sample_transactions: list[Transaction], batch_size: int
+    ) -> None:
+        """Test that folding columnar batches builds the same profiles, in the same order."""
+        customer_index = KeyIndex()
+        builder = ProfileBuilder()
+        for start in range(0, len(sample_transactions), batch_size):
+            chunk = sample_transactions[start:start + batch_size]
+            builder.update_batch(
+                TransactionBatch.from_transactions(chunk, customer_index=customer_index)
+            )
+
+        profiles = builder.finalize()
+        expected = build_customer_profiles(Ok(tx) for tx in sample_transactions)
+        assert profiles == expected
+        assert list(profiles) == list(expected)
+        assert builder.max_date == calculate_max_date(expected)
+
     def test_calculate_max_date(self, sample_stream: Iterator[Ok[Transaction]]) -> None:
         """Test calculating max date from profiles."""
-        transactions = list(sample_stream)
-        profiles = build_customer_profiles(iter(transactions))
+        profiles = build_customer_profiles(sample_stream)
         max_date = calculate_max_date(profiles)
 
         # Latest transaction is 2023-01-18
@@ -56,8 +83,7 @@ class TestRFMSegmentation:
 
     def test_segment_customers(self, sample_stream: Iterator[Ok[Transaction]]) -> None:
         """Test customer segmentation."""
-        transactions = list(sample_stream)
-        profiles = build_customer_profiles(iter(transactions))
+        profiles = build_customer_profiles(sample_stream)
         result = segment_customers(profiles, whale_percentile=50)
 
         assert result.total_customers == 2
@@ -65,8 +91,7 @@ class TestRFMSegmentation:
 
     def test_whale_identification(self, sample_stream: Iterator[Ok[Transaction]]) -> None:
         """Test whale customer identification."""
-        transactions = list(sample_stream)
-        profiles = build_customer_profiles(iter(transactions))
+        profiles = build_customer_profiles(sample_stream)
 
         # With 50th percentile, top 50% are whales (1 customer)
         result = segment_customers(profiles, whale_percentile=50)
@@ -77,8 +102,7 @@ class TestRFMSegmentation:
 
     def test_rfm_scores(self, sample_stream: Iterator[Ok[Transaction]]) -> None:
         """Test that RFM scores are calculated."""
-        transactions = list(sample_stream)
-        profiles = build_customer_profiles(iter(transactions))
+        profiles = build_customer_profiles(sample_stream)
         result = segment_customers(profiles)
 
         for score in result.rfm_scores:
@@ -87,6 +111,16 @@ class TestRFMSegmentation:
             assert 1 <= score.monetary_score <= 5
             assert len(score.rfm_score) == 3  # e.g., "555"
 
+    @pytest.mark.parametrize("reverse", [False, True])
+    def test_score_values_matches_score_value(self, reverse: bool) -> None:
+        """Test that vectorized scoring agrees with score_value, including ties."""
+        values = np.array([0, 1, 1, 1, 2, 3, 3, 5, 8, 8, 8, 8, 13, 21], dtype=np.float64)
+        quintiles = calculate_quintiles(values)
+        probes = np.concatenate([values, np.array(quintiles), [-1.0, 0.5, 100.0]])
+
+        expected = [score_value(v, quintiles, reverse=reverse) for v in probes.tolist()]
+        assert score_values(probes, quintiles, reverse=reverse).tolist() == expected
+
     def test_empty_segmentation(self) -> None:
         """Test segmentation with no customers."""
         result = segment_customers({})